@@ -0,0 +1,97 @@
+"""
+Per-call latency of a fresh httpx.AsyncClient versus the shared pooled client.
+
+Runs a local stub of the Alpha Vantage query endpoint and times `fetch_quote`
+against it, so the numbers isolate client setup and connection handshakes from
+upstream latency.
+
+    python benchmarks/bench_connection_pool.py --calls 500
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+
+import httpx
+import uvicorn
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("ALPHAVANTAGE_API_KEY", "benchmark")
+os.environ.setdefault("ALPHAVANTAGE_PLAN", "unlimited")
+
+from alphavantage_mcp_server import api
+
+QUOTE = json.dumps(
+    {
+        "Global Quote": {
+            "01. symbol": "IBM",
+            "05. price": "187.1500",
+            "06. volume": "3283567",
+        }
+    }
+).encode()
+
+
+async def stub_app(scope, receive, send):
+    if scope["type"] != "http":
+        return
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [[b"content-type", b"application/json"]],
+        }
+    )
+    await send({"type": "http.response.body", "body": QUOTE})
+
+
+async def fetch_with_fresh_client(url: str) -> dict:
+    """The pre-pooling behaviour: one client, and one connection, per call."""
+    async with httpx.AsyncClient() as client:
+        response = await client.get(url, params={"function": "GLOBAL_QUOTE"})
+        response.raise_for_status()
+        return response.json()
+
+
+async def time_calls(label: str, fn, calls: int) -> None:
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    print(
+        f"{label:<14} mean {statistics.mean(samples):7.3f} ms  "
+        f"p50 {samples[len(samples) // 2]:7.3f} ms  "
+        f"p99 {samples[int(len(samples) * 0.99) - 1]:7.3f} ms"
+    )
+
+
+async def main(calls: int, port: int) -> None:
+    config = uvicorn.Config(stub_app, host="127.0.0.1", port=port, log_level="error")
+    stub = uvicorn.Server(config)
+    stub_task = asyncio.create_task(stub.serve())
+    while not stub.started:
+        await asyncio.sleep(0.01)
+
+    url = f"http://127.0.0.1:{port}/query"
+    api.API_BASE_URL = url
+    try:
+        await time_calls("fresh client", lambda: fetch_with_fresh_client(url), calls)
+        async with api.client_session():
+            await time_calls("pooled client", lambda: api.fetch_quote("IBM"), calls)
+    finally:
+        stub.should_exit = True
+        await stub_task
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=300)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.port))
@@ -0,0 +1,69 @@
+"""
+Throughput of the local indicator engine: bars per second for each locally
+computed indicator on one core, from arrays already in memory, so neither the
+network nor parsing is measured. The target is at least 1M bars per second
+per indicator.
+
+    python benchmarks/bench_indicators.py --bars 1000000 --repeat 5
+    python benchmarks/bench_indicators.py RSI STOCH ULTOSC
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from alphavantage_mcp_server.indicators import INDICATORS, Bars
+
+TARGET = 1_000_000
+# Values for the parameters an indicator requires.
+REQUIRED = {"time_period": 14, "series_type": "close"}
+
+
+def random_bars(count: int) -> Bars:
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, count)))
+    open_ = close * (1 + rng.normal(0, 0.001, count))
+    high = np.maximum(open_, close) * (1 + np.abs(rng.normal(0, 0.001, count)))
+    low = np.minimum(open_, close) * (1 - np.abs(rng.normal(0, 0.001, count)))
+    volume = rng.integers(1_000_000, 9_000_000, count).astype(float)
+    index = np.datetime64("2000-01-03T09:30") + np.arange(count).astype("timedelta64[m]")
+    return Bars(index.astype("datetime64[s]"), open_, high, low, close, volume, True)
+
+
+def bars_per_second(function: str, bars: Bars, repeat: int) -> float:
+    indicator = INDICATORS[function]
+    params = {name: REQUIRED[name] for name, default in indicator.params.items() if default is None}
+    timings = []
+    for _ in range(repeat):
+        # Fresh bars each run, so no intermediate is served from the memo.
+        fresh = Bars(
+            bars.index, bars.open, bars.high, bars.low, bars.close, bars.volume, bars.intraday
+        )
+        start = time.perf_counter()
+        indicator.evaluate(fresh, params)
+        timings.append(time.perf_counter() - start)
+    return len(bars) / min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("functions", nargs="*", help="Indicators to run (default: all)")
+    parser.add_argument("--bars", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bars = random_bars(args.bars)
+    print(f"{args.bars:,} bars, best of {args.repeat}")
+    for function in args.functions or sorted(INDICATORS):
+        rate = bars_per_second(function, bars, args.repeat)
+        flag = "" if rate >= TARGET else "  below target"
+        print(f"  {function:<10} {rate / 1e6:8.1f}M bars/s{flag}")
+
+
+if __name__ == "__main__":
+    main()
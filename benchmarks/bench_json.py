@@ -0,0 +1,122 @@
+"""
+Decode and encode cost of large responses: the standard library with
+pretty-printed output (the old tool result path) versus each available codec
+with compact output.
+
+Pass recorded responses with --file; without one, payloads shaped like a full
+TIME_SERIES_DAILY_ADJUSTED history and a large REALTIME_OPTIONS chain are
+generated.
+
+    python benchmarks/bench_json.py --repeat 20
+    python benchmarks/bench_json.py --file ibm_daily_full.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from alphavantage_mcp_server.serialization import BACKENDS
+
+
+def daily_adjusted_history(bars: int = 6500) -> dict:
+    rng = random.Random(0)
+    day = date(2025, 1, 2)
+    series = {}
+    price = 100.0
+    for _ in range(bars):
+        price *= 1 + rng.gauss(0, 0.01)
+        series[day.isoformat()] = {
+            "1. open": f"{price:.4f}",
+            "2. high": f"{price * 1.01:.4f}",
+            "3. low": f"{price * 0.99:.4f}",
+            "4. close": f"{price:.4f}",
+            "5. adjusted close": f"{price:.4f}",
+            "6. volume": str(rng.randrange(1_000_000, 9_000_000)),
+            "7. dividend amount": "0.0000",
+            "8. split coefficient": "1.0",
+        }
+        day -= timedelta(days=1)
+    return {
+        "Meta Data": {"2. Symbol": "IBM", "4. Output Size": "Full size"},
+        "Time Series (Daily)": series,
+    }
+
+
+def options_chain(contracts: int = 5000) -> dict:
+    rng = random.Random(1)
+    return {
+        "endpoint": "Realtime Options",
+        "data": [
+            {
+                "contractID": f"IBM250620C{index:08d}",
+                "symbol": "IBM",
+                "expiration": "2025-06-20",
+                "strike": f"{100 + index % 200:.2f}",
+                "type": "call" if index % 2 else "put",
+                "last": f"{rng.uniform(0, 50):.2f}",
+                "bid": f"{rng.uniform(0, 50):.2f}",
+                "ask": f"{rng.uniform(0, 50):.2f}",
+                "volume": str(rng.randrange(0, 5000)),
+                "open_interest": str(rng.randrange(0, 50000)),
+                "implied_volatility": f"{rng.uniform(0.1, 1):.5f}",
+                "delta": f"{rng.uniform(-1, 1):.5f}",
+            }
+            for index in range(contracts)
+        ],
+    }
+
+
+def best_of(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings) * 1000
+
+
+def bench(label: str, raw: bytes, repeat: int) -> None:
+    value = json.loads(raw)
+    pretty = json.dumps(value, indent=2)
+    print(f"\n{label}: {len(raw) / 1e6:.1f} MB response")
+    print(
+        f"  {'baseline':<10} decode {best_of(lambda: json.loads(raw), repeat):7.1f} ms"
+        f"  encode {best_of(lambda: json.dumps(value, indent=2), repeat):7.1f} ms"
+        f"  output {len(pretty.encode()) / 1e6:5.1f} MB (stdlib, indent=2)"
+    )
+    for name, factory in BACKENDS.items():
+        codec = factory()
+        output = codec.dumps(value)
+        print(
+            f"  {name:<10} decode {best_of(lambda codec=codec: codec.loads(raw), repeat):7.1f} ms"
+            f"  encode {best_of(lambda codec=codec: codec.dumps(value), repeat):7.1f} ms"
+            f"  output {len(output.encode()) / 1e6:5.1f} MB (compact)"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--file", action="append", help="A recorded JSON response")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    if args.file:
+        payloads = {path: Path(path).read_bytes() for path in args.file}
+    else:
+        payloads = {
+            "TIME_SERIES_DAILY_ADJUSTED full": json.dumps(daily_adjusted_history()).encode(),
+            "REALTIME_OPTIONS chain": json.dumps(options_chain()).encode(),
+        }
+    for label, raw in payloads.items():
+        bench(label, raw, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,34 @@
+import asyncio
 import os
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
 
 import httpx
 from dotenv import load_dotenv
 
+from alphavantage_mcp_server import serialization
+from alphavantage_mcp_server.cache import ResponseCache, ttl_for
+from alphavantage_mcp_server.coalesce import SingleFlight
+from alphavantage_mcp_server.columnar import OHLCVSeries, to_columnar
+from alphavantage_mcp_server.csvstream import DEFAULT_BATCH_SIZE, CSVBatch, iter_batches
+from alphavantage_mcp_server.indicators import LocalIndicators
+from alphavantage_mcp_server.ratelimit import RateLimiter
+from alphavantage_mcp_server.search import LocalSearch
+from alphavantage_mcp_server.throttle import (
+    UPSTREAM_ERRORS,
+    AlphaVantageError,
+    RetryPolicy,
+)
+from alphavantage_mcp_server.timeseries import (
+    MonthPartitions,
+    TimeSeriesStore,
+    month_range,
+)
+from alphavantage_mcp_server.universe import SymbolUniverse, UniverseCache
+
 load_dotenv()
 
 API_KEY = os.getenv("ALPHAVANTAGE_API_KEY")
@@ -11,6 +37,406 @@ if not API_KEY:
 
 API_BASE_URL = "https://www.alphavantage.co/query"
 
+MAX_CONNECTIONS = int(os.getenv("ALPHAVANTAGE_MAX_CONNECTIONS", "20"))
+MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("ALPHAVANTAGE_MAX_KEEPALIVE_CONNECTIONS", "10"))
+KEEPALIVE_EXPIRY = float(os.getenv("ALPHAVANTAGE_KEEPALIVE_EXPIRY", "30"))
+TIMEOUT = float(os.getenv("ALPHAVANTAGE_TIMEOUT", "30"))
+CONNECT_TIMEOUT = float(os.getenv("ALPHAVANTAGE_CONNECT_TIMEOUT", "10"))
+
+DEFAULT_BACKFILL_CONCURRENCY = 4
+BULK_QUOTES_CHUNK_SIZE = 100
+
+
+#####
+# HTTP client
+#####
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+# Replaced clients being closed in the background.
+_closing: set[asyncio.Task] = set()
+
+
+def _new_client(**kwargs) -> httpx.AsyncClient:
+    """
+    Build an HTTP client using the configured connection pool settings.
+
+    :argument: kwargs: Extra keyword arguments forwarded to httpx.AsyncClient.
+
+    :returns: A new httpx.AsyncClient.
+    """
+    settings = {
+        "limits": httpx.Limits(
+            max_connections=MAX_CONNECTIONS,
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+        "timeout": httpx.Timeout(TIMEOUT, connect=CONNECT_TIMEOUT),
+    }
+    settings.update(kwargs)
+    return httpx.AsyncClient(**settings)
+
+
+async def _close_quietly(client: httpx.AsyncClient) -> None:
+    # The connections of a client whose loop is gone can only be dropped.
+    with suppress(RuntimeError, OSError, httpx.HTTPError):
+        await client.aclose()
+
+
+def _discard_client(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None) -> None:
+    """
+    Close a replaced client without waiting for it: on its own loop while that
+    loop still runs, otherwise on the current one.
+    """
+    if client.is_closed:
+        return
+    if loop is not None and loop.is_running() and loop is not asyncio.get_running_loop():
+        asyncio.run_coroutine_threadsafe(_close_quietly(client), loop)
+        return
+    task = asyncio.ensure_future(_close_quietly(client))
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client used by every fetcher.
+
+    The client is normally opened by the server lifecycle (see `client_session`),
+    but is created lazily when the fetchers are used directly. A client bound to
+    a different event loop is replaced, since pooled connections cannot be
+    shared across loops; the old one is closed in the background, on its own
+    loop if that loop is still running, so its connections are released.
+
+    :returns: The shared httpx.AsyncClient.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        if _client is not None:
+            _discard_client(_client, _client_loop)
+        _client = _new_client()
+        _client_loop = loop
+    return _client
+
+
+async def close_client() -> None:
+    """
+    Close the shared HTTP client and release its pooled connections.
+    """
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+@asynccontextmanager
+async def client_session(**kwargs):
+    """
+    Open the shared HTTP client for the lifetime of a server.
+
+    :argument: kwargs: Extra keyword arguments forwarded to httpx.AsyncClient.
+
+    :returns: The shared httpx.AsyncClient.
+    """
+    global _client, _client_loop
+    await close_client()
+    _client = _new_client(**kwargs)
+    _client_loop = asyncio.get_running_loop()
+    try:
+        yield _client
+    finally:
+        await close_client()
+
+
+#####
+# Request core
+#####
+
+# Functions that only ever answer with CSV, whatever datatype is requested.
+CSV_ONLY_FUNCTIONS = frozenset({"LISTING_STATUS", "EARNINGS_CALENDAR", "IPO_CALENDAR"})
+
+
+def _param_value(value) -> str:
+    """Render a parameter value the same way httpx puts it on the query string."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+@dataclass(frozen=True)
+class Query:
+    """
+    A single Alpha Vantage request.
+
+    `params` holds the canonical parameter set: `None` values dropped, values
+    rendered as strings and sorted by name. The API key is not part of it, so
+    two equal queries always describe the same upstream request.
+    """
+
+    function: str
+    params: tuple[tuple[str, str], ...]
+    datatype: str | None = None
+
+    @classmethod
+    def build(
+        cls, function: str, params: dict | None = None, datatype: str | None = None
+    ) -> "Query":
+        merged = dict(params or {})
+        if datatype is not None:
+            merged["datatype"] = datatype
+        canonical = tuple(
+            sorted(
+                (name, _param_value(value))
+                for name, value in merged.items()
+                if value is not None
+            )
+        )
+        return cls(function, canonical, datatype)
+
+    @property
+    def is_csv(self) -> bool:
+        return self.datatype == "csv" or self.function in CSV_ONLY_FUNCTIONS
+
+    @property
+    def key(self) -> str:
+        """A stable string identifying this query, suitable as a cache key."""
+        return "&".join([f"function={self.function}"] + [f"{k}={v}" for k, v in self.params])
+
+    def to_params(self) -> dict[str, str]:
+        """The query string parameters to send, including the API key."""
+        return {"function": self.function, **dict(self.params), "apikey": API_KEY}
+
+
+Handler = Callable[[Query], Awaitable[Any]]
+Middleware = Callable[[Query, Handler], Awaitable[Any]]
+
+rate_limiter = RateLimiter.from_env()
+retry_policy = RetryPolicy.from_env(rate_limiter)
+single_flight = SingleFlight()
+response_cache = ResponseCache.from_env()
+time_series = TimeSeriesStore.from_env(response_cache.store)
+month_partitions = MonthPartitions.from_env(response_cache.store)
+
+
+def _response_ttl(query: Query) -> float:
+    # Completed months are kept by the partition store; caching them too would hold them twice.
+    return 0 if month_partitions.covers(query) else ttl_for(query)
+
+
+response_cache.ttl = _response_ttl
+
+
+def _stream_listings(state: str) -> AsyncIterator[CSVBatch]:
+    return stream_csv("LISTING_STATUS", {"state": state})
+
+
+symbol_universe = UniverseCache.from_env(_stream_listings, response_cache.store)
+local_search = LocalSearch.from_env()
+
+# Middleware wrapping every request, outermost first. Each one is called as
+# `await middleware(query, call_next)` and must return the decoded response,
+# usually by awaiting `call_next(query)`.
+MIDDLEWARE: list[Middleware] = [
+    month_partitions.middleware,
+    response_cache.middleware,
+    single_flight.middleware,
+    time_series.middleware,
+    retry_policy.middleware,
+    rate_limiter.middleware,
+]
+
+
+def add_middleware(middleware: Middleware, index: int | None = None) -> None:
+    """
+    Register a middleware in the request chain.
+
+    :argument: middleware (Middleware): The middleware to register.
+    :argument: index (int): The position in the chain, 0 being outermost (default: innermost).
+    """
+    if index is None:
+        MIDDLEWARE.append(middleware)
+    else:
+        MIDDLEWARE.insert(index, middleware)
+
+
+def remove_middleware(middleware: Middleware) -> None:
+    """
+    Remove a middleware from the request chain.
+
+    :argument: middleware (Middleware): The middleware to remove.
+    """
+    MIDDLEWARE.remove(middleware)
+
+
+def get_diagnostics() -> dict:
+    """
+    Report the state of the request core.
+
+    :returns: The current rate limiter budget, retry, coalescing, cache, series, partition, universe, search and indicator counters.
+    """
+    return {
+        "rate_limit": rate_limiter.status(),
+        "retry": retry_policy.status(),
+        "coalescing": single_flight.status(),
+        "cache": response_cache.status(),
+        "series": time_series.status(),
+        "partitions": month_partitions.status(),
+        "universe": symbol_universe.status(),
+        "search": local_search.status(),
+        "indicators": local_indicators.status(),
+    }
+
+
+async def _send(query: Query) -> dict | str:
+    """
+    Send a query upstream and decode the response.
+
+    :argument: query (Query): The query to send.
+
+    :returns: The response text for CSV queries, the decoded JSON otherwise.
+    """
+    response = await get_client().get(API_BASE_URL, params=query.to_params())
+    response.raise_for_status()
+    return response.text if query.is_csv else serialization.loads(response.content)
+
+
+async def _dispatch(
+    query: Query, chain: tuple[Middleware, ...], send: Handler = _send
+) -> dict | str:
+    if not chain:
+        return await send(query)
+    return await chain[0](query, partial(_dispatch, chain=chain[1:], send=send))
+
+
+async def _query(
+    function: str, params: dict | None = None, datatype: str | None = None
+) -> dict | str:
+    """
+    Run an Alpha Vantage query through the middleware chain.
+
+    :argument: function (str): The Alpha Vantage function, e.g. "GLOBAL_QUOTE".
+    :argument: params (dict): The query parameters; `None` values are not sent.
+    :argument: datatype (str): The response data type, sent as a parameter (default: None).
+
+    :returns: The response text for CSV queries, the decoded JSON otherwise.
+    """
+    query = Query.build(function, params, datatype)
+    return await _dispatch(query, tuple(MIDDLEWARE))
+
+
+@dataclass
+class _OpenStream:
+    response: httpx.Response
+    first_line: str
+    lines: AsyncIterator[str]
+
+    async def all_lines(self) -> AsyncIterator[str]:
+        yield self.first_line
+        async for line in self.lines:
+            yield line
+
+
+async def _open_stream(query: Query) -> "_OpenStream | dict":
+    """
+    Send a CSV query and read only its first line.
+
+    Error and throttle messages arrive as JSON even for CSV queries; those are
+    read whole and returned decoded, so the retry policy can act on them.
+    """
+    client = get_client()
+    request = client.build_request("GET", API_BASE_URL, params=query.to_params())
+    response = await client.send(request, stream=True)
+    try:
+        response.raise_for_status()
+        lines = response.aiter_lines()
+        first_line = await anext(lines, "")
+        if first_line.lstrip().startswith("{"):
+            rest = [line async for line in lines]
+            await response.aclose()
+            return serialization.loads("\n".join([first_line, *rest]))
+    except BaseException:
+        await response.aclose()
+        raise
+    return _OpenStream(response, first_line, lines)
+
+
+async def stream_csv(
+    function: str, params: dict | None = None, batch_size: int = DEFAULT_BATCH_SIZE
+) -> AsyncIterator[CSVBatch]:
+    """
+    Fetch a CSV response and parse it into typed column batches as it arrives,
+    so memory scales with `batch_size` rather than the response size.
+
+    The request is paced by the rate limiter and retried like any other, but
+    is neither cached nor coalesced, since its body is never held whole.
+
+    It is meant for consumers of the rows, such as the symbol universe. CSV
+    tool results are the response text itself, so those fetchers go through
+    `_query`, which holds the body whole but caches and coalesces it.
+
+    :argument: function (str): The Alpha Vantage function, e.g. "LISTING_STATUS".
+    :argument: params (dict): The query parameters; `datatype=csv` is added when needed.
+    :argument: batch_size (int): The number of rows per batch (default: 1000).
+
+    :returns: An async iterator of CSVBatch.
+    """
+    datatype = None if function in CSV_ONLY_FUNCTIONS else "csv"
+    query = Query.build(function, params, datatype)
+    opened = await _dispatch(
+        query, (retry_policy.middleware, rate_limiter.middleware), _open_stream
+    )
+    if not isinstance(opened, _OpenStream):
+        raise AlphaVantageError(f"{function} did not return CSV")
+    try:
+        async for batch in iter_batches(opened.all_lines(), batch_size):
+            yield batch
+    finally:
+        await opened.response.aclose()
+
+
+async def fetch_ohlcv(function: str, params: dict | None = None) -> OHLCVSeries:
+    """
+    Fetch a time series and parse it into columns. Requires numpy.
+
+    :argument: function (str): The time series function, e.g. "TIME_SERIES_DAILY".
+    :argument: params (dict): The query parameters.
+
+    :returns: The columnar series, oldest bar first.
+    """
+    return to_columnar(await _query(function, params, "json"))
+
+
+# The series local indicators are computed from, by interval. Adjusted series
+# let indicators span splits and dividends the way Alpha Vantage's do.
+INDICATOR_SERIES = {
+    "daily": ("TIME_SERIES_DAILY_ADJUSTED", {"outputsize": "full"}),
+    "weekly": ("TIME_SERIES_WEEKLY_ADJUSTED", {}),
+    "monthly": ("TIME_SERIES_MONTHLY_ADJUSTED", {}),
+}
+
+
+async def fetch_indicator_bars(symbol: str, interval: str, month: str | None = None) -> OHLCVSeries:
+    """
+    Fetch the series a technical indicator is computed from, through the
+    request core, so it is cached and shared by every indicator on it.
+
+    :argument: symbol (str): The stock symbol.
+    :argument: interval (str): "1min" to "60min", "daily", "weekly" or "monthly".
+    :argument: month (str): The month of intraday history, YYYY-MM (default: the most recent days).
+
+    :returns: The columnar series, oldest bar first.
+    """
+    if interval in INDICATOR_SERIES:
+        function, params = INDICATOR_SERIES[interval]
+        return await fetch_ohlcv(function, {"symbol": symbol, **params})
+    return await fetch_ohlcv(
+        "TIME_SERIES_INTRADAY", _intraday_params(symbol, interval, True, True, "full", month)
+    )
+
+
+local_indicators = LocalIndicators.from_env(fetch_indicator_bars, _query)
+
 
 #####
 # Core Stock APIs
@@ -38,22 +464,104 @@ async def fetch_intraday(
     :returns: The intraday stock data.
     """
 
-    https_params = {
-        "function": "TIME_SERIES_INTRADAY",
+    return await _query(
+        "TIME_SERIES_INTRADAY",
+        _intraday_params(symbol, interval, adjusted, extended_hours, outputsize, month),
+        datatype,
+    )
+
+
+def _intraday_params(symbol, interval, adjusted, extended_hours, outputsize, month) -> dict:
+    return {
         "symbol": symbol,
         "interval": interval,
-        "datatype": datatype,
         "adjusted": adjusted,
         "outputsize": outputsize,
         "extended_hours": extended_hours,
         "month": month,
-        "apikey": API_KEY,
     }
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+
+async def backfill_intraday(
+    symbol: str,
+    start_month: str,
+    end_month: str | None = None,
+    interval: str = "60min",
+    datatype: str = "json",
+    adjusted: bool = True,
+    extended_hours: bool = True,
+    concurrency: int = DEFAULT_BACKFILL_CONCURRENCY,
+) -> dict:
+    """
+    Fetch the full intraday history of every completed month in a range that
+    is not stored yet. Months are fetched concurrently, paced by the rate limiter.
+
+    Without a persistent cache file, only as many months as fit in memory
+    (ALPHAVANTAGE_PARTITION_MAX_MEMORY) are fetched, the latest first; the
+    others are reported as skipped rather than fetched and evicted again.
+
+    :argument: symbol (str): The stock symbol to fetch.
+    :argument: start_month (str): The first month, as YYYY-MM.
+    :argument: end_month (str): The last month, as YYYY-MM (default: the last completed month).
+    :argument: interval (str): The time interval for the data (default: "60min").
+    :argument: datatype (str): The response data type (default: "json").
+    :argument: adjusted (bool): The adjusted data flag (default: True).
+    :argument: extended_hours (bool): The extended hours flag (default: True).
+    :argument: concurrency (int): The maximum number of months fetched at once (default: 4).
+
+    :returns: The months fetched, already stored, skipped and failed (with errors), and how many are kept.
+    """
+    months = [
+        month
+        for month in month_range(start_month, end_month or month_partitions.current_month())
+        if month_partitions.is_complete(month)
+    ]
+    report = {
+        "symbol": symbol,
+        "interval": interval,
+        "fetched": [],
+        "stored": [],
+        "skipped": [],
+        "failed": {},
+    }
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    def params(month: str) -> dict:
+        return _intraday_params(symbol, interval, adjusted, extended_hours, "full", month)
+
+    def query(month: str) -> Query:
+        return Query.build("TIME_SERIES_INTRADAY", params(month), datatype)
+
+    missing = []
+    for month in months:
+        if await month_partitions.get(query(month)) is not None:
+            report["stored"].append(month)
+        else:
+            missing.append(month)
+    capacity = month_partitions.capacity
+    if capacity is not None and len(missing) > capacity:
+        # Months beyond what memory holds would cost a call each and be evicted.
+        report["skipped"] = missing[: len(missing) - capacity]
+        missing = missing[len(missing) - capacity :]
+        report["note"] = (
+            f"Only {capacity} months are kept in memory; set ALPHAVANTAGE_CACHE_PATH "
+            "to backfill the skipped months"
+        )
+
+    async def backfill(month: str) -> None:
+        async with semaphore:
+            try:
+                await _query("TIME_SERIES_INTRADAY", params(month), datatype)
+            except UPSTREAM_ERRORS as e:
+                report["failed"][month] = str(e) or type(e).__name__
+            else:
+                report["fetched"].append(month)
+
+    await asyncio.gather(*(backfill(month) for month in missing))
+    report["fetched"].sort()
+    report["failed"] = dict(sorted(report["failed"].items()))
+    report["kept"] = sum([await month_partitions.get(query(month)) is not None for month in months])
+    return report
 
 
 async def fetch_time_series_daily(
@@ -68,17 +576,11 @@ async def fetch_time_series_daily(
     :returns: The daily stock data.
     """
 
-    https_params = {
-        "function": "TIME_SERIES_DAILY",
-        "symbol": symbol,
-        "datatype": datatype,
-        "outputsize": outputsize,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query(
+        "TIME_SERIES_DAILY",
+        {"symbol": symbol, "outputsize": outputsize},
+        datatype,
+    )
 
 
 async def fetch_time_series_daily_adjusted(
@@ -93,17 +595,11 @@ async def fetch_time_series_daily_adjusted(
     :returns: The daily adjusted stock data.
     """
 
-    https_params = {
-        "function": "TIME_SERIES_DAILY_ADJUSTED",
-        "symbol": symbol,
-        "datatype": datatype,
-        "outputsize": outputsize,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query(
+        "TIME_SERIES_DAILY_ADJUSTED",
+        {"symbol": symbol, "outputsize": outputsize},
+        datatype,
+    )
 
 
 async def fetch_time_series_weekly(
@@ -118,16 +614,7 @@ async def fetch_time_series_weekly(
     :returns: The weekly stock data.
     """
 
-    https_params = {
-        "function": "TIME_SERIES_WEEKLY",
-        "symbol": symbol,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("TIME_SERIES_WEEKLY", {"symbol": symbol}, datatype)
 
 
 async def fetch_time_series_weekly_adjusted(
@@ -142,16 +629,7 @@ async def fetch_time_series_weekly_adjusted(
     :returns: The weekly adjusted stock data.
     """
 
-    https_params = {
-        "function": "TIME_SERIES_WEEKLY_ADJUSTED",
-        "symbol": symbol,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("TIME_SERIES_WEEKLY_ADJUSTED", {"symbol": symbol}, datatype)
 
 
 async def fetch_time_series_monthly(
@@ -166,16 +644,7 @@ async def fetch_time_series_monthly(
     :returns: The monthly stock data.
     """
 
-    https_params = {
-        "function": "TIME_SERIES_MONTHLY",
-        "symbol": symbol,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("TIME_SERIES_MONTHLY", {"symbol": symbol}, datatype)
 
 
 async def fetch_time_series_monthly_adjusted(
@@ -190,16 +659,7 @@ async def fetch_time_series_monthly_adjusted(
     :returns: The monthly adjusted stock data.
     """
 
-    https_params = {
-        "function": "TIME_SERIES_MONTHLY_ADJUSTED",
-        "symbol": symbol,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("TIME_SERIES_MONTHLY_ADJUSTED", {"symbol": symbol}, datatype)
 
 
 async def fetch_quote(symbol: str, datatype: str = "json") -> dict[str, str] | str:
@@ -212,16 +672,7 @@ async def fetch_quote(symbol: str, datatype: str = "json") -> dict[str, str] | s
     :returns: The stock quote data.
     """
 
-    https_params = {
-        "function": "GLOBAL_QUOTE",
-        "symbol": symbol,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("GLOBAL_QUOTE", {"symbol": symbol}, datatype)
 
 
 async def fetch_realtime_bulk_quotes(
@@ -230,22 +681,70 @@ async def fetch_realtime_bulk_quotes(
     """
     Fetch real-time bulk stock quotes from the Alpha Vantage API.
 
+    Any number of symbols can be given: they are split into 100-symbol chunks
+    fetched concurrently, paced by the rate limiter. JSON quotes are merged in
+    input order, and chunks that failed are listed under "errors". CSV chunks
+    are joined under one header; a failed chunk fails the call.
+
     :argument: symbols (list[str]): The stock symbols to fetch.
     :argument: datatype (str): The response data type (default: "json").
 
     :returns: The real-time bulk stock quotes.
-    """
 
-    https_params = {
-        "function": "REALTIME_BULK_QUOTES",
-        "symbols": ",".join(symbols[:100]),
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    :raises ValueError: If no symbol is given.
+    """
+
+    if isinstance(symbols, str):
+        symbols = [symbols]
+    # Entries may themselves be comma-separated lists, as the API takes them.
+    names = [name.strip().upper() for symbol in symbols for name in symbol.split(",")]
+    unique = list(dict.fromkeys(name for name in names if name))
+    if not unique:
+        raise ValueError("symbols must not be empty")
+    chunks = [
+        unique[start : start + BULK_QUOTES_CHUNK_SIZE]
+        for start in range(0, len(unique), BULK_QUOTES_CHUNK_SIZE)
+    ]
+    results = await asyncio.gather(
+        *(
+            _query("REALTIME_BULK_QUOTES", {"symbols": ",".join(chunk)}, datatype)
+            for chunk in chunks
+        ),
+        return_exceptions=True,
+    )
+    failures = [
+        (index, result)
+        for index, result in enumerate(results)
+        if isinstance(result, BaseException)
+    ]
+    if len(failures) == len(chunks) or (failures and datatype == "csv"):
+        raise failures[0][1]
+    if len(chunks) == 1:
+        return results[0]
+    if datatype == "csv":
+        lines = [result.splitlines(keepends=True) for result in results]
+        return "".join(lines[0][:1] + [line for chunk in lines for line in chunk[1:]])
+
+    quotes = {}
+    for result in results:
+        if isinstance(result, dict):
+            for quote in result.get("data", []):
+                quotes.setdefault(str(quote.get("symbol", "")).upper(), quote)
+    merged = next(result for result in results if isinstance(result, dict))
+    merged = {
+        **merged,
+        "data": [quotes[symbol] for symbol in unique if symbol in quotes],
+    }
+    if failures:
+        merged["errors"] = [
+            {
+                "chunk": index,
+                "symbols": chunks[index],
+                "error": str(error) or type(error).__name__,
+            }
+            for index, error in failures
+        ]
+    return merged
 
 
 async def search_endpoint(
@@ -254,22 +753,29 @@ async def search_endpoint(
     """
     Search for endpoints from the Alpha Vantage API.
 
+    JSON searches are answered from the local symbol universe when it has a
+    confident match; the remote endpoint is used otherwise.
+
     :argument: keywords (str): The search keywords.
     :argument: datatype (str): The response data type (default: "json").
 
     :returns: The search results.
     """
 
-    https_params = {
-        "function": "SYMBOL_SEARCH",
-        "keywords": keywords,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    if datatype == "json" and local_search.enabled:
+        try:
+            universe = await symbol_universe.get()
+        except (*UPSTREAM_ERRORS, KeyError):
+            # A missing or malformed listing download only costs the remote search.
+            universe = None
+        if universe is not None:
+            result = (await local_search.index(universe)).best_matches(keywords)
+            if local_search.confident(result):
+                local_search.local += 1
+                return result
+
+    local_search.remote += 1
+    return await _query("SYMBOL_SEARCH", {"keywords": keywords}, datatype)
 
 
 async def fetch_market_status() -> dict[str, str] | str:
@@ -279,11 +785,7 @@ async def fetch_market_status() -> dict[str, str] | str:
     :returns: The market status.
     """
 
-    https_params = {"function": "MARKET_STATUS", "apikey": API_KEY}
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _query("MARKET_STATUS")
 
 
 #####
@@ -304,17 +806,11 @@ async def fetch_realtime_options(
     :returns: The real-time options' data.
     """
 
-    https_params = {
-        "function": "REALTIME_OPTIONS",
-        "symbol": symbol,
-        "datatype": datatype,
-        "contract": contract,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query(
+        "REALTIME_OPTIONS",
+        {"symbol": symbol, "contract": contract},
+        datatype,
+    )
 
 
 async def fetch_historical_options(
@@ -328,17 +824,11 @@ async def fetch_historical_options(
     :argument: date (str): The date of the historical options (default: None)
     """
 
-    https_params = {
-        "function": "HISTORICAL_OPTIONS",
-        "symbol": symbol,
-        "datatype": datatype,
-        "date": date,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query(
+        "HISTORICAL_OPTIONS",
+        {"symbol": symbol, "date": date},
+        datatype,
+    )
 
 
 #####
@@ -369,21 +859,18 @@ async def fetch_news_sentiment(
     :returns: The news sentiment data.
     """
 
-    https_params = {
-        "function": "NEWS_SENTIMENT",
-        "tickers": ",".join(tickers),
-        "datatype": datatype,
-        "topics": ",".join(topics) if topics else None,
-        "time_from": time_from,
-        "time_to": time_to,
-        "sort": sort,
-        "limit": limit,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query(
+        "NEWS_SENTIMENT",
+        {
+            "tickers": ",".join(tickers),
+            "topics": ",".join(topics) if topics else None,
+            "time_from": time_from,
+            "time_to": time_to,
+            "sort": sort,
+            "limit": limit,
+        },
+        datatype,
+    )
 
 
 async def fetch_top_gainer_losers() -> dict[str, str]:
@@ -393,14 +880,7 @@ async def fetch_top_gainer_losers() -> dict[str, str]:
     :returns: The top gainers or losers data.
     """
 
-    https_params = {
-        "function": "TOP_GAINERS_LOSERS",
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _query("TOP_GAINERS_LOSERS")
 
 
 async def fetch_insider_transactions(symbol: str) -> dict[str, str]:
@@ -412,15 +892,7 @@ async def fetch_insider_transactions(symbol: str) -> dict[str, str]:
     :returns: insider transactions' data.
     """
 
-    https_params = {
-        "function": "INSIDER_TRANSACTIONS",
-        "symbol": symbol,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _query("INSIDER_TRANSACTIONS", {"symbol": symbol})
 
 
 async def fetch_analytics_fixed_window(
@@ -442,19 +914,16 @@ async def fetch_analytics_fixed_window(
     :returns: The analytics data.
     """
 
-    https_params = {
-        "function": "ANALYTICS_FIXED_WINDOW",
-        "symbol": ",".join(symbols),
-        "range": series_range,
-        "interval": interval,
-        "ohlc": ohlc,
-        "calculations": ",".join(calculations) if calculations else None,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _query(
+        "ANALYTICS_FIXED_WINDOW",
+        {
+            "symbol": ",".join(symbols),
+            "range": series_range,
+            "interval": interval,
+            "ohlc": ohlc,
+            "calculations": ",".join(calculations) if calculations else None,
+        },
+    )
 
 
 async def fetch_analytics_sliding_window(
@@ -473,20 +942,17 @@ async def fetch_analytics_sliding_window(
     :returns: The analytics data.
     """
 
-    https_params = {
-        "function": "ANALYTICS_SLIDING_WINDOW",
-        "symbols": ",".join(symbols),
-        "range": series_range,
-        "ohlc": ohlc,
-        "interval": interval,
-        "window_size": window_size,
-        "calculations": ",".join(calculations) if calculations else None,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _query(
+        "ANALYTICS_SLIDING_WINDOW",
+        {
+            "symbols": ",".join(symbols),
+            "range": series_range,
+            "ohlc": ohlc,
+            "interval": interval,
+            "window_size": window_size,
+            "calculations": ",".join(calculations) if calculations else None,
+        },
+    )
 
 
 #####
@@ -503,15 +969,7 @@ async def fetch_company_overview(symbol: str) -> dict[str, str]:
     :returns: The company overview data.
     """
 
-    https_params = {
-        "function": "OVERVIEW",
-        "symbol": symbol,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _query("OVERVIEW", {"symbol": symbol})
 
 
 async def fetch_etf_profile(symbol: str) -> dict[str, str]:
@@ -523,15 +981,7 @@ async def fetch_etf_profile(symbol: str) -> dict[str, str]:
     :returns: The company overview data.
     """
 
-    https_params = {
-        "function": "ETF_PROFILE",
-        "symbol": symbol,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _query("ETF_PROFILE", {"symbol": symbol})
 
 
 async def company_dividends(symbol: str) -> dict[str, str]:
@@ -543,15 +993,7 @@ async def company_dividends(symbol: str) -> dict[str, str]:
     :returns: The company dividends data.
     """
 
-    https_params = {
-        "function": "DIVIDENDS",
-        "symbol": symbol,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _query("DIVIDENDS", {"symbol": symbol})
 
 
 async def fetch_company_splits(symbol: str) -> dict[str, str]:
@@ -563,15 +1005,7 @@ async def fetch_company_splits(symbol: str) -> dict[str, str]:
     :returns: The company splits data.
     """
 
-    https_params = {
-        "function": "SPLITS",
-        "symbol": symbol,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _query("SPLITS", {"symbol": symbol})
 
 
 async def fetch_income_statement(symbol: str) -> dict[str, str]:
@@ -583,15 +1017,7 @@ async def fetch_income_statement(symbol: str) -> dict[str, str]:
     :returns: The company income statement data.
     """
 
-    https_params = {
-        "function": "INCOME_STATEMENT",
-        "symbol": symbol,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _query("INCOME_STATEMENT", {"symbol": symbol})
 
 
 async def fetch_balance_sheet(symbol: str) -> dict[str, str]:
@@ -603,15 +1029,7 @@ async def fetch_balance_sheet(symbol: str) -> dict[str, str]:
     :returns: The company balance sheet data.
     """
 
-    https_params = {
-        "function": "BALANCE_SHEET",
-        "symbol": symbol,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _query("BALANCE_SHEET", {"symbol": symbol})
 
 
 async def fetch_cash_flow(symbol: str) -> dict[str, str]:
@@ -623,15 +1041,7 @@ async def fetch_cash_flow(symbol: str) -> dict[str, str]:
     :returns: The company cash flow data.
     """
 
-    https_params = {
-        "function": "CASH_FLOW",
-        "symbol": symbol,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _query("CASH_FLOW", {"symbol": symbol})
 
 
 async def fetch_earnings(symbol: str) -> dict[str, str]:
@@ -643,15 +1053,7 @@ async def fetch_earnings(symbol: str) -> dict[str, str]:
     :returns: The company earnings data.
     """
 
-    https_params = {
-        "function": "EARNINGS",
-        "symbol": symbol,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _query("EARNINGS", {"symbol": symbol})
 
 async def fetch_earnings_call_transcript(symbol: str, quarter: str) -> dict[str, str]:
     """
@@ -663,65 +1065,88 @@ async def fetch_earnings_call_transcript(symbol: str, quarter: str) -> dict[str,
 
     :return: The earnings call transcript data.
     """
-    https_params = {
-        "function": "EARNINGS_CALL_TRANSCRIPT",
-        "symbol": symbol,
-        "quarter": quarter,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _query(
+        "EARNINGS_CALL_TRANSCRIPT",
+        {"symbol": symbol, "quarter": quarter},
+    )
 
 async def fetch_listing_status(
         date: str = None, state: str = "active"
-) -> dict[str, str]:
+) -> str:
     """
     Fetch company listing status data from the Alpha Vantage API.
 
     :argument: date (str): The date of the listing status (default: None).
     :argument: state (str): The listing status state (default: "active").
 
-    :returns: The company listing status data.
+    :returns: The company listing status data using CSV format.
+    """
+
+    return await _query("LISTING_STATUS", {"date": date, "state": state})
+
+
+async def get_symbol_universe() -> SymbolUniverse:
+    """
+    The local index of listed and delisted symbols, rebuilt from LISTING_STATUS daily.
+
+    :returns: The symbol universe.
     """
+    return await symbol_universe.get()
 
-    https_params = {
-        "function": "LISTING_STATUS",
-        "date": date,
-        "state": state,
-        "apikey": API_KEY,
+
+async def lookup_listings(
+    symbols: list[str] | None = None,
+    exchange: str | None = None,
+    asset_type: str | None = None,
+    status: str | None = None,
+    ipo_from: str | None = None,
+    ipo_to: str | None = None,
+    limit: int = 100,
+) -> dict:
+    """
+    Validate symbols and filter listings against the local symbol universe,
+    without spending API quota once the universe is loaded.
+
+    :argument: symbols (list[str]): Symbols to look up (default: None).
+    :argument: exchange (str): Only listings on this exchange, e.g. "NASDAQ" (default: None).
+    :argument: asset_type (str): Only "Stock" or "ETF" listings (default: None).
+    :argument: status (str): Only "Active" or "Delisted" listings (default: None).
+    :argument: ipo_from (str): Only listings with an IPO on or after this date, YYYY-MM-DD (default: None).
+    :argument: ipo_to (str): Only listings with an IPO on or before this date, YYYY-MM-DD (default: None).
+    :argument: limit (int): The maximum number of filtered listings returned (default: 100).
+
+    :returns: The listings found and unknown symbols for a symbol lookup, the matching listings otherwise.
+    """
+    universe = await symbol_universe.get()
+    if symbols:
+        listings = {symbol: universe.lookup(symbol) for symbol in symbols}
+        return {
+            "listings": [listing.to_dict() for listing in listings.values() if listing],
+            "unknown": [symbol for symbol, listing in listings.items() if listing is None],
+        }
+    matches = universe.filter(exchange, asset_type, status, ipo_from, ipo_to)
+    return {
+        "count": len(matches),
+        "listings": [listing.to_dict() for listing in matches[:limit]],
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
 
 
 async def fetch_earnings_calendar(
-    symbol: str, horizon: str = "3month"
+    symbol: str | None = None, horizon: str = "3month"
 ) -> str:
     """
     Fetch companies earnings calendar data from the Alpha Vantage API.
 
-    :argument: symbol (str): The stock symbol to fetch.
+    :argument: symbol (str): The stock symbol to fetch (default: all companies).
     :argument: horizon (str): The earning calendar horizon (default: "3month").
 
     :returns: The company earning calendar data using CSV format
     """
 
-    https_params = {
-        "function": "EARNINGS_CALENDAR",
-        "horizon": horizon,
-        "apikey": API_KEY,
-    }
-    if symbol:
-        https_params["symbol"] = symbol
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text
+    return await _query(
+        "EARNINGS_CALENDAR",
+        {"symbol": symbol or None, "horizon": horizon},
+    )
 
 
 async def fetch_ipo_calendar() -> str:
@@ -731,14 +1156,7 @@ async def fetch_ipo_calendar() -> str:
     :returns: The IPO calendar data.
     """
 
-    https_params = {
-        "function": "IPO_CALENDAR",
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text
+    return await _query("IPO_CALENDAR")
 
 
 #####
@@ -758,17 +1176,10 @@ async def fetch_exchange_rate(
     :returns: The exchange rate data.
     """
 
-    https_params = {
-        "function": "CURRENCY_EXCHANGE_RATE",
-        "from_currency": from_currency,
-        "to_currency": to_currency,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.json()
+    return await _query(
+        "CURRENCY_EXCHANGE_RATE",
+        {"from_currency": from_currency, "to_currency": to_currency},
+    )
 
 
 async def fetch_fx_intraday(
@@ -790,20 +1201,16 @@ async def fetch_fx_intraday(
     :returns: The intraday forex data.
     """
 
-    https_params = {
-        "function": "FX_INTRADAY",
-        "from_symbol": from_symbol,
-        "to_symbol": to_symbol,
-        "interval": interval,
-        "datatype": datatype,
-        "outputsize": outputsize,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query(
+        "FX_INTRADAY",
+        {
+            "from_symbol": from_symbol,
+            "to_symbol": to_symbol,
+            "interval": interval,
+            "outputsize": outputsize,
+        },
+        datatype,
+    )
 
 
 async def fetch_fx_daily(
@@ -823,18 +1230,11 @@ async def fetch_fx_daily(
     :returns: The daily forex data.
     """
 
-    https_params = {
-        "function": "FX_DAILY",
-        "from_symbol": from_symbol,
-        "to_symbol": to_symbol,
-        "datatype": datatype,
-        "outputsize": outputsize,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query(
+        "FX_DAILY",
+        {"from_symbol": from_symbol, "to_symbol": to_symbol, "outputsize": outputsize},
+        datatype,
+    )
 
 
 async def fetch_fx_weekly(
@@ -850,17 +1250,11 @@ async def fetch_fx_weekly(
     :returns: The weekly forex data.
     """
 
-    https_params = {
-        "function": "FX_WEEKLY",
-        "from_symbol": from_symbol,
-        "to_symbol": to_symbol,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query(
+        "FX_WEEKLY",
+        {"from_symbol": from_symbol, "to_symbol": to_symbol},
+        datatype,
+    )
 
 
 async def fetch_fx_monthly(
@@ -876,17 +1270,11 @@ async def fetch_fx_monthly(
     :returns: The monthly forex data.
     """
 
-    https_params = {
-        "function": "FX_MONTHLY",
-        "from_symbol": from_symbol,
-        "to_symbol": to_symbol,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query(
+        "FX_MONTHLY",
+        {"from_symbol": from_symbol, "to_symbol": to_symbol},
+        datatype,
+    )
 
 
 #####
@@ -912,23 +1300,19 @@ async def fetch_digital_currency_intraday(
     :returns: The intraday digital currency data.
     """
 
-    https_params = {
-        "function": "CRYPTO_INTRADAY",
-        "symbol": symbol,
-        "market": market,
-        "interval": interval,
-        "datatype": datatype,
-        "outputsize": outputsize,
-        "apikey": API_KEY,
-    }
+    return await _query(
+        "CRYPTO_INTRADAY",
+        {
+            "symbol": symbol,
+            "market": market,
+            "interval": interval,
+            "outputsize": outputsize,
+        },
+        datatype,
+    )
 
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
 
-
-async def fetch_digital_currency_daily(symbol: str, market: str) -> str:
+async def fetch_digital_currency_daily(symbol: str, market: str) -> dict[str, str]:
     """
     Fetch daily digital currency data from the Alpha Vantage API.
 
@@ -939,19 +1323,10 @@ async def fetch_digital_currency_daily(symbol: str, market: str) -> str:
     :returns: The daily digital currency data.
     """
 
-    https_params = {
-        "function": "DIGITAL_CURRENCY_DAILY",
-        "symbol": symbol,
-        "market": market,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text
+    return await _query("DIGITAL_CURRENCY_DAILY", {"symbol": symbol, "market": market})
 
 
-async def fetch_digital_currency_weekly(symbol: str, market: str) -> str:
+async def fetch_digital_currency_weekly(symbol: str, market: str) -> dict[str, str]:
     """
     Fetch weekly digital currency data from the Alpha Vantage API.
 
@@ -962,19 +1337,10 @@ async def fetch_digital_currency_weekly(symbol: str, market: str) -> str:
     :returns: The weekly digital currency data.
     """
 
-    https_params = {
-        "function": "DIGITAL_CURRENCY_WEEKLY",
-        "symbol": symbol,
-        "market": market,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text
+    return await _query("DIGITAL_CURRENCY_WEEKLY", {"symbol": symbol, "market": market})
 
 
-async def fetch_digital_currency_monthly(symbol: str, market: str) -> str:
+async def fetch_digital_currency_monthly(symbol: str, market: str) -> dict[str, str]:
     """
     Fetch monthly digital currency data from the Alpha Vantage API.
 
@@ -985,16 +1351,10 @@ async def fetch_digital_currency_monthly(symbol: str, market: str) -> str:
     :returns: The monthly digital currency data.
     """
 
-    https_params = {
-        "function": "DIGITAL_CURRENCY_MONTHLY",
-        "symbol": symbol,
-        "market": market,
-        "apikey": API_KEY,
-    }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text
+    return await _query(
+        "DIGITAL_CURRENCY_MONTHLY",
+        {"symbol": symbol, "market": market},
+    )
 
 
 #####
@@ -1014,17 +1374,7 @@ async def fetch_wti_crude(
     :returns: The intraday crude oil (WTI) data.
     """
 
-    https_params = {
-        "function": "WTI",
-        "interval": interval,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("WTI", {"interval": interval}, datatype)
 
 
 async def fetch_brent_crude(
@@ -1039,17 +1389,7 @@ async def fetch_brent_crude(
     :returns: The intraday Brent crude oil data.
     """
 
-    https_params = {
-        "function": "BRENT",
-        "interval": interval,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("BRENT", {"interval": interval}, datatype)
 
 
 async def fetch_natural_gas(
@@ -1064,17 +1404,7 @@ async def fetch_natural_gas(
     :returns: The intraday natural gas data.
     """
 
-    https_params = {
-        "function": "NATURAL_GAS",
-        "interval": interval,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("NATURAL_GAS", {"interval": interval}, datatype)
 
 
 async def fetch_copper(
@@ -1089,17 +1419,7 @@ async def fetch_copper(
     :returns: The intraday copper data.
     """
 
-    https_params = {
-        "function": "COPPER",
-        "interval": interval,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("COPPER", {"interval": interval}, datatype)
 
 
 async def fetch_aluminum(
@@ -1114,17 +1434,7 @@ async def fetch_aluminum(
     :returns: The intraday aluminum data.
     """
 
-    https_params = {
-        "function": "ALUMINUM",
-        "interval": interval,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("ALUMINUM", {"interval": interval}, datatype)
 
 
 async def fetch_wheat(
@@ -1139,17 +1449,7 @@ async def fetch_wheat(
     :returns: The intraday wheat data.
     """
 
-    https_params = {
-        "function": "WHEAT",
-        "interval": interval,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("WHEAT", {"interval": interval}, datatype)
 
 
 async def fetch_corn(
@@ -1164,17 +1464,7 @@ async def fetch_corn(
     :returns: The intraday corn data.
     """
 
-    https_params = {
-        "function": "CORN",
-        "interval": interval,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("CORN", {"interval": interval}, datatype)
 
 
 async def fetch_cotton(
@@ -1189,17 +1479,7 @@ async def fetch_cotton(
     :returns: The intraday cotton data.
     """
 
-    https_params = {
-        "function": "COTTON",
-        "interval": interval,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("COTTON", {"interval": interval}, datatype)
 
 
 async def fetch_sugar(
@@ -1214,17 +1494,7 @@ async def fetch_sugar(
     :returns: The intraday sugar data.
     """
 
-    https_params = {
-        "function": "SUGAR",
-        "interval": interval,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("SUGAR", {"interval": interval}, datatype)
 
 
 async def fetch_coffee(
@@ -1239,17 +1509,7 @@ async def fetch_coffee(
     :returns: The intraday coffee data.
     """
 
-    https_params = {
-        "function": "COFFEE",
-        "interval": interval,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("COFFEE", {"interval": interval}, datatype)
 
 
 async def fetch_all_commodities(
@@ -1264,17 +1524,7 @@ async def fetch_all_commodities(
     :returns: Global commodities data.
     """
 
-    https_params = {
-        "function": "ALL_COMMODITIES",
-        "interval": interval,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("ALL_COMMODITIES", {"interval": interval}, datatype)
 
 
 #####
@@ -1294,17 +1544,7 @@ async def fetch_real_gdp(
     :returns: The real GDP data.
     """
 
-    https_params = {
-        "function": "REAL_GDP",
-        "interval": interval,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("REAL_GDP", {"interval": interval}, datatype)
 
 
 async def fetch_real_gdp_per_capita(datatype: str = "json") -> dict[str, str] | str:
@@ -1317,16 +1557,7 @@ async def fetch_real_gdp_per_capita(datatype: str = "json") -> dict[str, str] |
     :returns: The real GDP per capita data.
     """
 
-    https_params = {
-        "function": "REAL_GDP_PER_CAPITA",
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("REAL_GDP_PER_CAPITA", datatype=datatype)
 
 
 async def fetch_treasury_yield(
@@ -1342,18 +1573,11 @@ async def fetch_treasury_yield(
     :returns: The treasure yield data.
     """
 
-    https_params = {
-        "function": "TREASURY_YIELD",
-        "interval": interval,
-        "maturity": maturity,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query(
+        "TREASURY_YIELD",
+        {"interval": interval, "maturity": maturity},
+        datatype,
+    )
 
 
 async def fetch_federal_funds_rate(
@@ -1368,17 +1592,7 @@ async def fetch_federal_funds_rate(
     :returns: The federal funds rate data.
     """
 
-    https_params = {
-        "function": "FEDERAL_FUNDS_RATE",
-        "interval": interval,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("FEDERAL_FUNDS_RATE", {"interval": interval}, datatype)
 
 
 async def fetch_cpi(
@@ -1393,17 +1607,7 @@ async def fetch_cpi(
     :returns: The consumer price index (CPI) data.
     """
 
-    https_params = {
-        "function": "CPI",
-        "interval": interval,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("CPI", {"interval": interval}, datatype)
 
 
 async def fetch_inflation(datatype: str = "json") -> dict[str, str] | str:
@@ -1415,16 +1619,7 @@ async def fetch_inflation(datatype: str = "json") -> dict[str, str] | str:
     :returns: The inflation data.
     """
 
-    https_params = {
-        "function": "INFLATION",
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("INFLATION", datatype=datatype)
 
 
 async def fetch_retail_sales(datatype: str = "json") -> dict[str, str] | str:
@@ -1436,16 +1631,7 @@ async def fetch_retail_sales(datatype: str = "json") -> dict[str, str] | str:
     :returns: The retail sales data.
     """
 
-    https_params = {
-        "function": "RETAIL_SALES",
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("RETAIL_SALES", datatype=datatype)
 
 
 async def fetch_durables(datatype: str = "json") -> dict[str, str] | str:
@@ -1457,16 +1643,7 @@ async def fetch_durables(datatype: str = "json") -> dict[str, str] | str:
     :returns: The durable goods data.
     """
 
-    https_params = {
-        "function": "DURABLES",
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("DURABLES", datatype=datatype)
 
 
 async def fetch_unemployment(datatype: str = "json") -> dict[str, str] | str:
@@ -1478,16 +1655,7 @@ async def fetch_unemployment(datatype: str = "json") -> dict[str, str] | str:
     :returns: The unemployment data.
     """
 
-    https_params = {
-        "function": "UNEMPLOYMENT",
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("UNEMPLOYMENT", datatype=datatype)
 
 
 async def fetch_nonfarm_payrolls(datatype: str = "json") -> dict[str, str] | str:
@@ -1499,16 +1667,7 @@ async def fetch_nonfarm_payrolls(datatype: str = "json") -> dict[str, str] | str
     :returns: The nonfarm payrolls' data.
     """
 
-    https_params = {
-        "function": "NONFARM_PAYROLL",
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query("NONFARM_PAYROLL", datatype=datatype)
 
 
 #####
@@ -1523,6 +1682,7 @@ async def fetch_sma(
     time_period: int = None,
     series_type: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch simple moving average (SMA) data from the Alpha Vantage API.
@@ -1533,25 +1693,23 @@ async def fetch_sma(
     :argument: time_period (int): The time period for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: The simple moving average (SMA) data.
     """
 
-    https_params = {
-        "function": "SMA",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "SMA",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_ema(
@@ -1561,6 +1719,7 @@ async def fetch_ema(
     time_period: int = None,
     series_type: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch exponential moving average (EMA) data from the Alpha Vantage API.
@@ -1571,25 +1730,23 @@ async def fetch_ema(
     :argument: time_period (int): The time period for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: The exponential moving average (EMA) data.
     """
 
-    https_params = {
-        "function": "EMA",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "EMA",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_wma(
@@ -1599,6 +1756,7 @@ async def fetch_wma(
     time_period: int = None,
     series_type: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch weighted moving average (WMA) data from the Alpha Vantage API.
@@ -1609,25 +1767,23 @@ async def fetch_wma(
     :argument: time_period (int): The time period for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: The weighted moving average (WMA) data.
     """
 
-    https_params = {
-        "function": "WMA",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "WMA",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_dema(
@@ -1637,6 +1793,7 @@ async def fetch_dema(
     time_period: int = None,
     series_type: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch double exponential moving average (DEMA) data from the Alpha Vantage API.
@@ -1647,25 +1804,23 @@ async def fetch_dema(
     :argument: time_period (int): The time period for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: The double exponential moving average (DEMA) data.
     """
 
-    https_params = {
-        "function": "DEMA",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "DEMA",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_tema(
@@ -1675,6 +1830,7 @@ async def fetch_tema(
     time_period: int = None,
     series_type: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch triple exponential moving average (TEMA) data from the Alpha Vantage API.
@@ -1685,25 +1841,23 @@ async def fetch_tema(
     :argument: time_period (int): The time period for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: The triple exponential moving average (TEMA) data.
     """
 
-    https_params = {
-        "function": "TEMA",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "TEMA",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_trima(
@@ -1713,6 +1867,7 @@ async def fetch_trima(
     time_period: int = None,
     series_type: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch triangular moving average (TRIMA) data from the Alpha Vantage API.
@@ -1723,25 +1878,23 @@ async def fetch_trima(
     :argument: time_period (int): The time period for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: The triangular moving average (TRIMA) data.
     """
 
-    https_params = {
-        "function": "TRIMA",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "TRIMA",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_kama(
@@ -1751,6 +1904,7 @@ async def fetch_kama(
     time_period: int = None,
     series_type: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch Kaufman adaptive moving average (KAMA) data from the Alpha Vantage API.
@@ -1761,25 +1915,23 @@ async def fetch_kama(
     :argument: time_period (int): The time period for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: The Kaufman adaptive moving average (KAMA) data.
     """
 
-    https_params = {
-        "function": "KAMA",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "KAMA",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_mama(
@@ -1790,6 +1942,7 @@ async def fetch_mama(
     fastlimit: float = 0.01,
     slowlimit: float = 0.01,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch MESA adaptive moving average (MAMA) data from the Alpha Vantage API.
@@ -1801,26 +1954,24 @@ async def fetch_mama(
     :argument: fastlimit (float): The fast limit for the data.
     :argument: slowlimit (float): The slow limit for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: The MESA adaptive moving average (MAMA) data.
     """
 
-    https_params = {
-        "function": "MAMA",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "series_type": series_type,
-        "fastlimit": fastlimit,
-        "slowlimit": slowlimit,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "MAMA",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "series_type": series_type,
+            "fastlimit": fastlimit,
+            "slowlimit": slowlimit,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_vwap(
@@ -1828,6 +1979,7 @@ async def fetch_vwap(
     interval: str = None,
     month: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch volume weighted average price (VWAP) data from the Alpha Vantage API.
@@ -1836,23 +1988,17 @@ async def fetch_vwap(
     :argument: interval (str): The time interval for the data.
     :argument: month (str): The month for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: The volume weighted average price (VWAP) data.
     """
 
-    https_params = {
-        "function": "VWAP",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "VWAP",
+        {"symbol": symbol, "interval": interval, "month": month},
+        datatype,
+        source,
+    )
 
 
 async def fetch_t3(
@@ -1862,6 +2008,7 @@ async def fetch_t3(
     time_period: int = None,
     series_type: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch triple exponential moving average (T3) data from the Alpha Vantage API.
@@ -1872,25 +2019,23 @@ async def fetch_t3(
     :argument: time_period (int): The time period for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: The triple exponential moving average (T3) data.
     """
 
-    https_params = {
-        "function": "T3",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "T3",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_macd(
@@ -1915,26 +2060,22 @@ async def fetch_macd(
     :argument: signalperiod (int): The signal period for the data.
     :argument: datatype (str): The response data type (default: "json").
 
-    :returns: The moving average convergence divergence (MACD) data.
-    """
-
-    https_params = {
-        "function": "MACD",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "series_type": series_type,
-        "fastperiod": fastperiod,
-        "slowperiod": slowperiod,
-        "signalperiod": signalperiod,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    :returns: The moving average convergence divergence (MACD) data.
+    """
+
+    return await _query(
+        "MACD",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "series_type": series_type,
+            "fastperiod": fastperiod,
+            "slowperiod": slowperiod,
+            "signalperiod": signalperiod,
+        },
+        datatype,
+    )
 
 
 async def fetch_macdext(
@@ -1968,26 +2109,22 @@ async def fetch_macdext(
     :returns: The moving average convergence divergence with controllable moving average type (MACDEXT) data.
     """
 
-    https_params = {
-        "function": "MACDEXT",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "series_type": series_type,
-        "fastperiod": fastperiod,
-        "slowperiod": slowperiod,
-        "signalperiod": signalperiod,
-        "fastmatype": fastmatype,
-        "slowmatype": slowmatype,
-        "signalmatype": signalmatype,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query(
+        "MACDEXT",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "series_type": series_type,
+            "fastperiod": fastperiod,
+            "slowperiod": slowperiod,
+            "signalperiod": signalperiod,
+            "fastmatype": fastmatype,
+            "slowmatype": slowmatype,
+            "signalmatype": signalmatype,
+        },
+        datatype,
+    )
 
 
 async def fetch_stoch(
@@ -2000,6 +2137,7 @@ async def fetch_stoch(
     slowkmatype: int = 0,
     slowdmatype: int = 0,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch stochastic oscillator (STOCH) data from the Alpha Vantage API.
@@ -2013,28 +2151,26 @@ async def fetch_stoch(
     :argument: slowkmatype (int): The slow K moving average type for the data.
     :argument: slowdmatype (int): The slow D moving average type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: The stochastic oscillator (STOCH) data.
     """
 
-    https_params = {
-        "function": "STOCH",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "fastkperiod": fastkperiod,
-        "slowkperiod": slowkperiod,
-        "slowdperiod": slowdperiod,
-        "slowkmatype": slowkmatype,
-        "slowdmatype": slowdmatype,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "STOCH",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "fastkperiod": fastkperiod,
+            "slowkperiod": slowkperiod,
+            "slowdperiod": slowdperiod,
+            "slowkmatype": slowkmatype,
+            "slowdmatype": slowdmatype,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_stochf(
@@ -2045,6 +2181,7 @@ async def fetch_stochf(
     fastdperiod: int = 3,
     fastdmatype: int = 0,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch stochastic oscillator fast (STOCHF) data from the Alpha Vantage API.
@@ -2056,26 +2193,24 @@ async def fetch_stochf(
     :argument: fastdperiod (int): The fast D period for the data.
     :argument: fastdmatype (int): The fast D moving average type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: The stochastic oscillator fast (STOCHF) data.
     """
 
-    https_params = {
-        "function": "STOCHF",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "fastkperiod": fastkperiod,
-        "fastdperiod": fastdperiod,
-        "fastdmatype": fastdmatype,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "STOCHF",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "fastkperiod": fastkperiod,
+            "fastdperiod": fastdperiod,
+            "fastdmatype": fastdmatype,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_rsi(
@@ -2085,6 +2220,7 @@ async def fetch_rsi(
     time_period: int = 14,
     series_type: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch relative strength index (RSI) data from the Alpha Vantage API.
@@ -2095,25 +2231,23 @@ async def fetch_rsi(
     :argument: time_period (int): The time period for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: The relative strength index (RSI) data.
     """
 
-    https_params = {
-        "function": "RSI",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "RSI",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_stochrsi(
@@ -2126,6 +2260,7 @@ async def fetch_stochrsi(
     fastdperiod: int = 3,
     fastdmatype: int = 0,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch stochastic relative strength index (STOCHRSI) data from the Alpha Vantage API.
@@ -2139,28 +2274,26 @@ async def fetch_stochrsi(
     :argument: fastdperiod (int): The fast D period for the data.
     :argument: fastdmatype (int): The fast D moving average type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: The stochastic relative strength index (STOCHRSI) data.
     """
 
-    https_params = {
-        "function": "STOCHRSI",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "series_type": series_type,
-        "fastkperiod": fastkperiod,
-        "fastdperiod": fastdperiod,
-        "fastdmatype": fastdmatype,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "STOCHRSI",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+            "series_type": series_type,
+            "fastkperiod": fastkperiod,
+            "fastdperiod": fastdperiod,
+            "fastdmatype": fastdmatype,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_willr(
@@ -2169,6 +2302,7 @@ async def fetch_willr(
     month: str = None,
     time_period: int = 14,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch Williams' %R (WILLR) data from the Alpha Vantage API.
@@ -2178,24 +2312,22 @@ async def fetch_willr(
     :argument: month (str): The month for the data.
     :argument: time_period (int): The time period for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Williams' %R (WILLR) data.
     """
 
-    https_params = {
-        "function": "WILLR",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "WILLR",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_adx(
@@ -2204,6 +2336,7 @@ async def fetch_adx(
     month: str = None,
     time_period: int = 14,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch average directional movement index (ADX) data from the Alpha Vantage API.
@@ -2213,24 +2346,22 @@ async def fetch_adx(
     :argument: month (str): The month for the data.
     :argument: time_period (int): The time period for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Average directional movement index (ADX) data.
     """
 
-    https_params = {
-        "function": "ADX",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "ADX",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_adxr(
@@ -2239,6 +2370,7 @@ async def fetch_adxr(
     month: str = None,
     time_period: int = 14,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch average directional movement index rating (ADXR) data from the Alpha Vantage API.
@@ -2248,24 +2380,22 @@ async def fetch_adxr(
     :argument: month (str): The month for the data.
     :argument: time_period (int): The time period for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Average directional movement index rating (ADXR) data.
     """
 
-    https_params = {
-        "function": "ADXR",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "ADXR",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_apo(
@@ -2293,23 +2423,19 @@ async def fetch_apo(
     :returns: Absolute price oscillator (APO) data.
     """
 
-    https_params = {
-        "function": "APO",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "series_type": series_type,
-        "fastperiod": fastperiod,
-        "slowperiod": slowperiod,
-        "matype": matype,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query(
+        "APO",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "series_type": series_type,
+            "fastperiod": fastperiod,
+            "slowperiod": slowperiod,
+            "matype": matype,
+        },
+        datatype,
+    )
 
 
 async def fetch_ppo(
@@ -2337,23 +2463,19 @@ async def fetch_ppo(
     :returns: Percentage price oscillator (PPO) data.
     """
 
-    https_params = {
-        "function": "PPO",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "series_type": series_type,
-        "fastperiod": fastperiod,
-        "slowperiod": slowperiod,
-        "matype": matype,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query(
+        "PPO",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "series_type": series_type,
+            "fastperiod": fastperiod,
+            "slowperiod": slowperiod,
+            "matype": matype,
+        },
+        datatype,
+    )
 
 
 async def fetch_mom(
@@ -2363,6 +2485,7 @@ async def fetch_mom(
     time_period: int = 10,
     series_type: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch momentum (MOM) data from the Alpha Vantage API.
@@ -2373,25 +2496,23 @@ async def fetch_mom(
     :argument: time_period (int): The time period for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Momentum (MOM) data.
     """
 
-    https_params = {
-        "function": "MOM",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "MOM",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_bop(
@@ -2399,6 +2520,7 @@ async def fetch_bop(
     interval: str = None,
     month: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch balance of power (BOP) data from the Alpha Vantage API.
@@ -2407,23 +2529,17 @@ async def fetch_bop(
     :argument: interval (str): The time interval for the data.
     :argument: month (str): The month for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Balance of power (BOP) data.
     """
 
-    https_params = {
-        "function": "BOP",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "BOP",
+        {"symbol": symbol, "interval": interval, "month": month},
+        datatype,
+        source,
+    )
 
 
 async def fetch_cci(
@@ -2432,6 +2548,7 @@ async def fetch_cci(
     month: str = None,
     time_period: int = 20,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch commodity channel index (CCI) data from the Alpha Vantage API.
@@ -2441,24 +2558,22 @@ async def fetch_cci(
     :argument: month (str): The month for the data.
     :argument: time_period (int): The time period for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Commodity channel index (CCI) data.
     """
 
-    https_params = {
-        "function": "CCI",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "CCI",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_cmo(
@@ -2468,6 +2583,7 @@ async def fetch_cmo(
     time_period: int = 14,
     series_type: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch Chande momentum oscillator (CMO) data from the Alpha Vantage API.
@@ -2478,25 +2594,23 @@ async def fetch_cmo(
     :argument: time_period (int): The time period for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Chande momentum oscillator (CMO) data.
     """
 
-    https_params = {
-        "function": "CMO",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "CMO",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_roc(
@@ -2506,6 +2620,7 @@ async def fetch_roc(
     time_period: int = 10,
     series_type: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch rate of change (ROC) data from the Alpha Vantage API.
@@ -2516,25 +2631,23 @@ async def fetch_roc(
     :argument: time_period (int): The time period for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Rate of change (ROC) data.
     """
 
-    https_params = {
-        "function": "ROC",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "ROC",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_rocr(
@@ -2544,6 +2657,7 @@ async def fetch_rocr(
     time_period: int = 10,
     series_type: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch rate of change ratio (ROCR) data from the Alpha Vantage API.
@@ -2554,25 +2668,23 @@ async def fetch_rocr(
     :argument: time_period (int): The time period for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Rate of change ratio (ROCR) data.
     """
 
-    https_params = {
-        "function": "ROCR",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "ROCR",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_aroon(
@@ -2581,6 +2693,7 @@ async def fetch_aroon(
     month: str = None,
     time_period: int = 14,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch aroon (AROON) data from the Alpha Vantage API.
@@ -2590,24 +2703,22 @@ async def fetch_aroon(
     :argument: month (str): The month for the data.
     :argument: time_period (int): The time period for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Aroon (AROON) data.
     """
 
-    https_params = {
-        "function": "AROON",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "AROON",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_aroonosc(
@@ -2616,6 +2727,7 @@ async def fetch_aroonosc(
     month: str = None,
     time_period: int = 14,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch aroon oscillator (AROONOSC) data from the Alpha Vantage API.
@@ -2625,24 +2737,22 @@ async def fetch_aroonosc(
     :argument: month (str): The month for the data.
     :argument: time_period (int): The time period for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Aroon oscillator (AROONOSC) data.
     """
 
-    https_params = {
-        "function": "AROONOSC",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "AROONOSC",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_mfi(
@@ -2651,6 +2761,7 @@ async def fetch_mfi(
     month: str = None,
     time_period: int = 14,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch money flow index (MFI) data from the Alpha Vantage API.
@@ -2660,24 +2771,22 @@ async def fetch_mfi(
     :argument: month (str): The month for the data.
     :argument: time_period (int): The time period for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Money flow index (MFI) data.
     """
 
-    https_params = {
-        "function": "MFI",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "MFI",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_trix(
@@ -2701,21 +2810,17 @@ async def fetch_trix(
     :returns: Triple exponential average (TRIX) data.
     """
 
-    https_params = {
-        "function": "TRIX",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await _query(
+        "TRIX",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+            "series_type": series_type,
+        },
+        datatype,
+    )
 
 
 async def fetch_ultosc(
@@ -2726,6 +2831,7 @@ async def fetch_ultosc(
     timeperiod2: int = 14,
     timeperiod3: int = 28,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch ultimate oscillator (ULTOSC) data from the Alpha Vantage API.
@@ -2737,26 +2843,24 @@ async def fetch_ultosc(
     :argument: timeperiod2 (int): The time period for the second calculation.
     :argument: timeperiod3 (int): The time period for the third calculation.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Ultimate oscillator (ULTOSC) data.
     """
 
-    https_params = {
-        "function": "ULTOSC",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "timeperiod1": timeperiod1,
-        "timeperiod2": timeperiod2,
-        "timeperiod3": timeperiod3,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "ULTOSC",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "timeperiod1": timeperiod1,
+            "timeperiod2": timeperiod2,
+            "timeperiod3": timeperiod3,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_dx(
@@ -2765,6 +2869,7 @@ async def fetch_dx(
     month: str = None,
     time_period: int = 14,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch directional movement index (DX) data from the Alpha Vantage API.
@@ -2774,24 +2879,22 @@ async def fetch_dx(
     :argument: month (str): The month for the data.
     :argument: time_period (int): The time period for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Directional movement index (DX) data.
     """
 
-    https_params = {
-        "function": "DX",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "DX",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_minus_di(
@@ -2800,6 +2903,7 @@ async def fetch_minus_di(
     month: str = None,
     time_period: int = 14,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch minus directional indicator (MINUS_DI) data from the Alpha Vantage API.
@@ -2809,24 +2913,22 @@ async def fetch_minus_di(
     :argument: month (str): The month for the data.
     :argument: time_period (int): The time period for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Minus directional indicator (MINUS_DI) data.
     """
 
-    https_params = {
-        "function": "MINUS_DI",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "MINUS_DI",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_plus_di(
@@ -2835,6 +2937,7 @@ async def fetch_plus_di(
     month: str = None,
     time_period: int = 14,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch plus directional indicator (PLUS_DI) data from the Alpha Vantage API.
@@ -2844,24 +2947,22 @@ async def fetch_plus_di(
     :argument: month (str): The month for the data.
     :argument: time_period (int): The time period for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Plus directional indicator (PLUS_DI) data.
     """
 
-    https_params = {
-        "function": "PLUS_DI",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "PLUS_DI",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_minus_dm(
@@ -2870,6 +2971,7 @@ async def fetch_minus_dm(
     month: str = None,
     time_period: int = 14,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch minus directional movement (MINUS_DM) data from the Alpha Vantage API.
@@ -2879,24 +2981,22 @@ async def fetch_minus_dm(
     :argument: month (str): The month for the data.
     :argument: time_period (int): The time period for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Minus directional movement (MINUS_DM) data.
     """
 
-    https_params = {
-        "function": "MINUS_DM",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "MINUS_DM",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_plus_dm(
@@ -2905,6 +3005,7 @@ async def fetch_plus_dm(
     month: str = None,
     time_period: int = 14,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch plus directional movement (PLUS_DM) data from the Alpha Vantage API.
@@ -2914,24 +3015,22 @@ async def fetch_plus_dm(
     :argument: month (str): The month for the data.
     :argument: time_period (int): The time period for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Plus directional movement (PLUS_DM) data.
     """
 
-    https_params = {
-        "function": "PLUS_DM",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "PLUS_DM",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_bbands(
@@ -2944,6 +3043,7 @@ async def fetch_bbands(
     nbdevdn: int = 2,
     matype: int = 0,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch bollinger bands (BBANDS) data from the Alpha Vantage API.
@@ -2957,28 +3057,26 @@ async def fetch_bbands(
     :argument: nbdevdn (int): The standard deviation multiplier for the lower band.
     :argument: matype (int): The moving average type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Bollinger bands (BBANDS) data.
     """
 
-    https_params = {
-        "function": "BBANDS",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "series_type": series_type,
-        "nbdevup": nbdevup,
-        "nbdevdn": nbdevdn,
-        "matype": matype,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "BBANDS",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+            "series_type": series_type,
+            "nbdevup": nbdevup,
+            "nbdevdn": nbdevdn,
+            "matype": matype,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_midpoint(
@@ -2988,6 +3086,7 @@ async def fetch_midpoint(
     time_period: int = 14,
     series_type: str = "close",
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch midpoint (MIDPOINT) data from the Alpha Vantage API.
@@ -2998,25 +3097,23 @@ async def fetch_midpoint(
     :argument: time_period (int): The time period for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Midpoint (MIDPOINT) data.
     """
 
-    https_params = {
-        "function": "MIDPOINT",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "MIDPOINT",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_midprice(
@@ -3025,6 +3122,7 @@ async def fetch_midprice(
     month: str = None,
     time_period: int = 14,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch midprice (MIDPRICE) data from the Alpha Vantage API.
@@ -3034,24 +3132,22 @@ async def fetch_midprice(
     :argument: month (str): The month for the data.
     :argument: time_period (int): The time period for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Midprice (MIDPRICE) data.
     """
 
-    https_params = {
-        "function": "MIDPRICE",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "MIDPRICE",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_sar(
@@ -3061,6 +3157,7 @@ async def fetch_sar(
     acceleration: float = 0.02,
     maximum: float = 0.2,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch parabolic SAR (SAR) data from the Alpha Vantage API.
@@ -3071,25 +3168,23 @@ async def fetch_sar(
     :argument: acceleration (float): The acceleration factor for the data.
     :argument: maximum (float): The maximum factor for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Parabolic SAR (SAR) data.
     """
 
-    https_params = {
-        "function": "SAR",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "acceleration": acceleration,
-        "maximum": maximum,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "SAR",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "acceleration": acceleration,
+            "maximum": maximum,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_trange(
@@ -3097,6 +3192,7 @@ async def fetch_trange(
     interval: str = None,
     month: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch true range (TRANGE) data from the Alpha Vantage API.
@@ -3105,23 +3201,17 @@ async def fetch_trange(
     :argument: interval (str): The time interval for the data.
     :argument: month (str): The month for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: True range (TRANGE) data.
     """
 
-    https_params = {
-        "function": "TRANGE",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "TRANGE",
+        {"symbol": symbol, "interval": interval, "month": month},
+        datatype,
+        source,
+    )
 
 
 async def fetch_atr(
@@ -3130,6 +3220,7 @@ async def fetch_atr(
     month: str = None,
     time_period: int = 14,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch average true range (ATR) data from the Alpha Vantage API.
@@ -3139,24 +3230,22 @@ async def fetch_atr(
     :argument: month (str): The month for the data.
     :argument: time_period (int): The time period for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Average true range (ATR) data.
     """
 
-    https_params = {
-        "function": "ATR",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "ATR",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_natr(
@@ -3165,6 +3254,7 @@ async def fetch_natr(
     month: str = None,
     time_period: int = 14,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch normalized average true range (NATR) data from the Alpha Vantage API.
@@ -3174,24 +3264,22 @@ async def fetch_natr(
     :argument: month (str): The month for the data.
     :argument: time_period (int): The time period for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Normalized average true range (NATR) data.
     """
 
-    https_params = {
-        "function": "NATR",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "time_period": time_period,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "NATR",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "time_period": time_period,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_ad(
@@ -3199,6 +3287,7 @@ async def fetch_ad(
     interval: str = None,
     month: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch accumulation/distribution (AD) data from the Alpha Vantage API.
@@ -3207,23 +3296,17 @@ async def fetch_ad(
     :argument: interval (str): The time interval for the data.
     :argument: month (str): The month for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Accumulation/distribution (AD) data.
     """
 
-    https_params = {
-        "function": "AD",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "AD",
+        {"symbol": symbol, "interval": interval, "month": month},
+        datatype,
+        source,
+    )
 
 
 async def fetch_adosc(
@@ -3233,6 +3316,7 @@ async def fetch_adosc(
     fastperiod: int = 3,
     slowperiod: int = 10,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch accumulation/distribution oscillator (ADOSC) data from the Alpha Vantage API.
@@ -3243,25 +3327,23 @@ async def fetch_adosc(
     :argument: fastperiod (int): The fast period for the data.
     :argument: slowperiod (int): The slow period for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Accumulation/distribution oscillator (ADOSC) data.
     """
 
-    https_params = {
-        "function": "ADOSC",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "fastperiod": fastperiod,
-        "slowperiod": slowperiod,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "ADOSC",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "fastperiod": fastperiod,
+            "slowperiod": slowperiod,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_obv(
@@ -3269,6 +3351,7 @@ async def fetch_obv(
     interval: str = None,
     month: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch on balance volume (OBV) data from the Alpha Vantage API.
@@ -3277,23 +3360,17 @@ async def fetch_obv(
     :argument: interval (str): The time interval for the data.
     :argument: month (str): The month for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: On balance volume (OBV) data.
     """
 
-    https_params = {
-        "function": "OBV",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "OBV",
+        {"symbol": symbol, "interval": interval, "month": month},
+        datatype,
+        source,
+    )
 
 
 async def fetch_ht_trendline(
@@ -3302,6 +3379,7 @@ async def fetch_ht_trendline(
     month: str = None,
     series_type: str = "close",
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch Hilbert transform - instantaneous trendline (HT_TRENDLINE) data from the Alpha Vantage API.
@@ -3311,24 +3389,22 @@ async def fetch_ht_trendline(
     :argument: month (str): The month for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Hilbert transform - instantaneous trendline (HT_TRENDLINE) data.
     """
 
-    https_params = {
-        "function": "HT_TRENDLINE",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "HT_TRENDLINE",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_ht_sine(
@@ -3337,6 +3413,7 @@ async def fetch_ht_sine(
     month: str = None,
     series_type: str = "close",
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch Hilbert transform - sine wave (HT_SINE) data from the Alpha Vantage API.
@@ -3346,24 +3423,22 @@ async def fetch_ht_sine(
     :argument: month (str): The month for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Hilbert transform - sine wave (HT_SINE) data.
     """
 
-    https_params = {
-        "function": "HT_SINE",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "HT_SINE",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_ht_trendmode(
@@ -3371,6 +3446,7 @@ async def fetch_ht_trendmode(
     interval: str = None,
     month: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch Hilbert transform - trend vs cycle mode (HT_TRENDMODE) data from the Alpha Vantage API.
@@ -3379,23 +3455,17 @@ async def fetch_ht_trendmode(
     :argument: interval (str): The time interval for the data.
     :argument: month (str): The month for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Hilbert transform - trend vs cycle mode (HT_TRENDMODE) data.
     """
 
-    https_params = {
-        "function": "HT_TRENDMODE",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "HT_TRENDMODE",
+        {"symbol": symbol, "interval": interval, "month": month},
+        datatype,
+        source,
+    )
 
 
 async def fetch_ht_dcperiod(
@@ -3404,6 +3474,7 @@ async def fetch_ht_dcperiod(
     month: str = None,
     series_type: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch Hil bert transform - dominant cycle period (HT_DCPERIOD) data from the Alpha Vantage API.
@@ -3413,24 +3484,22 @@ async def fetch_ht_dcperiod(
     :argument: month (str): The month for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Hilbert transform - dominant cycle period (HT_DCPERIOD) data.
     """
 
-    https_params = {
-        "function": "HT_DCPERIOD",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "HT_DCPERIOD",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_ht_dcphase(
@@ -3439,6 +3508,7 @@ async def fetch_ht_dcphase(
     month: str = None,
     series_type: str = None,
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch Hilbert transform - dominant cycle phase (HT_DCPHASE) data from the Alpha Vantage API.
@@ -3448,24 +3518,22 @@ async def fetch_ht_dcphase(
     :argument: month (str): The month for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Hilbert transform - dominant cycle phase (HT_DCPHASE) data.
     """
 
-    https_params = {
-        "function": "HT_DCPHASE",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "HT_DCPHASE",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
 
 
 async def fetch_ht_phasor(
@@ -3474,6 +3542,7 @@ async def fetch_ht_phasor(
     month: str = None,
     series_type: str = "close",
     datatype: str = "json",
+    source: str | None = None,
 ) -> dict[str, str] | str:
     """
     Fetch Hilbert transform - phasor components (HT_PHASOR) data from the Alpha Vantage API.
@@ -3483,21 +3552,19 @@ async def fetch_ht_phasor(
     :argument: month (str): The month for the data.
     :argument: series_type (str): The series type for the data.
     :argument: datatype (str): The response data type (default: "json").
+    :argument: source (str): "local" to compute from the cached daily or intraday series, "remote" to call the endpoint, "auto" for local when possible (default: ALPHAVANTAGE_INDICATOR_SOURCE).
 
     :returns: Hilbert transform - phasor components (HT_PHASOR) data.
     """
 
-    https_params = {
-        "function": "HT_PHASOR",
-        "symbol": symbol,
-        "interval": interval,
-        "month": month,
-        "series_type": series_type,
-        "datatype": datatype,
-        "apikey": API_KEY,
-    }
-
-    async with httpx.AsyncClient() as client:
-        response = await client.get(API_BASE_URL, params=https_params)
-        response.raise_for_status()
-        return response.text if datatype == "csv" else response.json()
+    return await local_indicators.run(
+        "HT_PHASOR",
+        {
+            "symbol": symbol,
+            "interval": interval,
+            "month": month,
+            "series_type": series_type,
+        },
+        datatype,
+        source,
+    )
@@ -0,0 +1,380 @@
+import asyncio
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from alphavantage_mcp_server import serialization
+from alphavantage_mcp_server.persistent_cache import SQLiteCache
+from alphavantage_mcp_server.throttle import UPSTREAM_ERRORS
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TTL = MINUTE
+DEFAULT_STALE_GRACE = 5 * MINUTE
+
+# How long a response stays fresh, per Alpha Vantage function. Functions not
+# listed here are looked up by their `interval` parameter, then DEFAULT_TTL.
+FUNCTION_TTLS: dict[str, float] = {
+    # Quotes and market snapshots
+    "GLOBAL_QUOTE": 15,
+    "REALTIME_BULK_QUOTES": 15,
+    "CURRENCY_EXCHANGE_RATE": 15,
+    "REALTIME_OPTIONS": 30,
+    "MARKET_STATUS": MINUTE,
+    "TOP_GAINERS_LOSERS": 5 * MINUTE,
+    "NEWS_SENTIMENT": 5 * MINUTE,
+    # Daily, weekly and monthly series
+    "TIME_SERIES_DAILY": 4 * HOUR,
+    "TIME_SERIES_DAILY_ADJUSTED": 4 * HOUR,
+    "TIME_SERIES_WEEKLY": 12 * HOUR,
+    "TIME_SERIES_WEEKLY_ADJUSTED": 12 * HOUR,
+    "TIME_SERIES_MONTHLY": 12 * HOUR,
+    "TIME_SERIES_MONTHLY_ADJUSTED": 12 * HOUR,
+    "FX_DAILY": 4 * HOUR,
+    "FX_WEEKLY": 12 * HOUR,
+    "FX_MONTHLY": 12 * HOUR,
+    "DIGITAL_CURRENCY_DAILY": 4 * HOUR,
+    "DIGITAL_CURRENCY_WEEKLY": 12 * HOUR,
+    "DIGITAL_CURRENCY_MONTHLY": 12 * HOUR,
+    "HISTORICAL_OPTIONS": DAY,
+    "ANALYTICS_FIXED_WINDOW": HOUR,
+    "ANALYTICS_SLIDING_WINDOW": HOUR,
+    # Fundamentals and reference data
+    "OVERVIEW": DAY,
+    "ETF_PROFILE": DAY,
+    "DIVIDENDS": DAY,
+    "SPLITS": DAY,
+    "INCOME_STATEMENT": DAY,
+    "BALANCE_SHEET": DAY,
+    "CASH_FLOW": DAY,
+    "EARNINGS": DAY,
+    "EARNINGS_CALL_TRANSCRIPT": 7 * DAY,
+    "INSIDER_TRANSACTIONS": 12 * HOUR,
+    "LISTING_STATUS": DAY,
+    "EARNINGS_CALENDAR": 12 * HOUR,
+    "IPO_CALENDAR": 12 * HOUR,
+    "SYMBOL_SEARCH": DAY,
+    # Commodities and economic indicators
+    "WTI": 6 * HOUR,
+    "BRENT": 6 * HOUR,
+    "NATURAL_GAS": 6 * HOUR,
+    "COPPER": 6 * HOUR,
+    "ALUMINUM": 6 * HOUR,
+    "WHEAT": 6 * HOUR,
+    "CORN": 6 * HOUR,
+    "COTTON": 6 * HOUR,
+    "SUGAR": 6 * HOUR,
+    "COFFEE": 6 * HOUR,
+    "ALL_COMMODITIES": 6 * HOUR,
+    "REAL_GDP": 12 * HOUR,
+    "REAL_GDP_PER_CAPITA": 12 * HOUR,
+    "TREASURY_YIELD": 6 * HOUR,
+    "FEDERAL_FUNDS_RATE": 6 * HOUR,
+    "CPI": 12 * HOUR,
+    "INFLATION": 12 * HOUR,
+    "RETAIL_SALES": 12 * HOUR,
+    "DURABLES": 12 * HOUR,
+    "UNEMPLOYMENT": 12 * HOUR,
+    "NONFARM_PAYROLL": 12 * HOUR,
+}
+
+# Freshness of intraday series and technical indicators, by `interval`.
+INTERVAL_TTLS: dict[str, float] = {
+    "1min": MINUTE,
+    "5min": MINUTE,
+    "15min": MINUTE,
+    "30min": MINUTE,
+    "60min": MINUTE,
+    "daily": 4 * HOUR,
+    "weekly": 12 * HOUR,
+    "monthly": 12 * HOUR,
+    "quarterly": 12 * HOUR,
+    "annual": 12 * HOUR,
+}
+
+
+def ttl_for(query) -> float:
+    """
+    How long the response to a query may be served from the cache.
+
+    :argument: query (Query): The query.
+
+    :returns: The time to live in seconds.
+    """
+    if query.function in FUNCTION_TTLS:
+        return FUNCTION_TTLS[query.function]
+    interval = dict(query.params).get("interval")
+    return INTERVAL_TTLS.get(interval, DEFAULT_TTL)
+
+
+def payload_size(value: Any) -> int:
+    """
+    The approximate memory footprint of a response, as its encoded size in bytes.
+    """
+    if isinstance(value, str):
+        return len(value.encode())
+    if hasattr(value, "nbytes"):
+        return value.nbytes
+    return len(serialization.dumps(value).encode())
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    size: int
+    fetched_at: float
+    expires_at: float
+    stale_until: float
+
+
+@dataclass(frozen=True)
+class Freshness:
+    """
+    Where a response came from and how old it is.
+
+    `source` is "upstream", "memory" or "store"; `stale` is set when the
+    response outlived its TTL and is being revalidated in the background.
+    """
+
+    source: str
+    fetched_at: float
+    age: float
+    stale: bool
+
+
+# The freshness of the last response returned to the current task.
+response_freshness: ContextVar[Freshness | None] = ContextVar(
+    "response_freshness", default=None
+)
+
+
+class ResponseCache:
+    """
+    A bounded in-memory LRU cache of decoded responses keyed on canonical
+    query parameters. Entries expire after a per-function TTL (see `ttl_for`)
+    and the least recently used ones are evicted once `max_bytes` is exceeded.
+
+    Expired entries are still served for a grace window of up to `stale_grace`
+    seconds (never more than the TTL itself) while a single background task
+    refreshes them: stale-while-revalidate.
+
+    When a persistent `store` is given it acts as a second tier: memory misses
+    are looked up there before going upstream, and every fetched response is
+    written to both.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl: Callable[[Any], float] = ttl_for,
+        clock: Callable[[], float] = time.time,
+        store: SQLiteCache | None = None,
+        stale_grace: float = DEFAULT_STALE_GRACE,
+    ):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.store = store
+        self.stale_grace = stale_grace
+        self._clock = clock
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._refreshing: dict[str, asyncio.Task] = {}
+        self.bytes = 0
+        self.hits = 0
+        self.store_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    @classmethod
+    def from_env(cls) -> "ResponseCache":
+        """
+        Build a cache from the environment.
+
+        ALPHAVANTAGE_CACHE_MAX_BYTES caps the in-memory cache size; 0 disables it.
+        ALPHAVANTAGE_CACHE_PATH enables the persistent SQLite tier.
+        ALPHAVANTAGE_CACHE_STALE_GRACE is the stale-while-revalidate window in
+        seconds; 0 disables it.
+
+        :returns: The configured ResponseCache.
+        """
+        return cls(
+            int(os.getenv("ALPHAVANTAGE_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)),
+            store=SQLiteCache.from_env(),
+            stale_grace=float(
+                os.getenv("ALPHAVANTAGE_CACHE_STALE_GRACE", DEFAULT_STALE_GRACE)
+            ),
+        )
+
+    def grace_for(self, ttl: float) -> float:
+        """
+        How long past its TTL a response may still be served stale.
+        """
+        return min(self.stale_grace, ttl)
+
+    def _remove(self, key: str) -> CacheEntry:
+        entry = self._entries.pop(key)
+        self.bytes -= entry.size
+        return entry
+
+    def get(self, key: str) -> CacheEntry | None:
+        """
+        Look up an entry that is fresh or within its grace window, marking it
+        as recently used.
+
+        :argument: key (str): The query key.
+
+        :returns: The entry, or None if it is missing or past its grace window.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.stale_until <= self._clock():
+            self._remove(key)
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        fetched_at: float | None = None,
+        grace: float = 0,
+    ) -> None:
+        """
+        Store a response, evicting least recently used entries to make room.
+
+        :argument: key (str): The query key.
+        :argument: value (Any): The decoded response.
+        :argument: ttl (float): The time to live in seconds.
+        :argument: fetched_at (float): When the response was fetched (default: now).
+        :argument: grace (float): How long it may be served stale after its TTL (default: 0).
+        """
+        if ttl <= 0 or self.max_bytes <= 0:
+            return
+        size = payload_size(value)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        while self.bytes + size > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+        fetched_at = self._clock() if fetched_at is None else fetched_at
+        expires_at = fetched_at + ttl
+        self._entries[key] = CacheEntry(
+            value, size, fetched_at, expires_at, expires_at + grace
+        )
+        self.bytes += size
+
+    def clear(self) -> None:
+        """
+        Drop every entry.
+        """
+        self._entries.clear()
+        self.bytes = 0
+
+    async def _save(self, query, result: Any, ttl: float) -> float:
+        fetched_at = self._clock()
+        grace = self.grace_for(ttl)
+        self.put(query.key, result, ttl, fetched_at, grace)
+        if self.store is not None and ttl > 0:
+            await self.store.put(
+                query.key, query.function, result, fetched_at, ttl + grace
+            )
+        return fetched_at
+
+    async def _refresh(self, query, call_next, ttl: float) -> None:
+        try:
+            result = await call_next(query)
+        except UPSTREAM_ERRORS:
+            self.refresh_errors += 1
+            return
+        self.refreshes += 1
+        await self._save(query, result, ttl)
+
+    def _forget_refresh(self, key: str, task: asyncio.Task) -> None:
+        if self._refreshing.get(key) is task:
+            del self._refreshing[key]
+
+    def _revalidate(self, query, call_next, ttl: float) -> None:
+        key = query.key
+        task = self._refreshing.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            return
+        task = asyncio.ensure_future(self._refresh(query, call_next, ttl))
+        self._refreshing[key] = task
+        task.add_done_callback(lambda done: self._forget_refresh(key, done))
+
+    def _serve(self, query, call_next, value: Any, fetched_at: float, source: str, ttl: float):
+        age = self._clock() - fetched_at
+        stale = age >= ttl
+        if stale:
+            self.stale_hits += 1
+            self._revalidate(query, call_next, ttl)
+        response_freshness.set(Freshness(source, fetched_at, age, stale))
+        return value
+
+    async def middleware(self, query, call_next):
+        """
+        Request middleware serving fresh (or, within the grace window, stale)
+        responses from the cache.
+        """
+        if self.max_bytes <= 0 and self.store is None:
+            return await call_next(query)
+
+        ttl = self.ttl(query)
+        entry = self.get(query.key)
+        if entry is not None:
+            self.hits += 1
+            return self._serve(query, call_next, entry.value, entry.fetched_at, "memory", ttl)
+
+        if self.store is not None and ttl > 0:
+            stored = await self.store.get(query.key)
+            grace = self.grace_for(ttl)
+            if stored is not None and stored.fetched_at + ttl + grace > self._clock():
+                self.store_hits += 1
+                self.put(query.key, stored.value, ttl, stored.fetched_at, grace)
+                return self._serve(
+                    query, call_next, stored.value, stored.fetched_at, "store", ttl
+                )
+
+        self.misses += 1
+        result = await call_next(query)
+        fetched_at = await self._save(query, result, ttl)
+        response_freshness.set(Freshness("upstream", fetched_at, 0.0, False))
+        return result
+
+    def status(self) -> dict:
+        """
+        Cache size and hit/miss/eviction counters since startup.
+        """
+        lookups = self.hits + self.store_hits + self.misses
+        hits = self.hits + self.store_hits
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "store_hits": self.store_hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else None,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+            "store": self.store.status() if self.store is not None else None,
+        }
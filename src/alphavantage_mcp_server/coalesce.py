@@ -0,0 +1,49 @@
+import asyncio
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical queries into one upstream request.
+
+    The first caller for a query key starts the request as a task; callers
+    arriving while it is in flight await the same task and receive the same
+    result (or exception). The task is shielded, so a cancelled caller does not
+    cancel the request for everyone else.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self.requests = 0
+        self.coalesced = 0
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller went away.
+            task.exception()
+
+    async def middleware(self, query, call_next):
+        """
+        Request middleware sharing one in-flight request per query key.
+        """
+        key = query.key
+        task = self._in_flight.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            self.requests += 1
+            task = asyncio.ensure_future(call_next(query))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def status(self) -> dict:
+        """
+        Coalescing counters since startup.
+        """
+        return {
+            "upstream_requests": self.requests,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
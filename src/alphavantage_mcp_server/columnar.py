@@ -0,0 +1,171 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without the extra
+    np = None
+
+from alphavantage_mcp_server.timeseries import split_payload
+
+# Parsed payloads are remembered by identity, so a response served again from
+# the cache is not parsed again. The payload is kept alive with its parse.
+PARSE_MEMO_SIZE = 32
+
+
+def require_numpy():
+    """
+    Raise a helpful error when numpy is not installed.
+
+    :raises ImportError: If numpy is missing.
+    """
+    if np is None:
+        raise ImportError(
+            "numpy is required for columnar series; install alphavantage[numpy]"
+        )
+
+
+def column_name(field_name: str) -> str:
+    """The column name of an Alpha Vantage field, e.g. "5. adjusted close" -> "adjusted_close"."""
+    return field_name.split(". ", 1)[-1].replace(" ", "_")
+
+
+@dataclass
+class OHLCVSeries:
+    """
+    A time series response in columnar form: a sorted datetime64 index and
+    one float64 (or int64, for whole-number volumes) array per field.
+
+    `fields` keeps the original field names, so the series can be turned back
+    into the Alpha Vantage payload it came from.
+    """
+
+    name: str
+    meta: dict
+    index: "np.ndarray"
+    columns: dict[str, "np.ndarray"]
+    fields: dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> "OHLCVSeries":
+        """
+        Parse a time series payload in one pass over its bars.
+
+        :argument: payload (dict): A decoded time series response.
+
+        :returns: The columnar series, oldest bar first.
+
+        :raises ValueError: If the payload holds no time series.
+        """
+        require_numpy()
+        found = split_payload(payload)
+        if found is None:
+            raise ValueError("payload holds no time series")
+        name, bars = found
+
+        field_names = list(next(iter(bars.values()), {}))
+        timestamps = []
+        values = [[] for _ in field_names]
+        for timestamp, bar in bars.items():
+            timestamps.append(timestamp)
+            for column, field_name in zip(values, field_names):
+                column.append(bar[field_name])
+
+        index = np.array(timestamps, dtype="datetime64[s]")
+        order = np.argsort(index, kind="stable")
+        columns = {}
+        for field_name, column in zip(field_names, values):
+            columns[column_name(field_name)] = _parse_column(field_name, column)[order]
+        return cls(
+            name,
+            dict(payload.get("Meta Data", {})),
+            index[order],
+            columns,
+            {column_name(field_name): field_name for field_name in field_names},
+        )
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, name: str) -> "np.ndarray":
+        return self.columns[name]
+
+    @property
+    def nbytes(self) -> int:
+        """The memory held by the arrays."""
+        return self.index.nbytes + sum(column.nbytes for column in self.columns.values())
+
+    def tail(self, count: int) -> "OHLCVSeries":
+        """The latest `count` bars."""
+        return OHLCVSeries(
+            self.name,
+            self.meta,
+            self.index[-count:],
+            {name: column[-count:] for name, column in self.columns.items()},
+            self.fields,
+        )
+
+    def timestamps(self) -> list[str]:
+        """The index as Alpha Vantage timestamps: dates for daily bars, date and time otherwise."""
+        unit = "D" if (self.index.astype("datetime64[D]") == self.index).all() else "s"
+        text = np.datetime_as_string(self.index, unit=unit)
+        return [timestamp.replace("T", " ") for timestamp in text.tolist()]
+
+    def to_payload(self) -> dict:
+        """
+        Turn the series back into an Alpha Vantage payload, newest bar first.
+
+        :returns: The decoded response shape, with values formatted as strings.
+        """
+        formatted = {
+            self.fields.get(name, name): _format_column(column)
+            for name, column in self.columns.items()
+        }
+        timestamps = self.timestamps()
+        bars = {}
+        for position in range(len(timestamps) - 1, -1, -1):
+            bars[timestamps[position]] = {
+                name: column[position] for name, column in formatted.items()
+            }
+        return {"Meta Data": self.meta, self.name: bars}
+
+
+def _parse_column(field_name: str, values: list[str]) -> "np.ndarray":
+    if field_name.endswith("volume"):
+        try:
+            return np.array(values, dtype=np.int64)
+        except ValueError:
+            pass
+    return np.array(values, dtype=np.float64)
+
+
+def _format_column(column: "np.ndarray") -> list[str]:
+    if column.dtype.kind == "i":
+        return [str(value) for value in column.tolist()]
+    return [f"{value:.4f}" for value in column.tolist()]
+
+
+_parsed: OrderedDict[int, tuple[dict, OHLCVSeries]] = OrderedDict()
+
+
+def to_columnar(payload: dict) -> OHLCVSeries:
+    """
+    Parse a time series payload, reusing the parse of a payload seen before.
+
+    Responses served from the response cache or the series store are the same
+    objects on every hit, so they are parsed only once.
+
+    :argument: payload (dict): A decoded time series response.
+
+    :returns: The columnar series.
+    """
+    key = id(payload)
+    memo = _parsed.get(key)
+    if memo is not None and memo[0] is payload:
+        _parsed.move_to_end(key)
+        return memo[1]
+    series = OHLCVSeries.from_payload(payload)
+    _parsed[key] = (payload, series)
+    while len(_parsed) > PARSE_MEMO_SIZE:
+        _parsed.popitem(last=False)
+    return series
@@ -0,0 +1,157 @@
+import csv
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+DEFAULT_BATCH_SIZE = 1000
+
+# Spellings Alpha Vantage uses for a missing value in CSV responses.
+NULLS = frozenset({"", "null", "None", "-"})
+
+
+def _is_padded(text: str) -> bool:
+    # Zero-padded codes are identifiers, not numbers.
+    digits = text.removeprefix("-")
+    return len(digits) > 1 and digits.startswith("0") and digits.isdigit()
+
+
+def _is_int(text: str) -> bool:
+    digits = text.removeprefix("-")
+    return digits.isdigit() and not _is_padded(text)
+
+
+def _is_float(text: str) -> bool:
+    if _is_padded(text):
+        return False
+    try:
+        float(text)
+    except ValueError:
+        return False
+    return True
+
+
+def infer_type(values: list[str]) -> Callable[[str], Any]:
+    """
+    The narrowest type every non-null value of a column sample fits in.
+
+    :argument: values (list[str]): A sample of the column's values.
+
+    :returns: int, float or str.
+    """
+    present = [value for value in values if value not in NULLS]
+    if present and all(_is_int(value) for value in present):
+        return int
+    if present and all(_is_float(value) for value in present):
+        return float
+    return str
+
+
+def _convert(value: str, kind: Callable[[str], Any]) -> Any:
+    if value in NULLS:
+        return None
+    try:
+        return kind(value)
+    except ValueError:
+        # A value that doesn't fit the type inferred from the first batch is
+        # kept as text rather than failing the whole stream.
+        return value
+
+
+@dataclass
+class CSVBatch:
+    """
+    A batch of CSV rows as typed columns.
+
+    `start` is the position of the batch's first row in the whole response.
+    """
+
+    columns: dict[str, list]
+    start: int
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), []))
+
+    def rows(self) -> list[dict]:
+        """The batch as one dict per row."""
+        names = list(self.columns)
+        return [dict(zip(names, row)) for row in zip(*self.columns.values())]
+
+
+async def iter_batches(
+    lines: AsyncIterator[str], batch_size: int = DEFAULT_BATCH_SIZE
+) -> AsyncIterator[CSVBatch]:
+    """
+    Parse CSV lines into typed column batches as they arrive.
+
+    The header names the columns. Column types (int, float or str) are
+    inferred from the first batch; missing values become None. Only one batch
+    of lines is held at a time.
+
+    :argument: lines (AsyncIterator[str]): The response lines, e.g. from `httpx.Response.aiter_lines()`.
+    :argument: batch_size (int): The number of rows per batch (default: 1000).
+
+    :returns: An async iterator of CSVBatch.
+    """
+    header = None
+    kinds = None
+    pending: list[str] = []
+    start = 0
+
+    def flush() -> CSVBatch:
+        nonlocal kinds, start
+        width = len(header)
+        rows = [(row + [""] * width)[:width] for row in csv.reader(pending) if row]
+        columns = [list(column) for column in zip(*rows)] or [[] for _ in header]
+        if kinds is None:
+            kinds = [infer_type(column) for column in columns]
+        batch = CSVBatch(
+            {
+                name: [_convert(value, kind) for value in column]
+                for name, kind, column in zip(header, kinds, columns)
+            },
+            start,
+        )
+        start += len(rows)
+        pending.clear()
+        return batch
+
+    async for line in lines:
+        if header is None:
+            if line.strip():
+                header = next(csv.reader([line]))
+            continue
+        if line.strip():
+            pending.append(line)
+        if len(pending) >= batch_size:
+            yield flush()
+    if pending:
+        yield flush()
+
+
+@dataclass
+class CSVTable:
+    """All rows of a CSV response as typed columns."""
+
+    columns: dict[str, list] = field(default_factory=dict)
+
+    @classmethod
+    async def collect(cls, batches: AsyncIterator[CSVBatch]) -> "CSVTable":
+        """
+        Gather streamed batches into one table.
+
+        :argument: batches (AsyncIterator[CSVBatch]): The batches to gather.
+
+        :returns: The table.
+        """
+        table = cls()
+        async for batch in batches:
+            for name, values in batch.columns.items():
+                table.columns.setdefault(name, []).extend(values)
+        return table
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), []))
+
+    def rows(self) -> list[dict]:
+        """The table as one dict per row."""
+        return CSVBatch(self.columns, 0).rows()
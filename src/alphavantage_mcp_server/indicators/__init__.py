@@ -0,0 +1,33 @@
+from alphavantage_mcp_server.indicators import (
+    cycles,
+    directional,
+    moving_averages,
+    oscillators,
+    volatility,
+    volume,
+)
+from alphavantage_mcp_server.indicators.engine import (
+    INDICATORS,
+    Bars,
+    Indicator,
+    LocalIndicators,
+    Unsupported,
+    bars_of,
+    indicator,
+)
+
+__all__ = [
+    "INDICATORS",
+    "Bars",
+    "Indicator",
+    "LocalIndicators",
+    "Unsupported",
+    "bars_of",
+    "cycles",
+    "directional",
+    "indicator",
+    "moving_averages",
+    "oscillators",
+    "volatility",
+    "volume",
+]
@@ -0,0 +1,377 @@
+import math
+
+from alphavantage_mcp_server.columnar import np
+from alphavantage_mcp_server.indicators.engine import Bars, Unsupported, indicator
+from alphavantage_mcp_server.indicators.primitives import first_valid, nans, recurrence
+
+# Ehlers' Hilbert transform pipeline, as TA-Lib runs it: a 4-bar weighted
+# average of the price, a detrender, in-phase and quadrature components and
+# the dominant cycle period they imply. Each bar's filters are scaled by the
+# previous bar's period, so the core is one serial pass; it runs once per
+# series, price and warm-up, and the six HT outputs and MAMA/FAMA are all
+# derived from its state, vectorized where TA-Lib's loop allows it.
+
+HILBERT_A = 0.0962
+HILBERT_B = 0.5769
+RAD2DEG = 180.0 / (4.0 * math.atan(1))
+DEG2RAD = 1.0 / RAD2DEG
+# Three bars seed the weighted average, then nine more warm it up before the
+# period's pipeline starts, or 34 before the phase's; the state differs
+# until the start is forgotten, so each start is run separately.
+PERIOD_START = 12
+PHASE_START = 37
+# The bars before the first output of the period and phase based indicators.
+PERIOD_LOOKBACK = 32
+PHASE_LOOKBACK = 63
+# The longest cycle the phase is measured over, and how many bars' cycles are
+# gathered at once.
+MAX_CYCLE = 50
+CHUNK = 65536
+# MAMA's limits when it smooths another indicator (matype 8), as in TA-Lib.
+MAMA_FAST = 0.5
+MAMA_SLOW = 0.05
+
+
+def _smoothed(values: "np.ndarray") -> "np.ndarray":
+    # The 4-3-2-1 weighted price, from TA-Lib's running sums: its rounding
+    # decides whether flat stretches detrend to exactly zero, and so the phase.
+    # Accumulating the interleaved updates in order reproduces it bit for bit.
+    count = len(values)
+    out = np.zeros(count)
+    if count < 4:
+        return out
+    trailing = np.concatenate([[0.0], values[: count - 4]])
+    added = np.empty(2 * count - 3)
+    added[:3] = values[:3]
+    added[3::2] = values[3:]
+    added[4::2] = -trailing
+    subtotal = np.add.accumulate(added)[4::2]
+    weighted = np.empty(2 * count - 3)
+    weighted[:3] = values[0], values[1] * 2.0, values[2] * 3.0
+    weighted[3::2] = values[3:] * 4.0
+    weighted[4::2] = -subtotal
+    out[3:] = np.add.accumulate(weighted)[3::2] * 0.1
+    return out
+
+
+def _hilbert(values: "np.ndarray", start: int) -> "np.ndarray":
+    # TA-Lib's transform of a series whose memory starts empty at `start`:
+    # a * x[t] + b * x[t - 2] - b * x[t - 4] - a * x[t - 6], before scaling.
+    x = np.concatenate([np.zeros(6), np.where(np.arange(len(values)) < start, 0.0, values)])
+    return HILBERT_A * x[6:] - HILBERT_A * x[:-6] - HILBERT_B * x[2:-4] + HILBERT_B * x[4:-2]
+
+
+def hilbert(values: "np.ndarray", start: int = PERIOD_START) -> dict[str, "np.ndarray"]:
+    """
+    The Hilbert transform pipeline's state at each bar.
+
+    :argument: values (np.ndarray): The price, without NaNs.
+    :argument: start (int): The first bar of the pipeline, after the weighted average's warm-up.
+
+    :returns: "smoothed" (the 4-bar weighted price), then "period" (the
+        smoothed dominant cycle period), "in_phase" and "quadrature", 0
+        before the start, and "start" itself.
+    """
+    count = len(values)
+    smoothed = _smoothed(values)
+    filtered = _hilbert(smoothed, start).tolist()
+    # Locals, as this loop runs once per bar.
+    a, b, atan, rad2deg = HILBERT_A, HILBERT_B, math.atan, RAD2DEG
+    detrender = [0.0] * count
+    quadrature = [0.0] * count
+    smooth_period = [0.0] * count
+    period = smooth = previous_i2 = previous_q2 = re = im = 0.0
+    for today in range(start, count):
+        adjust = 0.075 * period + 0.54
+        detrended = filtered[today] * adjust
+        detrender[today] = detrended
+        # Terms in TA-Lib's order, for the same rounding.
+        q1 = (
+            a * detrended
+            - a * detrender[today - 6]
+            - b * detrender[today - 4]
+            + b * detrender[today - 2]
+        ) * adjust
+        quadrature[today] = q1
+        i1 = detrender[today - 3]
+        # The in-phase and quadrature components advanced by 90 degrees.
+        ji = (
+            a * i1 - a * detrender[today - 9] - b * detrender[today - 7] + b * detrender[today - 5]
+        ) * adjust
+        jq = (
+            a * q1
+            - a * quadrature[today - 6]
+            - b * quadrature[today - 4]
+            + b * quadrature[today - 2]
+        ) * adjust
+        i2 = 0.2 * (i1 - jq) + 0.8 * previous_i2
+        q2 = 0.2 * (q1 + ji) + 0.8 * previous_q2
+        re = 0.2 * (i2 * previous_i2 + q2 * previous_q2) + 0.8 * re
+        im = 0.2 * (i2 * previous_q2 - q2 * previous_i2) + 0.8 * im
+        previous_i2 = i2
+        previous_q2 = q2
+        previous = period
+        if im != 0.0 and re != 0.0:
+            period = 360.0 / (atan(im / re) * rad2deg)
+        # At most 50% longer or 33% shorter than the last, and 6 to 50 bars.
+        period = max(min(period, 1.5 * previous), 0.67 * previous)
+        period = min(max(period, 6.0), 50.0)
+        period = 0.2 * period + 0.8 * previous
+        smooth = 0.33 * period + 0.67 * smooth
+        smooth_period[today] = smooth
+    in_phase = np.zeros(count)
+    in_phase[3:] = detrender[: max(count - 3, 0)]
+    return {
+        "smoothed": smoothed,
+        "period": np.array(smooth_period),
+        "in_phase": in_phase,
+        "quadrature": np.array(quadrature),
+        "start": start,
+    }
+
+
+def cycle(bars: Bars, series_type: str, start: int = PERIOD_START) -> dict[str, "np.ndarray"]:
+    """The pipeline's state for one of the bars' prices, memoized per price and start."""
+    return bars.memo(
+        ("hilbert", series_type, start), lambda: hilbert(bars.price(series_type), start)
+    )
+
+
+def _cycle_sums(
+    smoothed: "np.ndarray", lengths: "np.ndarray", start: int
+) -> tuple["np.ndarray", "np.ndarray"]:
+    # Each bar's smoothed prices over its own dominant cycle, weighted by the
+    # sine and cosine of their place in it; bars are grouped by cycle length.
+    count = len(smoothed)
+    real = np.zeros(count)
+    imaginary = np.zeros(count)
+    # The smoothed prices kept by TA-Lib's pipeline: none before the start.
+    kept = np.concatenate([np.zeros(MAX_CYCLE), smoothed])
+    kept[MAX_CYCLE : MAX_CYCLE + start] = 0.0
+    for length in np.unique(lengths[start:]).tolist():
+        if length <= 0:
+            continue
+        rows = np.flatnonzero(lengths == length)
+        rows = rows[rows >= start]
+        angles = np.arange(length) * (8.0 * math.atan(1)) / length
+        for first in range(0, len(rows), CHUNK):
+            chunk = rows[first : first + CHUNK]
+            windows = kept[chunk[:, None] + MAX_CYCLE - np.arange(length)]
+            real[chunk] = windows @ np.sin(angles)
+            imaginary[chunk] = windows @ np.cos(angles)
+    return real, imaginary
+
+
+def dc_phase(bars: Bars, series_type: str) -> "np.ndarray":
+    """
+    The dominant cycle phase in degrees, from -45 to 315: the phase of the
+    smoothed price over the last dominant cycle, compensated for the
+    weighted average's lag.
+    """
+
+    def compute():
+        state = cycle(bars, series_type, PHASE_START)
+        period = state["period"]
+        count = len(period)
+        start = PHASE_START
+        real, imaginary = _cycle_sums(state["smoothed"], (period + 0.5).astype(int), start)
+        phase = np.zeros(count)
+        known = imaginary != 0.0
+        phase[known] = np.arctan(real[known] / imaginary[known]) * RAD2DEG
+        lag = np.zeros(count)
+        lag[start:] = 360.0 / period[start:]
+        phase = phase + 90.0 + lag + np.where(imaginary < 0.0, 180.0, 0.0)
+        phase[phase > 315.0] -= 360.0
+        # Without an imaginary part TA-Lib turns the last phase by a quarter.
+        for today in np.flatnonzero(~known[start:]).tolist():
+            today += start
+            previous = phase[today - 1] if today > start else 0.0
+            value = previous + 90.0 * np.sign(real[today]) + 90.0 + lag[today]
+            phase[today] = value - 360.0 if value > 315.0 else value
+        phase[:start] = 0.0
+        return phase
+
+    return bars.memo(("dc_phase", series_type), compute)
+
+
+def sine_waves(bars: Bars, series_type: str) -> tuple["np.ndarray", "np.ndarray"]:
+    """The sine of the dominant cycle phase and of the phase 45 degrees ahead."""
+
+    def compute():
+        phase = dc_phase(bars, series_type)
+        return np.sin(phase * DEG2RAD), np.sin((phase + 45.0) * DEG2RAD)
+
+    return bars.memo(("sine", series_type), compute)
+
+
+def trendline(bars: Bars, series_type: str) -> "np.ndarray":
+    """
+    The instantaneous trendline: the price averaged over the dominant cycle,
+    then over four bars with weights 4-3-2-1.
+    """
+
+    def compute():
+        values = bars.price(series_type)
+        period = cycle(bars, series_type, PHASE_START)["period"]
+        count = len(values)
+        lengths = (period + 0.5).astype(int)
+        # Each bar's average over its own cycle length, from cumulative sums.
+        totals = np.concatenate([[0.0], np.cumsum(values)])
+        ends = np.arange(1, count + 1)
+        average = np.zeros(count)
+        valid = (lengths > 0) & (ends > PHASE_START)
+        average[valid] = (
+            totals[ends[valid]] - totals[np.maximum(ends[valid] - lengths[valid], 0)]
+        ) / lengths[valid]
+        lagged = np.concatenate([np.zeros(3), average])
+        return (4.0 * average + 3.0 * lagged[2:-1] + 2.0 * lagged[1:-2] + lagged[:-3]) / 10.0
+
+    return bars.memo(("trendline", series_type), compute)
+
+
+def trend_mode(bars: Bars, series_type: str) -> "np.ndarray":
+    """
+    1 where the price is trending, 0 where it is cycling: TA-Lib's rules on
+    sine wave crossings, the phase rate and the distance to the trendline.
+    """
+    state = cycle(bars, series_type, PHASE_START)
+    period = state["period"]
+    smoothed = state["smoothed"]
+    phase = dc_phase(bars, series_type)
+    sine, lead_sine = sine_waves(bars, series_type)
+    line = trendline(bars, series_type)
+    count = len(period)
+    positions = np.arange(count)
+    previous_sine = np.concatenate([[0.0], sine[:-1]])
+    previous_lead = np.concatenate([[0.0], lead_sine[:-1]])
+    previous_phase = np.concatenate([[0.0], phase[:-1]])
+    # The pipeline's first bar compares with zeros.
+    for previous in (previous_sine, previous_lead, previous_phase):
+        previous[PHASE_START : PHASE_START + 1] = 0.0
+    crossed = ((sine > lead_sine) & (previous_sine <= previous_lead)) | (
+        (sine < lead_sine) & (previous_sine >= previous_lead)
+    )
+    crossed[:PHASE_START] = False
+    last_cross = np.maximum.accumulate(np.where(crossed, positions, PHASE_START))
+    days_in_trend = positions - last_cross + 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = phase - previous_phase
+        cycling = (period != 0.0) & (rate > 0.67 * 360.0 / period) & (rate < 1.5 * 360.0 / period)
+        far = (line != 0.0) & (np.abs((smoothed - line) / line) >= 0.015)
+    trend = ~crossed & (days_in_trend >= 0.5 * period) & ~cycling | far
+    return trend.astype(float)
+
+
+def mama(
+    values: "np.ndarray", fastlimit: float, slowlimit: float, state: dict | None = None
+) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    The MESA adaptive moving average and its following average, FAMA.
+
+    The smoothing factor is the fast limit divided by the phase change of
+    the dominant cycle, no lower than the slow limit.
+
+    :argument: values (np.ndarray): The price, without NaNs.
+    :argument: fastlimit (float): The largest smoothing factor.
+    :argument: slowlimit (float): The smallest smoothing factor.
+    :argument: state (dict): The Hilbert transform pipeline on the values, if already run.
+
+    :returns: MAMA and FAMA, NaN for the first PERIOD_LOOKBACK values.
+    """
+    state = state or hilbert(values)
+    count = len(values)
+    mesa = nans(count)
+    following = nans(count)
+    start = state["start"]
+    if count <= start:
+        return mesa, following
+    in_phase = state["in_phase"][start:]
+    quadrature = state["quadrature"][start:]
+    phase = np.zeros(len(in_phase))
+    known = in_phase != 0.0
+    phase[known] = np.arctan(quadrature[known] / in_phase[known]) * RAD2DEG
+    change = np.concatenate([[0.0], phase[:-1]]) - phase
+    with np.errstate(divide="ignore"):
+        alpha = np.where(change > 1.0, np.maximum(fastlimit / change, slowlimit), fastlimit)
+    mesa[start:] = recurrence(1 - alpha, alpha * values[start:], 0.0)
+    following[start:] = recurrence(1 - alpha / 2, alpha / 2 * mesa[start:], 0.0)
+    mesa[:PERIOD_LOOKBACK] = following[:PERIOD_LOOKBACK] = np.nan
+    return mesa, following
+
+
+def mesa_average(values: "np.ndarray") -> "np.ndarray":
+    """MAMA with TA-Lib's limits, as the matype 8 moving average; leading NaNs are skipped."""
+    out = nans(len(values))
+    start = first_valid(values)
+    out[start:] = mama(values[start:], MAMA_FAST, MAMA_SLOW)[0]
+    return out
+
+
+def _lookback(values: "np.ndarray", lookback: int) -> "np.ndarray":
+    out = np.array(values, dtype=float)
+    out[:lookback] = np.nan
+    return out
+
+
+@indicator(
+    "HT_TRENDLINE",
+    "Hilbert Transform - Instantaneous Trendline (HT_TRENDLINE)",
+    series_type=None,
+)
+def _ht_trendline(bars: Bars, series_type: str) -> dict:
+    return {"HT_TRENDLINE": _lookback(trendline(bars, series_type), PHASE_LOOKBACK)}
+
+
+@indicator("HT_SINE", "Hilbert Transform - SineWave (HT_SINE)", series_type=None)
+def _ht_sine(bars: Bars, series_type: str) -> dict:
+    sine, lead_sine = sine_waves(bars, series_type)
+    return {
+        "LEAD SINE": _lookback(lead_sine, PHASE_LOOKBACK),
+        "SINE": _lookback(sine, PHASE_LOOKBACK),
+    }
+
+
+@indicator(
+    "HT_TRENDMODE", "Hilbert Transform - Trend vs Cycle Mode (HT_TRENDMODE)", series_type="close"
+)
+def _ht_trendmode(bars: Bars, series_type: str) -> dict:
+    return {"TRENDMODE": _lookback(trend_mode(bars, series_type), PHASE_LOOKBACK)}
+
+
+@indicator(
+    "HT_DCPERIOD",
+    "Hilbert Transform - Dominant Cycle Period (HT_DCPERIOD)",
+    series_type=None,
+)
+def _ht_dcperiod(bars: Bars, series_type: str) -> dict:
+    return {"DCPERIOD": _lookback(cycle(bars, series_type)["period"], PERIOD_LOOKBACK)}
+
+
+@indicator("HT_DCPHASE", "Hilbert Transform - Dominant Cycle Phase (HT_DCPHASE)", series_type=None)
+def _ht_dcphase(bars: Bars, series_type: str) -> dict:
+    return {"HT_DCPHASE": _lookback(dc_phase(bars, series_type), PHASE_LOOKBACK)}
+
+
+@indicator("HT_PHASOR", "Hilbert Transform - Phasor Components (HT_PHASOR)", series_type=None)
+def _ht_phasor(bars: Bars, series_type: str) -> dict:
+    state = cycle(bars, series_type)
+    return {
+        "PHASE": _lookback(state["in_phase"], PERIOD_LOOKBACK),
+        "QUADRATURE": _lookback(state["quadrature"], PERIOD_LOOKBACK),
+    }
+
+
+@indicator(
+    "MAMA",
+    "MESA Adaptive Moving Average (MAMA)",
+    series_type=None,
+    fastlimit=0.01,
+    slowlimit=0.01,
+)
+def _mama(bars: Bars, series_type: str, fastlimit: float, slowlimit: float) -> dict:
+    for name, limit in (("fastlimit", fastlimit), ("slowlimit", slowlimit)):
+        if not 0.01 <= limit <= 0.99:
+            raise Unsupported(f"{name} must be between 0.01 and 0.99, got {limit}")
+    values = bars.price(series_type)
+    mesa, following = mama(values, fastlimit, slowlimit, cycle(bars, series_type))
+    return {"FAMA": following, "MAMA": mesa}
@@ -0,0 +1,218 @@
+from alphavantage_mcp_server.columnar import np
+from alphavantage_mcp_server.indicators.engine import Bars, Unsupported, indicator
+from alphavantage_mcp_server.indicators.primitives import (
+    nans,
+    ratio,
+    shift,
+    sliding,
+    wilder,
+    wilder_sum,
+)
+
+# Every member of the family is derived from the same intermediates, memoized
+# on the bars: the one-bar directional movements, their Wilder sums and the
+# true range's for a period, then the directional indicators, DX and ADX. Asking
+# for ADX, +DI and -DI on the same bars computes each of them once.
+
+
+def _period(period: int, minimum: int = 1) -> int:
+    if period < minimum:
+        raise Unsupported(f"time_period must be at least {minimum}, got {period}")
+    return period
+
+
+def movements(bars: Bars) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    The one-bar directional movements (+DM1, -DM1): the larger of the rise in
+    the high and the fall in the low, when positive, NaN for the first bar.
+    """
+
+    def compute():
+        up = bars.high - shift(bars.high)
+        down = shift(bars.low) - bars.low
+        plus = np.where((up > down) & (up > 0), up, 0.0)
+        minus = np.where((down > up) & (down > 0), down, 0.0)
+        plus[:1] = minus[:1] = np.nan
+        return plus, minus
+
+    return bars.memo(("movements",), compute)
+
+
+def smoothed(bars: Bars, period: int) -> tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Wilder sums of +DM1, -DM1 and the true range over `period`."""
+
+    def compute():
+        plus, minus = movements(bars)
+        return (
+            wilder_sum(plus, period),
+            wilder_sum(minus, period),
+            wilder_sum(bars.true_range(), period),
+        )
+
+    return bars.memo(("smoothed", period), compute)
+
+
+def directional_indicators(bars: Bars, period: int) -> tuple["np.ndarray", "np.ndarray"]:
+    """+DI and -DI: the smoothed movements as a percentage of the smoothed true range."""
+
+    def compute():
+        plus, minus, true_range = smoothed(bars, period)
+        if period == 1:
+            # TA-Lib, and so Alpha Vantage, reports a fraction for period 1.
+            return ratio(plus, true_range), ratio(minus, true_range)
+        # The indicators start one bar after the sums are first complete.
+        plus_di = 100 * ratio(plus, true_range)
+        minus_di = 100 * ratio(minus, true_range)
+        plus_di[:period] = minus_di[:period] = np.nan
+        return plus_di, minus_di
+
+    return bars.memo(("di", period), compute)
+
+
+def dx(bars: Bars, period: int) -> "np.ndarray":
+    """The directional movement index: the spread of +DI and -DI over their sum."""
+
+    def compute():
+        plus_di, minus_di = directional_indicators(bars, period)
+        return 100 * ratio(np.abs(plus_di - minus_di), plus_di + minus_di)
+
+    return bars.memo(("dx", period), compute)
+
+
+def adx(bars: Bars, period: int) -> "np.ndarray":
+    """The average directional movement index: DX with Wilder smoothing."""
+    return bars.memo(("adx", period), lambda: wilder(dx(bars, period), period))
+
+
+@indicator("PLUS_DM", "Plus Directional Movement (PLUS_DM)", time_period=14)
+def _plus_dm(bars: Bars, time_period: int) -> dict:
+    return {"PLUS_DM": smoothed(bars, _period(time_period))[0]}
+
+
+@indicator("MINUS_DM", "Minus Directional Movement (MINUS_DM)", time_period=14)
+def _minus_dm(bars: Bars, time_period: int) -> dict:
+    return {"MINUS_DM": smoothed(bars, _period(time_period))[1]}
+
+
+@indicator("PLUS_DI", "Plus Directional Indicator (PLUS_DI)", time_period=14)
+def _plus_di(bars: Bars, time_period: int) -> dict:
+    return {"PLUS_DI": directional_indicators(bars, _period(time_period))[0]}
+
+
+@indicator("MINUS_DI", "Minus Directional Indicator (MINUS_DI)", time_period=14)
+def _minus_di(bars: Bars, time_period: int) -> dict:
+    return {"MINUS_DI": directional_indicators(bars, _period(time_period))[1]}
+
+
+@indicator("DX", "Directional Movement Index (DX)", time_period=14)
+def _dx(bars: Bars, time_period: int) -> dict:
+    return {"DX": dx(bars, _period(time_period, 2))}
+
+
+@indicator("ADX", "Average Directional Movement Index (ADX)", time_period=14)
+def _adx(bars: Bars, time_period: int) -> dict:
+    return {"ADX": adx(bars, _period(time_period, 2))}
+
+
+@indicator("ADXR", "Average Directional Movement Index Rating (ADXR)", time_period=14)
+def _adxr(bars: Bars, time_period: int) -> dict:
+    period = _period(time_period, 2)
+    average = adx(bars, period)
+    return {"ADXR": (average + shift(average, period - 1)) / 2}
+
+
+def aroon(bars: Bars, period: int) -> tuple["np.ndarray", "np.ndarray"]:
+    """
+    Aroon down and up: how recent the lowest low and the highest high of the
+    last period + 1 bars are, from 0 (period bars ago) to 100 (this bar).
+    """
+
+    def compute():
+        down = nans(len(bars))
+        up = nans(len(bars))
+        if period < len(bars):
+            # Reversed windows, so ties go to the most recent bar as in TA-Lib.
+            highs = sliding(bars.high, period + 1)[:, ::-1]
+            lows = sliding(bars.low, period + 1)[:, ::-1]
+            up[period:] = 100.0 * (period - highs.argmax(axis=1)) / period
+            down[period:] = 100.0 * (period - lows.argmin(axis=1)) / period
+        return down, up
+
+    return bars.memo(("aroon", period), compute)
+
+
+@indicator("AROON", "Aroon (AROON)", time_period=14)
+def _aroon(bars: Bars, time_period: int) -> dict:
+    down, up = aroon(bars, _period(time_period, 2))
+    return {"Aroon Down": down, "Aroon Up": up}
+
+
+@indicator("AROONOSC", "Aroon Oscillator (AROONOSC)", time_period=14)
+def _aroonosc(bars: Bars, time_period: int) -> dict:
+    down, up = aroon(bars, _period(time_period, 2))
+    return {"AROONOSC": up - down}
+
+
+def parabolic_sar(
+    high: "np.ndarray", low: "np.ndarray", acceleration: float, maximum: float
+) -> "np.ndarray":
+    """
+    Wilder's parabolic stop and reverse, following TA-Lib step for step.
+
+    Each value depends on the trend, extreme point and acceleration left by
+    the previous bar, so this is one serial pass over plain floats.
+    """
+    count = len(high)
+    out = [float("nan")] * count
+    if count < 2:
+        return np.array(out)
+    highs = high.tolist()
+    lows = low.tolist()
+    # An acceleration above the maximum is capped, steps included.
+    step = factor = min(acceleration, maximum)
+    # The first bar's direction: short when the low fell more than the high rose.
+    down = lows[0] - lows[1]
+    long = not (down > 0 and down > highs[1] - highs[0])
+    if long:
+        extreme, sar = highs[1], lows[0]
+    else:
+        extreme, sar = lows[1], highs[0]
+    new_high, new_low = highs[1], lows[1]
+    for today in range(1, count):
+        previous_high, previous_low = new_high, new_low
+        new_high, new_low = highs[today], lows[today]
+        if long:
+            if new_low <= sar:
+                long = False
+                sar = max(extreme, previous_high, new_high)
+                out[today] = sar
+                factor = step
+                extreme = new_low
+                sar = max(sar + factor * (extreme - sar), previous_high, new_high)
+            else:
+                out[today] = sar
+                if new_high > extreme:
+                    extreme = new_high
+                    factor = min(factor + step, maximum)
+                sar = min(sar + factor * (extreme - sar), previous_low, new_low)
+        elif new_high >= sar:
+            long = True
+            sar = min(extreme, previous_low, new_low)
+            out[today] = sar
+            factor = step
+            extreme = new_high
+            sar = min(sar + factor * (extreme - sar), previous_low, new_low)
+        else:
+            out[today] = sar
+            if new_low < extreme:
+                extreme = new_low
+                factor = min(factor + step, maximum)
+            sar = max(sar + factor * (extreme - sar), previous_high, new_high)
+    return np.array(out)
+
+
+@indicator("SAR", "Parabolic SAR (SAR)", acceleration=0.02, maximum=0.2)
+def _sar(bars: Bars, acceleration: float, maximum: float) -> dict:
+    if acceleration < 0 or maximum < 0:
+        raise Unsupported("acceleration and maximum must not be negative")
+    return {"SAR": parabolic_sar(bars.high, bars.low, acceleration, maximum)}
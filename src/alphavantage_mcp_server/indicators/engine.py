@@ -0,0 +1,379 @@
+import os
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from alphavantage_mcp_server.columnar import OHLCVSeries, np, require_numpy
+from alphavantage_mcp_server.indicators.primitives import shift
+from alphavantage_mcp_server.throttle import AlphaVantageError, ThrottledError
+
+SOURCES = ("auto", "local", "remote")
+DEFAULT_SOURCE = "auto"
+# Bars built from the same parsed series are reused, with their intermediates.
+BARS_MEMO_SIZE = 32
+# Words in Alpha Vantage's refusal of a series the API key is not entitled to,
+# as opposed to errors about the request itself, such as an invalid symbol.
+ENTITLEMENT_PHRASES = ("premium",)
+OHLC = ("open", "high", "low", "close")
+
+
+class Unsupported(ValueError):
+    """An indicator or parameter the local engine does not implement."""
+
+
+@dataclass
+class Bars:
+    """
+    The OHLCV arrays indicators are computed from, oldest bar first.
+
+    Prices are split and dividend adjusted when the series carries an
+    adjusted close. Intermediates shared by several indicators, such as the
+    true range, are computed once per Bars through `memo`.
+    """
+
+    index: "np.ndarray"
+    open: "np.ndarray"
+    high: "np.ndarray"
+    low: "np.ndarray"
+    close: "np.ndarray"
+    volume: "np.ndarray"
+    intraday: bool = False
+    _memo: dict = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_series(cls, series: OHLCVSeries) -> "Bars":
+        """
+        Bars from a columnar time series.
+
+        :argument: series (OHLCVSeries): A daily, weekly, monthly or intraday series.
+
+        :returns: The bars.
+
+        :raises Unsupported: If the series holds no bars or lacks a price column.
+        """
+        if not len(series) or any(name not in series.columns for name in OHLC):
+            raise Unsupported("The series holds no OHLC bars")
+        close = series["close"].astype(float)
+        factor = np.ones(len(close))
+        if "adjusted_close" in series.columns:
+            factor = np.divide(series["adjusted_close"], close, out=factor, where=close != 0)
+        intraday = not bool((series.index.astype("datetime64[D]") == series.index).all())
+        return cls(
+            series.index,
+            series["open"] * factor,
+            series["high"] * factor,
+            series["low"] * factor,
+            close * factor,
+            series["volume"].astype(float) if "volume" in series.columns else np.zeros(len(close)),
+            intraday,
+        )
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def price(self, series_type: str) -> "np.ndarray":
+        """
+        The price series an indicator is computed on.
+
+        :argument: series_type (str): "open", "high", "low" or "close".
+
+        :raises Unsupported: For any other series type.
+        """
+        if series_type not in OHLC:
+            raise Unsupported(f"Unknown series_type {series_type!r}")
+        return getattr(self, series_type)
+
+    def memo(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        """A value computed once per bars, e.g. an intermediate shared by several indicators."""
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def true_low(self) -> "np.ndarray":
+        """The lower of each low and the previous close, NaN for the first bar."""
+        return self.memo(("true_low",), lambda: np.minimum(self.low, shift(self.close)))
+
+    def true_high(self) -> "np.ndarray":
+        """The higher of each high and the previous close, NaN for the first bar."""
+        return self.memo(("true_high",), lambda: np.maximum(self.high, shift(self.close)))
+
+    def true_range(self) -> "np.ndarray":
+        """Wilder's true range, NaN for the first bar."""
+        return self.memo(("true_range",), lambda: self.true_high() - self.true_low())
+
+    def typical_price(self) -> "np.ndarray":
+        """(high + low + close) / 3."""
+        return self.memo(("typical_price",), lambda: (self.high + self.low + self.close) / 3)
+
+    def timestamps(self) -> list[str]:
+        """The index as indicator timestamps: dates, or date and minute for intraday bars."""
+        text = np.datetime_as_string(self.index, unit="m" if self.intraday else "D")
+        return [timestamp.replace("T", " ") for timestamp in text.tolist()]
+
+
+_bars: OrderedDict[int, tuple[OHLCVSeries, Bars]] = OrderedDict()
+
+
+def bars_of(series: OHLCVSeries) -> Bars:
+    """
+    The bars of a parsed series, reusing those built for the same series before.
+
+    :argument: series (OHLCVSeries): The parsed series.
+
+    :returns: The bars.
+    """
+    key = id(series)
+    memo = _bars.get(key)
+    if memo is not None and memo[0] is series:
+        _bars.move_to_end(key)
+        return memo[1]
+    bars = Bars.from_series(series)
+    _bars[key] = (series, bars)
+    while len(_bars) > BARS_MEMO_SIZE:
+        _bars.popitem(last=False)
+    return bars
+
+
+@dataclass(frozen=True)
+class Indicator:
+    """
+    A locally computed indicator: its Alpha Vantage function name and title,
+    the parameters it takes with their defaults, and the function computing
+    its outputs from bars.
+    """
+
+    function: str
+    title: str
+    compute: Callable[..., dict[str, "np.ndarray"]]
+    params: dict[str, Any]
+
+    def evaluate(self, bars: Bars, params: dict | None = None) -> dict[str, "np.ndarray"]:
+        """
+        Compute the indicator's outputs.
+
+        :argument: bars (Bars): The bars.
+        :argument: params (dict): Alpha Vantage parameters; missing ones take their defaults and others are ignored.
+
+        :returns: One array per output, aligned with the bars, NaN during the look-back.
+        """
+        values = {}
+        for name, default in self.params.items():
+            value = (params or {}).get(name)
+            value = default if value is None else value
+            if value is None:
+                raise Unsupported(f"{self.function} needs {name}")
+            values[name] = type(default)(value) if default is not None else value
+        return self.compute(bars, **values)
+
+
+INDICATORS: dict[str, Indicator] = {}
+
+
+def indicator(function: str, title: str, **params: Any):
+    """
+    Register a local indicator.
+
+    :argument: function (str): The Alpha Vantage function, e.g. "SMA".
+    :argument: title (str): The indicator name reported in the payload's meta data.
+    :argument: params: The parameters and their defaults; None marks a required parameter.
+
+    :returns: A decorator registering the compute function.
+    """
+
+    def register(compute: Callable[..., dict[str, "np.ndarray"]]):
+        INDICATORS[function] = Indicator(function, title, compute, params)
+        return compute
+
+    return register
+
+
+def _label(name: str) -> str:
+    return name.replace("_", " ").title()
+
+
+def _format(value: float) -> str:
+    return f"{value:.4f}"
+
+
+def _rows(bars: Bars, outputs: dict[str, "np.ndarray"]) -> tuple[list[str], list[int]]:
+    valid = np.ones(len(bars), dtype=bool)
+    for values in outputs.values():
+        valid &= ~np.isnan(values)
+    positions = np.flatnonzero(valid)[::-1].tolist()
+    timestamps = bars.timestamps()
+    return [timestamps[position] for position in positions], positions
+
+
+def to_payload(
+    indicator: Indicator,
+    symbol: str,
+    interval: str,
+    params: dict,
+    bars: Bars,
+    outputs: dict[str, "np.ndarray"],
+) -> dict:
+    """
+    Shape outputs like Alpha Vantage's "Technical Analysis: X" response.
+
+    Rows are newest first; bars still inside the look-back are left out.
+
+    :returns: The payload.
+    """
+    timestamps, positions = _rows(bars, outputs)
+    meta = {"1: Symbol": symbol, "2: Indicator": indicator.title}
+    meta["3: Last Refreshed"] = timestamps[0] if timestamps else None
+    meta["4: Interval"] = interval
+    number = 5
+    for name in indicator.params:
+        value = params.get(name)
+        meta[f"{number}: {_label(name)}"] = indicator.params[name] if value is None else value
+        number += 1
+    meta[f"{number}: Time Zone"] = "US/Eastern"
+    columns = {name: values.tolist() for name, values in outputs.items()}
+    return {
+        "Meta Data": meta,
+        f"Technical Analysis: {indicator.function}": {
+            timestamp: {name: _format(values[position]) for name, values in columns.items()}
+            for timestamp, position in zip(timestamps, positions)
+        },
+    }
+
+
+def to_csv(bars: Bars, outputs: dict[str, "np.ndarray"]) -> str:
+    """Shape outputs like Alpha Vantage's CSV indicator response, newest first."""
+    timestamps, positions = _rows(bars, outputs)
+    columns = [values.tolist() for values in outputs.values()]
+    lines = [",".join(["time", *outputs])]
+    for timestamp, position in zip(timestamps, positions):
+        lines.append(",".join([timestamp, *(_format(values[position]) for values in columns)]))
+    return "\r\n".join(lines) + "\r\n"
+
+
+BarsLoader = Callable[[str, str, str | None], Awaitable[OHLCVSeries]]
+Remote = Callable[[str, dict, str], Awaitable[Any]]
+
+
+def _refused(error: Exception) -> bool:
+    # Whether Alpha Vantage refused the series to this API key, whatever the symbol.
+    if not isinstance(error, AlphaVantageError) or isinstance(error, ThrottledError):
+        return False
+    text = str(error).lower()
+    return any(phrase in text for phrase in ENTITLEMENT_PHRASES)
+
+
+class LocalIndicators:
+    """
+    Computes technical indicators from a cached OHLCV series instead of
+    calling Alpha Vantage once per indicator and parameter set.
+
+    Each call picks a source: "remote" always calls the indicator endpoint,
+    "local" always computes, and "auto" computes when the indicator is
+    implemented locally and numpy is installed, falling back to the endpoint
+    when the bars cannot be loaded or a parameter is not supported. An
+    interval whose series the API key is not entitled to, e.g. a premium
+    endpoint on a free key, is not tried locally again in "auto" mode; other
+    errors, such as an invalid symbol, only send that one request to the endpoint.
+    """
+
+    def __init__(self, loader: BarsLoader, remote: Remote, source: str = DEFAULT_SOURCE):
+        if source not in SOURCES:
+            raise ValueError(f"Unknown indicator source {source!r}; choose from {SOURCES}")
+        self.loader = loader
+        self.remote = remote
+        self.source = source
+        self.local = 0
+        self.remote_calls = 0
+        self.fallbacks = 0
+        self.unavailable: set[str] = set()
+
+    @classmethod
+    def from_env(cls, loader: BarsLoader, remote: Remote) -> "LocalIndicators":
+        """
+        Build the local indicator engine from the environment.
+
+        ALPHAVANTAGE_INDICATOR_SOURCE is the default source: "auto", "local" or "remote".
+
+        :argument: loader (BarsLoader): Fetches the series for a symbol, interval and month.
+        :argument: remote (Remote): Calls the indicator endpoint with a function, parameters and datatype.
+
+        :returns: The configured LocalIndicators.
+        """
+        return cls(
+            loader, remote, os.getenv("ALPHAVANTAGE_INDICATOR_SOURCE", DEFAULT_SOURCE).lower()
+        )
+
+    def supports(self, function: str) -> bool:
+        """Whether an indicator can be computed locally here."""
+        return function in INDICATORS and np is not None
+
+    async def compute(self, function: str, params: dict, datatype: str = "json") -> dict | str:
+        """
+        Compute an indicator locally.
+
+        :argument: function (str): The Alpha Vantage function, e.g. "SMA".
+        :argument: params (dict): The Alpha Vantage parameters, including symbol, interval and month.
+        :argument: datatype (str): "json" or "csv" (default: "json").
+
+        :returns: The payload, shaped like the endpoint's response.
+
+        :raises Unsupported: If the indicator or a parameter is not implemented locally.
+        """
+        require_numpy()
+        indicator = INDICATORS.get(function)
+        if indicator is None:
+            raise Unsupported(f"{function} is not computed locally")
+        interval = params.get("interval") or "daily"
+        series = await self.loader(params["symbol"], interval, params.get("month"))
+        bars = bars_of(series)
+        outputs = indicator.evaluate(bars, params)
+        if datatype == "csv":
+            return to_csv(bars, outputs)
+        return to_payload(indicator, params["symbol"], interval, params, bars, outputs)
+
+    async def run(
+        self, function: str, params: dict, datatype: str = "json", source: str | None = None
+    ) -> dict | str:
+        """
+        Answer an indicator request from the chosen source.
+
+        :argument: function (str): The Alpha Vantage function, e.g. "SMA".
+        :argument: params (dict): The Alpha Vantage parameters.
+        :argument: datatype (str): "json" or "csv" (default: "json").
+        :argument: source (str): "auto", "local" or "remote" (default: the configured source).
+
+        :returns: The indicator payload.
+        """
+        source = (source or self.source).lower()
+        if source not in SOURCES:
+            raise ValueError(f"Unknown indicator source {source!r}; choose from {SOURCES}")
+        interval = params.get("interval") or "daily"
+        if source == "local" or (
+            source == "auto" and self.supports(function) and interval not in self.unavailable
+        ):
+            try:
+                result = await self.compute(function, params, datatype)
+            except (ValueError, ImportError, AlphaVantageError) as e:
+                if source == "local":
+                    raise
+                if _refused(e):
+                    self.unavailable.add(interval)
+                self.fallbacks += 1
+            else:
+                self.local += 1
+                return result
+        self.remote_calls += 1
+        return await self.remote(function, params, datatype)
+
+    def status(self) -> dict:
+        """
+        The default source, how many indicators were computed locally or
+        fetched, and the intervals computed remotely because their series is unavailable.
+        """
+        return {
+            "source": self.source,
+            "local": self.local,
+            "remote": self.remote_calls,
+            "fallbacks": self.fallbacks,
+            "unavailable": sorted(self.unavailable),
+        }
@@ -0,0 +1,159 @@
+from alphavantage_mcp_server.columnar import np
+from alphavantage_mcp_server.indicators.cycles import mesa_average
+from alphavantage_mcp_server.indicators.engine import Bars, Unsupported, indicator
+from alphavantage_mcp_server.indicators.primitives import (
+    ema,
+    first_valid,
+    nans,
+    recurrence,
+    rolling_mean,
+    rolling_sum,
+)
+
+# KAMA's fastest and slowest smoothing constants: EMAs of 2 and 30 periods.
+KAMA_FAST = 2.0 / 3.0
+KAMA_SLOW = 2.0 / 31.0
+T3_VFACTOR = 0.7
+
+
+def _valid(values: "np.ndarray", compute, period: int) -> "np.ndarray":
+    # Run a NaN-free computation on the values after their leading NaNs.
+    out = nans(len(values))
+    start = first_valid(values)
+    if period < 1:
+        raise Unsupported(f"time_period must be at least 1, got {period}")
+    out[start:] = compute(values[start:], period)
+    return out
+
+
+def sma(values: "np.ndarray", period: int) -> "np.ndarray":
+    """Simple moving average, NaN for the first period - 1 values."""
+    return _valid(values, rolling_mean, period)
+
+
+def _wma(values: "np.ndarray", period: int) -> "np.ndarray":
+    out = nans(len(values))
+    if period <= len(values):
+        weights = np.arange(period, 0, -1, dtype=float)
+        out[period - 1 :] = np.convolve(values, weights, "valid") / weights.sum()
+    return out
+
+
+def wma(values: "np.ndarray", period: int) -> "np.ndarray":
+    """Linearly weighted moving average, the newest value weighted `period`."""
+    return _valid(values, _wma, period)
+
+
+def dema(values: "np.ndarray", period: int) -> "np.ndarray":
+    """Double exponential moving average: 2 EMA - EMA(EMA)."""
+    first = ema(values, period)
+    return 2 * first - ema(first, period)
+
+
+def tema(values: "np.ndarray", period: int) -> "np.ndarray":
+    """Triple exponential moving average: 3 EMA - 3 EMA(EMA) + EMA(EMA(EMA))."""
+    first = ema(values, period)
+    second = ema(first, period)
+    return 3 * first - 3 * second + ema(second, period)
+
+
+def trima(values: "np.ndarray", period: int) -> "np.ndarray":
+    """
+    Triangular moving average: a simple average of a simple average, with
+    the two periods split as TA-Lib does for odd and even periods.
+    """
+    inner = period // 2 + 1 if period % 2 == 0 else (period + 1) // 2
+    outer = period // 2 if period % 2 == 0 else inner
+    return sma(sma(values, inner), outer)
+
+
+def _kama(values: "np.ndarray", period: int) -> "np.ndarray":
+    out = nans(len(values))
+    if period >= len(values):
+        return out
+    change = np.abs(values[period:] - values[:-period])
+    steps = np.abs(np.diff(values))
+    volatility = rolling_sum(steps, period)[period - 1 :]
+    # The running sum leaves rounding residue after large moves; a window
+    # without a single move has no volatility at all.
+    moves = rolling_sum((steps != 0).astype(float), period)[period - 1 :]
+    volatility[moves == 0] = 0.0
+    # A window that moved only one way, or not at all, is fully efficient.
+    ratio = np.divide(change, volatility, out=np.ones_like(change), where=volatility > change)
+    constant = (ratio * (KAMA_FAST - KAMA_SLOW) + KAMA_SLOW) ** 2
+    out[period:] = recurrence(1 - constant, constant * values[period:], values[period - 1])
+    return out
+
+
+def kama(values: "np.ndarray", period: int) -> "np.ndarray":
+    """
+    Kaufman adaptive moving average: an EMA whose smoothing constant follows
+    the efficiency ratio of the last `period` changes.
+    """
+    return _valid(values, _kama, period)
+
+
+def t3(values: "np.ndarray", period: int, vfactor: float = T3_VFACTOR) -> "np.ndarray":
+    """Tillson's T3: six chained EMAs combined with the volume factor."""
+    averages = [ema(values, period)]
+    for _ in range(5):
+        averages.append(ema(averages[-1], period))
+    a = vfactor
+    c1 = -(a**3)
+    c2 = 3 * a**2 + 3 * a**3
+    c3 = -6 * a**2 - 3 * a - 3 * a**3
+    c4 = 1 + 3 * a + a**3 + 3 * a**2
+    return c1 * averages[5] + c2 * averages[4] + c3 * averages[3] + c4 * averages[2]
+
+
+# Alpha Vantage's matype codes, as used by BBANDS, STOCH, MACDEXT and others.
+# MAMA ignores the period, as in TA-Lib.
+MATYPES = {
+    0: sma,
+    1: ema,
+    2: wma,
+    3: dema,
+    4: tema,
+    5: trima,
+    6: t3,
+    7: kama,
+    8: lambda values, period: mesa_average(values),
+}
+
+
+def moving_average(values: "np.ndarray", period: int, matype: int = 0) -> "np.ndarray":
+    """
+    The moving average selected by an Alpha Vantage matype code.
+
+    :argument: values (np.ndarray): The input; leading NaNs are skipped.
+    :argument: period (int): The look-back period.
+    :argument: matype (int): 0 SMA, 1 EMA, 2 WMA, 3 DEMA, 4 TEMA, 5 TRIMA, 6 T3, 7 KAMA, 8 MAMA.
+
+    :returns: The average.
+
+    :raises Unsupported: For unknown codes.
+    """
+    average = MATYPES.get(matype)
+    if average is None:
+        raise Unsupported(f"matype {matype} is not computed locally")
+    if period == 1:
+        return values.astype(float)
+    return average(values, period)
+
+
+def _moving_average(function: str, title: str, average):
+    @indicator(function, title, time_period=None, series_type=None)
+    def compute(bars: Bars, time_period: int, series_type: str) -> dict:
+        return {function: average(bars.price(series_type), int(time_period))}
+
+    return compute
+
+
+_moving_average("SMA", "Simple Moving Average (SMA)", sma)
+_moving_average("EMA", "Exponential Moving Average (EMA)", ema)
+_moving_average("WMA", "Weighted Moving Average (WMA)", wma)
+_moving_average("DEMA", "Double Exponential Moving Average (DEMA)", dema)
+_moving_average("TEMA", "Triple Exponential Moving Average (TEMA)", tema)
+_moving_average("TRIMA", "Triangular Exponential Moving Average (TRIMA)", trima)
+_moving_average("KAMA", "Kaufman Adaptive Moving Average (KAMA)", kama)
+_moving_average("T3", "Triple Exponential Moving Average (T3)", t3)
@@ -0,0 +1,205 @@
+from alphavantage_mcp_server.columnar import np
+from alphavantage_mcp_server.indicators.engine import Bars, Unsupported, indicator
+from alphavantage_mcp_server.indicators.moving_averages import moving_average
+from alphavantage_mcp_server.indicators.primitives import (
+    nans,
+    ratio,
+    rolling_max,
+    rolling_min,
+    rolling_sum,
+    shift,
+    sliding,
+    wilder,
+)
+
+# The relative size below which a high-low range is treated as empty.
+FLAT = 1e-12
+# The mean deviation, relative to the average, below which TA-Lib reports a
+# CCI of 0: the rounding noise of averaging a flat window.
+CCI_FLAT = 1e-14
+
+
+def _period(period: int, name: str = "time_period", minimum: int = 2) -> int:
+    if period < minimum:
+        raise Unsupported(f"{name} must be at least {minimum}, got {period}")
+    return period
+
+
+def _gains_losses(values: "np.ndarray", period: int) -> tuple["np.ndarray", "np.ndarray"]:
+    # Wilder-smoothed average gain and loss, seeded with the simple average of
+    # the first `period` changes.
+    change = np.diff(values, prepend=np.nan)
+    gains = np.where(change > 0, change, 0.0)
+    losses = np.where(change < 0, -change, 0.0)
+    gains[0] = losses[0] = np.nan
+    return wilder(gains, period), wilder(losses, period)
+
+
+def rsi(values: "np.ndarray", period: int) -> "np.ndarray":
+    """Relative strength index with Wilder smoothing."""
+    gains, losses = _gains_losses(values, period)
+    return 100 * ratio(gains, gains + losses)
+
+
+def cmo(values: "np.ndarray", period: int) -> "np.ndarray":
+    """Chande momentum oscillator, on Wilder-smoothed gains and losses as TA-Lib computes it."""
+    gains, losses = _gains_losses(values, period)
+    return 100 * ratio(gains - losses, gains + losses)
+
+
+def fast_k(close: "np.ndarray", high: "np.ndarray", low: "np.ndarray", period: int) -> "np.ndarray":
+    """Where the close lies in the high-low range of the last `period` bars, from 0 to 100."""
+    lowest = rolling_min(low, period)
+    highest = rolling_max(high, period)
+    spread = highest - lowest
+    # A range of rounding noise, e.g. of an RSI through flat prices, is no range.
+    spread[np.abs(spread) <= FLAT * np.abs(highest)] = 0.0
+    return 100 * ratio(close - lowest, spread)
+
+
+def stochastic_fast(values_k: "np.ndarray", fastdperiod: int, fastdmatype: int) -> dict:
+    """The fast %K and its moving average, the fast %D."""
+    return {"FastK": values_k, "FastD": moving_average(values_k, fastdperiod, fastdmatype)}
+
+
+def momentum(values: "np.ndarray", period: int) -> "np.ndarray":
+    """The change over `period` bars."""
+    return values - shift(values, period)
+
+
+@indicator("RSI", "Relative Strength Index (RSI)", time_period=14, series_type=None)
+def _rsi(bars: Bars, time_period: int, series_type: str) -> dict:
+    return {"RSI": rsi(bars.price(series_type), _period(time_period))}
+
+
+@indicator("CMO", "Chande Momentum Oscillator (CMO)", time_period=14, series_type=None)
+def _cmo(bars: Bars, time_period: int, series_type: str) -> dict:
+    return {"CMO": cmo(bars.price(series_type), _period(time_period))}
+
+
+@indicator(
+    "STOCH",
+    "Stochastic (STOCH)",
+    fastkperiod=5,
+    slowkperiod=3,
+    slowdperiod=3,
+    slowkmatype=0,
+    slowdmatype=0,
+)
+def _stoch(
+    bars: Bars,
+    fastkperiod: int,
+    slowkperiod: int,
+    slowdperiod: int,
+    slowkmatype: int,
+    slowdmatype: int,
+) -> dict:
+    k = fast_k(bars.close, bars.high, bars.low, _period(fastkperiod, "fastkperiod", 1))
+    slow_k = moving_average(k, _period(slowkperiod, "slowkperiod", 1), slowkmatype)
+    slow_d = moving_average(slow_k, _period(slowdperiod, "slowdperiod", 1), slowdmatype)
+    return {"SlowK": slow_k, "SlowD": slow_d}
+
+
+@indicator("STOCHF", "Stochastic Fast (STOCHF)", fastkperiod=5, fastdperiod=3, fastdmatype=0)
+def _stochf(bars: Bars, fastkperiod: int, fastdperiod: int, fastdmatype: int) -> dict:
+    k = fast_k(bars.close, bars.high, bars.low, _period(fastkperiod, "fastkperiod", 1))
+    return stochastic_fast(k, _period(fastdperiod, "fastdperiod", 1), fastdmatype)
+
+
+@indicator(
+    "STOCHRSI",
+    "Stochastic Relative Strength Index (STOCHRSI)",
+    time_period=14,
+    series_type=None,
+    fastkperiod=5,
+    fastdperiod=3,
+    fastdmatype=0,
+)
+def _stochrsi(
+    bars: Bars,
+    time_period: int,
+    series_type: str,
+    fastkperiod: int,
+    fastdperiod: int,
+    fastdmatype: int,
+) -> dict:
+    values = rsi(bars.price(series_type), _period(time_period))
+    k = fast_k(values, values, values, _period(fastkperiod, "fastkperiod", 1))
+    return stochastic_fast(k, _period(fastdperiod, "fastdperiod", 1), fastdmatype)
+
+
+@indicator("WILLR", "Williams' %R (WILLR)", time_period=14)
+def _willr(bars: Bars, time_period: int) -> dict:
+    period = _period(time_period)
+    highest = rolling_max(bars.high, period)
+    return {"WILLR": -100 * ratio(highest - bars.close, highest - rolling_min(bars.low, period))}
+
+
+@indicator("CCI", "Commodity Channel Index (CCI)", time_period=20)
+def _cci(bars: Bars, time_period: int) -> dict:
+    period = _period(time_period)
+    typical = bars.typical_price()
+    average = nans(len(typical))
+    deviation = nans(len(typical))
+    if period <= len(typical):
+        windows = sliding(typical, period)
+        means = windows.mean(axis=1)
+        spread = np.abs(windows - means[:, None]).mean(axis=1)
+        average[period - 1 :] = means
+        # A zero deviation makes the CCI 0, as on a flat window in TA-Lib.
+        deviation[period - 1 :] = np.where(spread <= CCI_FLAT * np.abs(means), 0.0, spread)
+    return {"CCI": ratio(typical - average, 0.015 * deviation)}
+
+
+@indicator("MOM", "Momentum (MOM)", time_period=10, series_type=None)
+def _mom(bars: Bars, time_period: int, series_type: str) -> dict:
+    return {"MOM": momentum(bars.price(series_type), _period(time_period, minimum=1))}
+
+
+@indicator("ROC", "Rate of change : ((price/prevPrice)-1)*100", time_period=10, series_type=None)
+def _roc(bars: Bars, time_period: int, series_type: str) -> dict:
+    values = bars.price(series_type)
+    change = momentum(values, _period(time_period, minimum=1))
+    return {"ROC": 100 * ratio(change, shift(values, time_period))}
+
+
+@indicator("ROCR", "Rate of change ratio: (price/prevPrice)", time_period=10, series_type=None)
+def _rocr(bars: Bars, time_period: int, series_type: str) -> dict:
+    values = bars.price(series_type)
+    return {"ROCR": ratio(values, shift(values, _period(time_period, minimum=1)))}
+
+
+@indicator("MFI", "Money Flow Index (MFI)", time_period=14)
+def _mfi(bars: Bars, time_period: int) -> dict:
+    period = _period(time_period)
+    typical = bars.typical_price()
+    flow = typical * bars.volume
+    change = np.diff(typical, prepend=np.nan)
+    positive = rolling_sum(np.where(change > 0, flow, 0.0)[1:], period)
+    negative = rolling_sum(np.where(change < 0, flow, 0.0)[1:], period)
+    total = positive + negative
+    # TA-Lib reports 0 when less than one unit of money flowed in the window.
+    out = np.where(total < 1, 0.0, 100 * ratio(positive, total))
+    out[np.isnan(total)] = np.nan
+    return {"MFI": np.concatenate([[np.nan], out])}
+
+
+@indicator("ULTOSC", "Ultimate Oscillator (ULTOSC)", timeperiod1=7, timeperiod2=14, timeperiod3=28)
+def _ultosc(bars: Bars, timeperiod1: int, timeperiod2: int, timeperiod3: int) -> dict:
+    # TA-Lib orders the periods, so the shortest is weighted 4 and the longest 1.
+    periods = sorted(
+        _period(period, "timeperiod", 1) for period in (timeperiod1, timeperiod2, timeperiod3)
+    )
+    true_low = bars.true_low()[1:]
+    buying = bars.close[1:] - true_low
+    true_range = bars.true_high()[1:] - true_low
+    weighted = [
+        weight * ratio(rolling_sum(buying, period), rolling_sum(true_range, period))
+        for weight, period in zip((4, 2, 1), periods)
+    ]
+    return {"ULTOSC": np.concatenate([[np.nan], 100 * sum(weighted) / 7])}
+
+
+@indicator("BOP", "Balance Of Power (BOP)")
+def _bop(bars: Bars) -> dict:
+    return {"BOP": ratio(bars.close - bars.open, bars.high - bars.low)}
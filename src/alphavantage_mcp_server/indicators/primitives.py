@@ -0,0 +1,231 @@
+import math
+
+from alphavantage_mcp_server.columnar import np
+
+# The smallest running product kept inside one block of a recurrence, so that
+# dividing by it stays far from overflow.
+_MIN_PRODUCT = 1e-200
+
+
+def nans(count: int) -> "np.ndarray":
+    """An array of `count` NaNs."""
+    return np.full(count, np.nan)
+
+
+def first_valid(values: "np.ndarray") -> int:
+    """The position of the first non-NaN value, or len(values) if there is none."""
+    valid = np.flatnonzero(~np.isnan(values))
+    return int(valid[0]) if len(valid) else len(values)
+
+
+def rolling_sum(values: "np.ndarray", period: int) -> "np.ndarray":
+    """
+    Sums over a sliding window in O(n), from cumulative sums.
+
+    :argument: values (np.ndarray): The input, without NaNs.
+    :argument: period (int): The window length.
+
+    :returns: The window sums, NaN for the first period - 1 positions.
+    """
+    out = nans(len(values))
+    if period <= len(values):
+        cumulative = np.cumsum(values)
+        out[period - 1] = cumulative[period - 1]
+        out[period:] = cumulative[period:] - cumulative[:-period]
+    return out
+
+
+def rolling_mean(values: "np.ndarray", period: int) -> "np.ndarray":
+    """The mean over a sliding window, NaN for the first period - 1 positions."""
+    return rolling_sum(values, period) / period
+
+
+def recurrence(decay, inputs: "np.ndarray", initial: float) -> "np.ndarray":
+    """
+    Solve y[t] = decay[t] * y[t - 1] + inputs[t] with y[-1] = initial, vectorized.
+
+    Exponential averages, Wilder smoothing and adaptive averages are all of
+    this form. The series is cut into blocks short enough for the running
+    product of the decays not to underflow; within a block every value is
+    computed at once from cumulative products and sums.
+
+    :argument: decay (float | np.ndarray): The decay factor, constant or per position, in [0, 1).
+    :argument: inputs (np.ndarray): The input term of each position.
+    :argument: initial (float): The value before the first position.
+
+    :returns: The solution, one value per input.
+    """
+    count = len(inputs)
+    out = np.empty(count)
+    if count == 0:
+        return out
+    constant = np.ndim(decay) == 0
+    if constant and decay == 0:
+        out[:] = inputs
+        return out
+    smallest = decay if constant else max(float(np.min(decay)), 1e-300)
+    block = count
+    if smallest < 1:
+        block = min(count, max(1, int(math.log(_MIN_PRODUCT) / math.log(smallest))))
+    if constant:
+        powers = decay ** np.arange(1, block + 1)
+    previous = initial
+    for start in range(0, count, block):
+        end = min(start + block, count)
+        if constant:
+            products = powers[: end - start]
+        else:
+            products = np.cumprod(decay[start:end])
+        out[start:end] = products * (previous + np.cumsum(inputs[start:end] / products))
+        previous = out[end - 1]
+    return out
+
+
+def ema(values: "np.ndarray", period: int, alpha: float | None = None) -> "np.ndarray":
+    """
+    Exponential moving average, seeded with the simple average of the first
+    `period` valid values, as TA-Lib and Alpha Vantage do.
+
+    :argument: values (np.ndarray): The input; leading NaNs are skipped.
+    :argument: period (int): The look-back period.
+    :argument: alpha (float): The smoothing factor (default: 2 / (period + 1)).
+
+    :returns: The average, NaN until the seed.
+    """
+    if alpha is None:
+        alpha = 2.0 / (period + 1)
+    out = nans(len(values))
+    start = first_valid(values)
+    seed_at = start + period - 1
+    if seed_at >= len(values):
+        return out
+    seed = float(np.mean(values[start : seed_at + 1]))
+    out[seed_at] = seed
+    out[seed_at + 1 :] = recurrence(1 - alpha, alpha * values[seed_at + 1 :], seed)
+    return out
+
+
+def wilder(values: "np.ndarray", period: int) -> "np.ndarray":
+    """Wilder's smoothing: an exponential average with alpha = 1 / period."""
+    return ema(values, period, 1.0 / period)
+
+
+def sliding(values: "np.ndarray", period: int) -> "np.ndarray":
+    """A read-only (n - period + 1, period) view of every window."""
+    return np.lib.stride_tricks.sliding_window_view(values, period)
+
+
+def _blocks(values: "np.ndarray", period: int, fill: float, spare: int = 0) -> "np.ndarray":
+    # The values cut into rows of `period`, padded with `fill` and `spare` more rows.
+    padding = (-len(values)) % period + spare * period
+    return np.concatenate([values, np.full(padding, fill)]).reshape(-1, period)
+
+
+def _rolling_extreme(values: "np.ndarray", period: int, extreme, fill: float) -> "np.ndarray":
+    # van Herk/Gil-Werman: cut the series into blocks of `period`; every window
+    # spans the tail of one block and the head of the next, so its extreme is
+    # that of a running suffix and a running prefix. O(n) for any period.
+    count = len(values)
+    out = nans(count)
+    if period > count:
+        return out
+    blocks = _blocks(values, period, fill)
+    prefix = extreme.accumulate(blocks, axis=1).ravel()
+    suffix = extreme.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    out[period - 1 :] = extreme(suffix[: count - period + 1], prefix[period - 1 : count])
+    return out
+
+
+def rolling_max(values: "np.ndarray", period: int) -> "np.ndarray":
+    """The maximum over a sliding window in O(n), NaN for the first period - 1 positions."""
+    return _rolling_extreme(values, period, np.maximum, -np.inf)
+
+
+def rolling_min(values: "np.ndarray", period: int) -> "np.ndarray":
+    """The minimum over a sliding window in O(n), NaN for the first period - 1 positions."""
+    return _rolling_extreme(values, period, np.minimum, np.inf)
+
+
+def rolling_variance(values: "np.ndarray", period: int) -> "np.ndarray":
+    """
+    The population variance over a sliding window in O(n).
+
+    Like the rolling extremes, each window is the tail of one block and the
+    head of the next. Sums within a block are of deviations from its first
+    value, so they stay small and exact on long series, and the two parts are
+    combined with Chan's formula.
+
+    :argument: values (np.ndarray): The input, without NaNs.
+    :argument: period (int): The window length.
+
+    :returns: The variances, NaN for the first period - 1 positions.
+    """
+    count = len(values)
+    out = nans(count)
+    if period > count:
+        return out
+    blocks = _blocks(values, period, 0.0, spare=1)
+    reference = blocks[:, 0].repeat(period)
+    deviations = blocks - blocks[:, :1]
+    # Sums of the first j values of each block, and of the values from j on.
+    head = np.zeros_like(deviations)
+    head_squares = np.zeros_like(deviations)
+    np.cumsum(deviations[:, :-1], axis=1, out=head[:, 1:])
+    np.cumsum(deviations[:, :-1] ** 2, axis=1, out=head_squares[:, 1:])
+    tail = (deviations.sum(axis=1)[:, None] - head).ravel()
+    tail_squares = ((deviations**2).sum(axis=1)[:, None] - head_squares).ravel()
+    head, head_squares = head.ravel(), head_squares.ravel()
+
+    start = np.arange(count - period + 1)
+    end = start + period
+    tail_count = period - start % period
+    head_count = period - tail_count
+    tail_sum, head_sum = tail[start], head[end]
+    spread = tail_squares[start] - tail_sum**2 / tail_count
+    spread += head_squares[end] - ratio(head_sum**2, head_count)
+    # Chan et al.: the parts' spreads plus that of their means.
+    gap = reference[end] + ratio(head_sum, head_count) - reference[start] - tail_sum / tail_count
+    spread += np.where(head_count > 0, gap * gap * tail_count * head_count / period, 0.0)
+    variance = np.maximum(spread / period, 0.0)
+    # A window without a single change has no variance, whatever the rounding.
+    if period > 1:
+        moves = rolling_sum((np.diff(values) != 0).astype(float), period - 1)
+        variance[moves[period - 2 :] == 0] = 0.0
+    out[period - 1 :] = variance
+    return out
+
+
+def shift(values: "np.ndarray", lag: int = 1) -> "np.ndarray":
+    """The values `lag` positions earlier, NaN for the first `lag` positions."""
+    out = nans(len(values))
+    if lag < len(values):
+        out[lag:] = values[: len(values) - lag]
+    return out
+
+
+def ratio(numerator: "np.ndarray", denominator: "np.ndarray") -> "np.ndarray":
+    """numerator / denominator, 0 where the denominator is 0, as TA-Lib does."""
+    out = np.where(np.isnan(denominator), np.nan, 0.0)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
+
+def wilder_sum(values: "np.ndarray", period: int) -> "np.ndarray":
+    """
+    Wilder's running sum, used for the directional movement and true range:
+    the sum of the first period - 1 values after the first bar, then
+    S[t] = S[t - 1] - S[t - 1] / period + values[t].
+
+    :argument: values (np.ndarray): The per-bar values, undefined (NaN) for the first bar.
+    :argument: period (int): The smoothing period; 1 returns the values unsmoothed.
+
+    :returns: The running sum, NaN for the first period - 1 bars.
+    """
+    if period == 1:
+        return values.astype(float)
+    out = nans(len(values))
+    if period > len(values):
+        return out
+    out[period - 1] = np.sum(values[1:period])
+    out[period:] = recurrence(1 - 1.0 / period, values[period:], out[period - 1])
+    return out
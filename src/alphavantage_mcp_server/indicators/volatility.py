@@ -0,0 +1,90 @@
+from alphavantage_mcp_server.columnar import np
+from alphavantage_mcp_server.indicators.engine import Bars, Unsupported, indicator
+from alphavantage_mcp_server.indicators.moving_averages import moving_average
+from alphavantage_mcp_server.indicators.primitives import (
+    ratio,
+    rolling_max,
+    rolling_min,
+    rolling_variance,
+    wilder,
+)
+
+# Every indicator here is O(n) whatever its window: the bands' deviation and
+# the midpoints' extremes come from block-decomposed rolling primitives, the
+# true range from memoized bar intermediates.
+
+
+def _period(period: int, minimum: int = 2) -> int:
+    if period < minimum:
+        raise Unsupported(f"time_period must be at least {minimum}, got {period}")
+    return period
+
+
+def atr(bars: Bars, period: int) -> "np.ndarray":
+    """
+    The average true range: the true range with Wilder smoothing, seeded with
+    the simple average of its first `period` values.
+    """
+    if period == 1:
+        return bars.true_range()
+    return bars.memo(("atr", period), lambda: wilder(bars.true_range(), period))
+
+
+@indicator(
+    "BBANDS",
+    "Bollinger Bands (BBANDS)",
+    time_period=None,
+    series_type=None,
+    nbdevup=2.0,
+    nbdevdn=2.0,
+    matype=0,
+)
+def _bbands(
+    bars: Bars,
+    time_period: int,
+    series_type: str,
+    nbdevup: float,
+    nbdevdn: float,
+    matype: int,
+) -> dict:
+    values = bars.price(series_type)
+    middle = moving_average(values, _period(time_period), matype)
+    # The deviation is the population one over the window, whatever the average.
+    deviation = np.sqrt(rolling_variance(values, time_period))
+    return {
+        "Real Upper Band": middle + nbdevup * deviation,
+        "Real Middle Band": middle,
+        "Real Lower Band": middle - nbdevdn * deviation,
+    }
+
+
+@indicator("TRANGE", "True Range (TRANGE)")
+def _trange(bars: Bars) -> dict:
+    return {"TRANGE": bars.true_range()}
+
+
+@indicator("ATR", "Average True Range (ATR)", time_period=14)
+def _atr(bars: Bars, time_period: int) -> dict:
+    return {"ATR": atr(bars, _period(time_period, 1))}
+
+
+@indicator("NATR", "Normalized Average True Range (NATR)", time_period=14)
+def _natr(bars: Bars, time_period: int) -> dict:
+    period = _period(time_period, 1)
+    if period == 1:
+        # TA-Lib, and so Alpha Vantage, reports the bare true range for period 1.
+        return {"NATR": bars.true_range()}
+    return {"NATR": 100 * ratio(atr(bars, period), bars.close)}
+
+
+@indicator("MIDPOINT", "MidPoint over period (MIDPOINT)", time_period=14, series_type=None)
+def _midpoint(bars: Bars, time_period: int, series_type: str) -> dict:
+    values = bars.price(series_type)
+    period = _period(time_period)
+    return {"MIDPOINT": (rolling_max(values, period) + rolling_min(values, period)) / 2}
+
+
+@indicator("MIDPRICE", "Midpoint Price over period (MIDPRICE)", time_period=14)
+def _midprice(bars: Bars, time_period: int) -> dict:
+    period = _period(time_period)
+    return {"MIDPRICE": (rolling_max(bars.high, period) + rolling_min(bars.low, period)) / 2}
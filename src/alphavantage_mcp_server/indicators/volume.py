@@ -0,0 +1,85 @@
+from alphavantage_mcp_server.columnar import np
+from alphavantage_mcp_server.indicators.engine import Bars, Unsupported, indicator
+from alphavantage_mcp_server.indicators.primitives import nans, ratio, recurrence
+
+
+def accumulation_distribution(bars: Bars) -> "np.ndarray":
+    """
+    The Chaikin accumulation/distribution line: the running total of each
+    bar's volume weighted by where the close lies in its high-low range.
+    """
+
+    def compute():
+        spread = bars.high - bars.low
+        location = (bars.close - bars.low) - (bars.high - bars.close)
+        return np.cumsum(ratio(location, spread) * bars.volume)
+
+    return bars.memo(("ad",), compute)
+
+
+def _seeded_ema(values: "np.ndarray", period: int) -> "np.ndarray":
+    # TA-Lib's ADOSC seeds its averages with the first value, not a simple average.
+    alpha = 2.0 / (period + 1)
+    out = np.empty(len(values))
+    if len(values):
+        out[0] = values[0]
+        out[1:] = recurrence(1 - alpha, alpha * values[1:], values[0])
+    return out
+
+
+@indicator("AD", "Chaikin A/D Line")
+def _ad(bars: Bars) -> dict:
+    return {"Chaikin A/D": accumulation_distribution(bars)}
+
+
+@indicator("ADOSC", "Chaikin A/D Oscillator (ADOSC)", fastperiod=3, slowperiod=10)
+def _adosc(bars: Bars, fastperiod: int, slowperiod: int) -> dict:
+    if fastperiod < 2 or slowperiod < 2:
+        raise Unsupported("fastperiod and slowperiod must be at least 2")
+    line = accumulation_distribution(bars)
+    out = _seeded_ema(line, fastperiod) - _seeded_ema(line, slowperiod)
+    out[: max(fastperiod, slowperiod) - 1] = np.nan
+    return {"ADOSC": out}
+
+
+@indicator("OBV", "On Balance Volume (OBV)")
+def _obv(bars: Bars) -> dict:
+    signed = np.sign(np.diff(bars.close, prepend=np.nan)) * bars.volume
+    # The first bar's volume opens the total.
+    signed[:1] = bars.volume[:1]
+    return {"OBV": np.cumsum(signed)}
+
+
+def vwap(bars: Bars) -> "np.ndarray":
+    """
+    The volume weighted average typical price since each session's first bar.
+
+    A session is a calendar day of intraday bars, so the running totals start
+    over at each day's first bar. Until a session trades, its VWAP is the
+    typical price.
+    """
+    typical = bars.typical_price()
+    out = nans(len(bars))
+    if not len(bars):
+        return out
+    days = bars.index.astype("datetime64[D]")
+    starts = np.flatnonzero(np.concatenate([[True], days[1:] != days[:-1]]))
+    lengths = np.diff(np.append(starts, len(bars)))
+
+    def session_totals(values):
+        # Running totals, less the total before each session's first bar.
+        total = np.cumsum(values)
+        before = total[starts] - values[starts]
+        return total - np.repeat(before, lengths)
+
+    traded = session_totals(typical * bars.volume)
+    volume = session_totals(bars.volume)
+    np.divide(traded, volume, out=out, where=volume > 0)
+    return np.where(volume > 0, out, typical)
+
+
+@indicator("VWAP", "Volume Weighted Average Price (VWAP)")
+def _vwap(bars: Bars) -> dict:
+    if not bars.intraday:
+        raise Unsupported("VWAP is only available for intraday intervals")
+    return {"VWAP": vwap(bars)}
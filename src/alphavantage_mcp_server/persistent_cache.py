@@ -0,0 +1,142 @@
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any
+
+from alphavantage_mcp_server import serialization
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    function TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    is_csv INTEGER NOT NULL,
+    body BLOB NOT NULL
+)
+"""
+
+
+@dataclass
+class StoredResponse:
+    value: Any
+    fetched_at: float
+
+
+def _encode(value: Any) -> tuple[bool, bytes]:
+    if isinstance(value, str):
+        return True, zlib.compress(value.encode())
+    return False, zlib.compress(serialization.dumps(value).encode())
+
+
+def _decode(is_csv: bool, body: bytes) -> Any:
+    text = zlib.decompress(body).decode()
+    return text if is_csv else serialization.loads(text)
+
+
+class SQLiteCache:
+    """
+    A persistent response store in a local SQLite file, shared by every server
+    process on the host.
+
+    Bodies are stored zlib-compressed together with their fetch time, so
+    freshness is decided by the reader's TTL policy. The database runs in WAL
+    mode with a busy timeout, which lets several processes read and write it
+    concurrently. Blocking SQLite calls run in a worker thread.
+    """
+
+    def __init__(self, path: str, timeout: float = 5.0):
+        self.path = os.path.expanduser(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(
+            self.path, timeout=timeout, check_same_thread=False, isolation_level=None
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(SCHEMA)
+        self.prune()
+
+    @classmethod
+    def from_env(cls) -> "SQLiteCache | None":
+        """
+        Open the store named by ALPHAVANTAGE_CACHE_PATH, if set.
+
+        :returns: The SQLiteCache, or None when persistent caching is disabled.
+        """
+        path = os.getenv("ALPHAVANTAGE_CACHE_PATH")
+        return cls(path) if path else None
+
+    def _get(self, key: str) -> StoredResponse | None:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT fetched_at, is_csv, body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        fetched_at, is_csv, body = row
+        return StoredResponse(_decode(bool(is_csv), body), fetched_at)
+
+    def _put(
+        self, key: str, function: str, value: Any, fetched_at: float, expires_at: float
+    ) -> None:
+        is_csv, body = _encode(value)
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (key, function, fetched_at, expires_at, int(is_csv), body),
+            )
+
+    async def get(self, key: str) -> StoredResponse | None:
+        """
+        Read a stored response, whatever its age.
+
+        :argument: key (str): The query key.
+
+        :returns: The stored response, or None if there is none.
+        """
+        return await asyncio.to_thread(self._get, key)
+
+    async def put(
+        self, key: str, function: str, value: Any, fetched_at: float, ttl: float
+    ) -> None:
+        """
+        Store a response.
+
+        :argument: key (str): The query key.
+        :argument: function (str): The Alpha Vantage function.
+        :argument: value (Any): The decoded response.
+        :argument: fetched_at (float): When the response was fetched, as a Unix timestamp.
+        :argument: ttl (float): The time to live in seconds, used to prune old rows.
+        """
+        await asyncio.to_thread(self._put, key, function, value, fetched_at, fetched_at + ttl)
+
+    def prune(self, now: float | None = None) -> int:
+        """
+        Delete expired rows.
+
+        :returns: The number of rows deleted.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            return self._db.execute(
+                "DELETE FROM responses WHERE expires_at < ?", (now,)
+            ).rowcount
+
+    def status(self) -> dict:
+        """
+        The number of stored responses and the database size.
+        """
+        with self._lock:
+            (rows,) = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+        return {"path": self.path, "entries": rows, "bytes": os.path.getsize(self.path)}
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,256 @@
+import asyncio
+import os
+import time
+from collections.abc import Awaitable, Callable
+
+# Requests per minute and per day allowed by each Alpha Vantage plan.
+# `None` means the plan has no cap for that period.
+PLANS: dict[str, tuple[int | None, int | None]] = {
+    "free": (5, 25),
+    "premium-75": (75, None),
+    "premium-150": (150, None),
+    "premium-300": (300, None),
+    "premium-600": (600, None),
+    "premium-1200": (1200, None),
+    "unlimited": (None, None),
+}
+
+# Requests are not paced unless a plan or limit is configured.
+DEFAULT_PLAN = None
+DEFAULT_MAX_WAIT = 300.0
+
+# Adaptive pacing: every throttled response halves the refill rate, down to
+# MIN_RATE_SCALE, and every successful one restores RATE_RECOVERY_STEP of it.
+MIN_RATE_SCALE = 0.1
+RATE_RECOVERY_STEP = 0.05
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request would have to wait longer than the limiter allows."""
+
+
+class TokenBucket:
+    """
+    A token bucket holding up to `capacity` tokens, refilled continuously at
+    `capacity` tokens per `period` seconds.
+    """
+
+    def __init__(
+        self, capacity: int, period: float, clock: Callable[[], float] = time.monotonic
+    ):
+        self.capacity = capacity
+        self.period = period
+        self.rate = capacity / period
+        self.scale = 1.0
+        self.tokens = float(capacity)
+        self._clock = clock
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def available(self) -> float:
+        """
+        The number of tokens currently in the bucket.
+        """
+        self._refill()
+        return self.tokens
+
+    def wait_time(self) -> float:
+        """
+        The number of seconds until a token is available.
+        """
+        self._refill()
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self) -> None:
+        """
+        Remove one token from the bucket.
+        """
+        self._refill()
+        self.tokens -= 1
+
+    def drain(self) -> None:
+        """
+        Empty the bucket, so the next token is a full refill interval away.
+        """
+        self._refill()
+        self.tokens = min(self.tokens, 0.0)
+
+    def set_scale(self, scale: float) -> None:
+        """
+        Refill at `scale` times the nominal rate.
+        """
+        self._refill()
+        self.scale = scale
+        self.rate = self.capacity / self.period * scale
+
+
+class RateLimiter:
+    """
+    Paces requests to stay within a per-minute and a per-day request budget.
+
+    Callers are served strictly in arrival order: each one waits for a token
+    while holding the queue, so a burst of tool calls is spread out instead of
+    being throttled upstream. A caller that would have to wait more than
+    `max_wait` seconds (typically because the daily budget is spent) fails with
+    RateLimitExceeded instead of blocking the queue.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        requests_per_day: int | None = None,
+        plan: str | None = None,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ):
+        self.plan = plan
+        self.max_wait = max_wait
+        self.minute = (
+            TokenBucket(requests_per_minute, 60, clock) if requests_per_minute else None
+        )
+        self.day = TokenBucket(requests_per_day, 86400, clock) if requests_per_day else None
+        self._sleep = sleep
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+        self.waiting = 0
+        self.acquired = 0
+        self.rejected = 0
+        self.throttled = 0
+
+    @classmethod
+    def from_env(cls) -> "RateLimiter":
+        """
+        Build a limiter from the environment.
+
+        ALPHAVANTAGE_PLAN selects one of PLANS; when it is not set, requests
+        are not paced. ALPHAVANTAGE_REQUESTS_PER_MINUTE and
+        ALPHAVANTAGE_REQUESTS_PER_DAY override the plan's limits; 0 disables a limit.
+        ALPHAVANTAGE_RATE_LIMIT_MAX_WAIT bounds how long a caller may queue.
+
+        :returns: The configured RateLimiter.
+        """
+        plan = (os.getenv("ALPHAVANTAGE_PLAN") or "").lower() or DEFAULT_PLAN
+        if plan is not None and plan not in PLANS:
+            raise ValueError(
+                f"Unknown ALPHAVANTAGE_PLAN {plan!r}, expected one of: {', '.join(PLANS)}"
+            )
+        per_minute, per_day = PLANS[plan] if plan is not None else (None, None)
+        if os.getenv("ALPHAVANTAGE_REQUESTS_PER_MINUTE"):
+            per_minute = int(os.getenv("ALPHAVANTAGE_REQUESTS_PER_MINUTE"))
+        if os.getenv("ALPHAVANTAGE_REQUESTS_PER_DAY"):
+            per_day = int(os.getenv("ALPHAVANTAGE_REQUESTS_PER_DAY"))
+        max_wait = float(os.getenv("ALPHAVANTAGE_RATE_LIMIT_MAX_WAIT", DEFAULT_MAX_WAIT))
+        return cls(per_minute, per_day, plan=plan, max_wait=max_wait)
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _buckets(self) -> list[TokenBucket]:
+        return [bucket for bucket in (self.minute, self.day) if bucket is not None]
+
+    async def acquire(self) -> None:
+        """
+        Wait, in arrival order, until a request may be sent.
+
+        :raises RateLimitExceeded: If the wait would exceed `max_wait`.
+        """
+        buckets = self._buckets()
+        if not buckets:
+            self.acquired += 1
+            return
+
+        self.waiting += 1
+        try:
+            async with self._get_lock():
+                while True:
+                    wait = max(bucket.wait_time() for bucket in buckets)
+                    if wait <= 0:
+                        break
+                    if wait > self.max_wait:
+                        self.rejected += 1
+                        raise RateLimitExceeded(
+                            f"Alpha Vantage request budget exhausted, next request "
+                            f"allowed in {wait:.0f}s"
+                        )
+                    await self._sleep(wait)
+                for bucket in buckets:
+                    bucket.take()
+                self.acquired += 1
+        finally:
+            self.waiting -= 1
+
+    def record_throttle(self, daily: bool = False) -> None:
+        """
+        Slow down after the API reported that the budget is spent.
+
+        :argument: daily (bool): Whether the daily budget is spent (default: False).
+        """
+        self.throttled += 1
+        if daily and self.day is not None:
+            self.day.drain()
+        if self.minute is not None:
+            self.minute.drain()
+            self.minute.set_scale(max(MIN_RATE_SCALE, self.minute.scale / 2))
+
+    def record_success(self) -> None:
+        """
+        Gradually restore the nominal rate after a successful request.
+        """
+        if self.minute is not None and self.minute.scale < 1:
+            self.minute.set_scale(min(1.0, self.minute.scale + RATE_RECOVERY_STEP))
+
+    def describe(self) -> str:
+        """
+        The active plan and limits, in one line for the startup log.
+        """
+        limits = [
+            f"{bucket.capacity} requests per {name}"
+            for name, bucket in (("minute", self.minute), ("day", self.day))
+            if bucket is not None
+        ]
+        if not limits:
+            return "Requests are not paced; set ALPHAVANTAGE_PLAN to stay within your plan"
+        return f"Pacing requests for plan {self.plan or 'custom'}: {', '.join(limits)}"
+
+    async def middleware(self, query, call_next):
+        """
+        Request middleware acquiring a token before every upstream request.
+        """
+        await self.acquire()
+        return await call_next(query)
+
+    def status(self) -> dict:
+        """
+        The current request budget.
+
+        :returns: The plan, limits, remaining tokens and queue length.
+        """
+
+        def bucket_status(bucket: TokenBucket | None) -> dict | None:
+            if bucket is None:
+                return None
+            return {
+                "limit": bucket.capacity,
+                "available": round(bucket.available(), 2),
+                "next_token_in_seconds": round(bucket.wait_time(), 2),
+                "rate_scale": round(bucket.scale, 2),
+            }
+
+        return {
+            "plan": self.plan,
+            "per_minute": bucket_status(self.minute),
+            "per_day": bucket_status(self.day),
+            "waiting": self.waiting,
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "throttled": self.throttled,
+        }
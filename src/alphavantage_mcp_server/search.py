@@ -0,0 +1,233 @@
+import asyncio
+import os
+import re
+from collections import Counter, OrderedDict
+from datetime import datetime
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from alphavantage_mcp_server.universe import Listing, SymbolUniverse
+
+DEFAULT_LIMIT = 10
+# The top local score at or above which the remote SYMBOL_SEARCH is not called.
+DEFAULT_MIN_SCORE = 0.8
+# Ticker prefix matches kept per trie node, shortest tickers first.
+PREFIX_CANDIDATES = 64
+# Name candidates scored exactly, by number of shared trigrams.
+NAME_CANDIDATES = 200
+# Searches remembered per index; agents repeat the same lookups while resolving names.
+MEMO_SIZE = 1024
+
+# Words that appear in thousands of names and say nothing about which company is meant.
+STOPWORDS = frozenset(
+    {
+        "inc", "corp", "corporation", "co", "company", "ltd", "plc", "the",
+        "class", "common", "stock", "holdings", "group",
+    }
+)
+
+ASSET_TYPES = {"Stock": "Equity", "ETF": "ETF"}
+# Exchanges whose listings trade in the US session, in USD, as the local
+# results report; searches for anything else go to SYMBOL_SEARCH.
+US_EXCHANGES = frozenset(
+    {"NYSE", "NYSE ARCA", "NYSE MKT", "NYSE AMERICAN", "AMEX", "NASDAQ", "BATS"}
+)
+
+
+def normalize(text: str) -> str:
+    """Lowercase words of a name or query, without punctuation and stopwords."""
+    words = re.sub(r"[^a-z0-9]+", " ", text.lower()).split()
+    return " ".join(word for word in words if word not in STOPWORDS)
+
+
+def trigrams(text: str) -> set[str]:
+    """The character trigrams of a normalized text, padded to weigh word starts."""
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _us_market_timezone() -> str:
+    try:
+        offset = datetime.now(ZoneInfo("America/New_York")).utcoffset()
+    except ZoneInfoNotFoundError:
+        return "UTC-05"
+    hours = int(offset.total_seconds() // 3600)
+    return f"UTC{hours:+03d}"
+
+
+class _TrieNode:
+    __slots__ = ("children", "positions")
+
+    def __init__(self):
+        self.children: dict[str, _TrieNode] = {}
+        self.positions: list[int] = []
+
+
+class SymbolSearchIndex:
+    """
+    A local replacement for SYMBOL_SEARCH over the active US-exchange
+    listings of a symbol universe.
+
+    Tickers are matched through a prefix trie; company names through a
+    trigram index scored by Dice similarity. Scores follow Alpha Vantage's
+    matchScore: 1.0 for an exact ticker or name, the matched fraction of a
+    ticker for a prefix, and the name similarity otherwise.
+    """
+
+    def __init__(self, listings: list[Listing]):
+        self.listings = [
+            listing
+            for listing in listings
+            if listing.status in (None, "Active")
+            and (listing.exchange or "").upper() in US_EXCHANGES
+        ]
+        self._root = _TrieNode()
+        self._names = [normalize(listing.name or "") for listing in self.listings]
+        self._name_grams = [len(trigrams(name)) for name in self._names]
+        self._postings: dict[str, list[int]] = {}
+        self._memo: OrderedDict[tuple[str, int], list[tuple[float, Listing]]] = OrderedDict()
+
+        by_length = sorted(
+            range(len(self.listings)),
+            key=lambda position: (len(self.listings[position].symbol), self.listings[position].symbol),
+        )
+        for position in by_length:
+            node = self._root
+            for char in self.listings[position].symbol.upper():
+                node = node.children.setdefault(char, _TrieNode())
+                if len(node.positions) < PREFIX_CANDIDATES:
+                    node.positions.append(position)
+        for position, name in enumerate(self._names):
+            if name:
+                for gram in trigrams(name):
+                    self._postings.setdefault(gram, []).append(position)
+
+    def _prefix_matches(self, prefix: str) -> list[int]:
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.positions
+
+    def search(self, keywords: str, limit: int = DEFAULT_LIMIT) -> list[tuple[float, Listing]]:
+        """
+        Rank listings matching the keywords.
+
+        :argument: keywords (str): A ticker or company name fragment.
+        :argument: limit (int): The maximum number of matches (default: 10).
+
+        :returns: (score, listing) pairs, best first.
+        """
+        key = (keywords.strip().lower(), limit)
+        if key in self._memo:
+            self._memo.move_to_end(key)
+            return self._memo[key]
+        results = self._search(keywords, limit)
+        self._memo[key] = results
+        if len(self._memo) > MEMO_SIZE:
+            self._memo.popitem(last=False)
+        return results
+
+    def _search(self, keywords: str, limit: int) -> list[tuple[float, Listing]]:
+        scores: dict[int, float] = {}
+        ticker = keywords.strip().upper()
+        for position in self._prefix_matches(ticker) if ticker else []:
+            scores[position] = len(ticker) / len(self.listings[position].symbol)
+
+        query = normalize(keywords)
+        if query:
+            grams = trigrams(query)
+            shared = Counter()
+            for gram in grams:
+                shared.update(self._postings.get(gram, ()))
+            for position, count in shared.most_common(NAME_CANDIDATES):
+                name = self._names[position]
+                if name == query:
+                    score = 1.0
+                else:
+                    score = 2 * count / (len(grams) + self._name_grams[position])
+                    if name.startswith(query):
+                        # A name prefix is a strong hint even when the name is long.
+                        score = max(score, 0.5 + 0.5 * len(query) / len(name))
+                scores[position] = max(scores.get(position, 0.0), score)
+
+        ranked = sorted(
+            scores.items(),
+            key=lambda item: (-item[1], len(self.listings[item[0]].symbol), self.listings[item[0]].symbol),
+        )
+        return [(score, self.listings[position]) for position, score in ranked[:limit]]
+
+    def best_matches(self, keywords: str, limit: int = DEFAULT_LIMIT) -> dict:
+        """
+        Search in the SYMBOL_SEARCH response shape.
+
+        :argument: keywords (str): A ticker or company name fragment.
+        :argument: limit (int): The maximum number of matches (default: 10).
+
+        :returns: A {"bestMatches": [...]} payload.
+        """
+        timezone = _us_market_timezone()
+        return {
+            "bestMatches": [
+                {
+                    "1. symbol": listing.symbol,
+                    "2. name": listing.name,
+                    "3. type": ASSET_TYPES.get(listing.asset_type, listing.asset_type),
+                    "4. region": "United States",
+                    "5. marketOpen": "09:30",
+                    "6. marketClose": "16:00",
+                    "7. timezone": timezone,
+                    "8. currency": "USD",
+                    "9. matchScore": f"{score:.4f}",
+                }
+                for score, listing in self.search(keywords, limit)
+            ]
+        }
+
+
+class LocalSearch:
+    """
+    Answers symbol searches from the symbol universe, keeping one index per
+    universe build, and decides when the remote endpoint is still needed.
+    """
+
+    def __init__(self, min_score: float = DEFAULT_MIN_SCORE, enabled: bool = True):
+        self.min_score = min_score
+        self.enabled = enabled
+        self._universe: SymbolUniverse | None = None
+        self._index: SymbolSearchIndex | None = None
+        self.local = 0
+        self.remote = 0
+
+    @classmethod
+    def from_env(cls) -> "LocalSearch":
+        """
+        Build the local search from the environment.
+
+        ALPHAVANTAGE_LOCAL_SEARCH=false always uses the remote endpoint;
+        ALPHAVANTAGE_SEARCH_MIN_SCORE is the score a local match needs.
+
+        :returns: The configured LocalSearch.
+        """
+        return cls(
+            float(os.getenv("ALPHAVANTAGE_SEARCH_MIN_SCORE", DEFAULT_MIN_SCORE)),
+            os.getenv("ALPHAVANTAGE_LOCAL_SEARCH", "true").lower() not in ("0", "false", "no"),
+        )
+
+    async def index(self, universe: SymbolUniverse) -> SymbolSearchIndex:
+        """The search index of a universe, built in a worker thread on first use."""
+        if self._universe is not universe:
+            self._index = await asyncio.to_thread(SymbolSearchIndex, universe.listings)
+            self._universe = universe
+        return self._index
+
+    def confident(self, payload: dict) -> bool:
+        """Whether a local result is good enough to skip the remote endpoint."""
+        matches = payload["bestMatches"]
+        return bool(matches) and float(matches[0]["9. matchScore"]) >= self.min_score
+
+    def status(self) -> dict:
+        """
+        How many searches were answered locally and remotely.
+        """
+        return {"local": self.local, "remote": self.remote}
@@ -0,0 +1,113 @@
+import json
+import os
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without the extra
+    orjson = None
+
+DEFAULT_BACKEND = "auto"
+
+
+def _default(value: Any) -> Any:
+    """Encode values the JSON libraries don't know: columnar series and numpy values."""
+    if hasattr(value, "to_payload"):
+        return value.to_payload()
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class JSONCodec:
+    """
+    Decodes responses and encodes tool results with the standard library.
+
+    Output is compact unless `pretty` is asked for.
+    """
+
+    name = "stdlib"
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def dumps(self, value: Any, pretty: bool = False) -> str:
+        if pretty:
+            return json.dumps(value, indent=2, default=_default)
+        return json.dumps(value, separators=(",", ":"), default=_default)
+
+
+class OrjsonCodec(JSONCodec):
+    """
+    Decodes and encodes with orjson, several times faster than the standard
+    library on large responses. numpy arrays are encoded natively.
+    """
+
+    name = "orjson"
+
+    def loads(self, data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, value: Any, pretty: bool = False) -> str:
+        option = (
+            orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(value, default=_default, option=option).decode()
+
+
+BACKENDS: dict[str, Callable[[], JSONCodec]] = {"stdlib": JSONCodec}
+if orjson is not None:
+    BACKENDS["orjson"] = OrjsonCodec
+
+
+def make_codec(backend: str = DEFAULT_BACKEND) -> JSONCodec:
+    """
+    Build a codec by backend name.
+
+    :argument: backend (str): "orjson", "stdlib" or "auto" for the fastest installed one (default: "auto").
+
+    :returns: The codec.
+
+    :raises ValueError: If the backend is unknown or not installed.
+    """
+    if backend == "auto":
+        backend = "orjson" if "orjson" in BACKENDS else "stdlib"
+    if backend not in BACKENDS:
+        raise ValueError(
+            f"Unknown or unavailable JSON backend {backend!r}; choose from {sorted(BACKENDS)}"
+        )
+    return BACKENDS[backend]()
+
+
+_codec = make_codec(os.getenv("ALPHAVANTAGE_JSON_BACKEND", DEFAULT_BACKEND))
+PRETTY_OUTPUT = os.getenv("ALPHAVANTAGE_PRETTY_JSON", "").lower() in ("1", "true", "yes")
+
+
+def get_codec() -> JSONCodec:
+    """The codec in use."""
+    return _codec
+
+
+def set_codec(codec: JSONCodec) -> None:
+    """
+    Replace the codec in use, e.g. with a custom JSONCodec subclass.
+
+    :argument: codec (JSONCodec): The codec to use from now on.
+    """
+    global _codec
+    _codec = codec
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON with the codec in use."""
+    return _codec.loads(data)
+
+
+def dumps(value: Any, pretty: bool = False) -> str:
+    """Encode JSON with the codec in use; compact unless `pretty` is true."""
+    return _codec.dumps(value, pretty)
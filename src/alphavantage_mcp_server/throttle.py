@@ -0,0 +1,188 @@
+import asyncio
+import os
+import random
+import time
+from collections.abc import Awaitable, Callable
+
+import httpx
+
+from alphavantage_mcp_server import serialization
+from alphavantage_mcp_server.ratelimit import RateLimiter, RateLimitExceeded
+
+DEFAULT_DEADLINE = 60.0
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 20.0
+
+# Phrases Alpha Vantage uses in "Note"/"Information" payloads when a request
+# was refused because of the API key's request budget.
+THROTTLE_PHRASES = (
+    "call frequency",
+    "rate limit",
+    "requests per",
+    "api call volume",
+    "spreading out your free api requests",
+)
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class AlphaVantageError(Exception):
+    """Raised when Alpha Vantage answers with an error payload instead of data."""
+
+
+class ThrottledError(AlphaVantageError):
+    """Raised when Alpha Vantage keeps refusing a request because of its rate limits."""
+
+    def __init__(self, message: str, daily: bool = False):
+        super().__init__(message)
+        self.daily = daily
+
+
+# What a request can fail with upstream: an error payload, a spent request
+# budget, a transport or HTTP status error, or an undecodable body.
+UPSTREAM_ERRORS = (AlphaVantageError, RateLimitExceeded, httpx.HTTPError, ValueError)
+
+
+def check_payload(payload: dict | str) -> None:
+    """
+    Raise if a decoded response is an Alpha Vantage error or throttle message.
+
+    Alpha Vantage answers refused requests with HTTP 200 and a single-key JSON
+    object ("Note", "Information" or "Error Message"), even when CSV was asked for.
+
+    :argument: payload (dict | str): The decoded response.
+
+    :raises ThrottledError: If the request was refused because of rate limits.
+    :raises AlphaVantageError: If the response is any other error message.
+    """
+    if isinstance(payload, str):
+        if not payload.lstrip().startswith("{"):
+            return
+        try:
+            payload = serialization.loads(payload)
+        except ValueError:
+            return
+
+    if not isinstance(payload, dict) or len(payload) != 1:
+        return
+
+    key, message = next(iter(payload.items()))
+    if key not in ("Note", "Information", "Error Message"):
+        return
+
+    text = str(message).lower()
+    if key == "Note" or any(phrase in text for phrase in THROTTLE_PHRASES):
+        # "5 calls per minute and 500 calls per day" is a per-minute throttle;
+        # only a message about the daily budget alone means it is spent.
+        daily = "per day" in text and "per minute" not in text
+        raise ThrottledError(str(message), daily=daily)
+    raise AlphaVantageError(str(message))
+
+
+class RetryPolicy:
+    """
+    Retries throttled and transiently failing requests with jittered
+    exponential backoff, giving up once `deadline` seconds have passed.
+
+    Every throttle is reported to the rate limiter, which slows down for all
+    callers, and every success lets it recover. A throttle caused by a spent
+    daily budget is not retried.
+    """
+
+    def __init__(
+        self,
+        limiter: RateLimiter | None = None,
+        deadline: float = DEFAULT_DEADLINE,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+        rng: random.Random | None = None,
+    ):
+        self.limiter = limiter
+        self.deadline = deadline
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._clock = clock
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+        self.retries = 0
+        self.throttled = 0
+        self.errors = 0
+        self.gave_up = 0
+
+    @classmethod
+    def from_env(cls, limiter: RateLimiter | None = None) -> "RetryPolicy":
+        """
+        Build a retry policy from the environment.
+
+        ALPHAVANTAGE_RETRY_DEADLINE, ALPHAVANTAGE_RETRY_BASE_DELAY and
+        ALPHAVANTAGE_RETRY_MAX_DELAY are in seconds; a deadline of 0 disables retries.
+
+        :argument: limiter (RateLimiter): The limiter to report throttles to (default: None).
+
+        :returns: The configured RetryPolicy.
+        """
+        return cls(
+            limiter,
+            deadline=float(os.getenv("ALPHAVANTAGE_RETRY_DEADLINE", DEFAULT_DEADLINE)),
+            base_delay=float(os.getenv("ALPHAVANTAGE_RETRY_BASE_DELAY", DEFAULT_BASE_DELAY)),
+            max_delay=float(os.getenv("ALPHAVANTAGE_RETRY_MAX_DELAY", DEFAULT_MAX_DELAY)),
+        )
+
+    def backoff(self, attempt: int) -> float:
+        """
+        The delay before retry number `attempt` (0-based), with full jitter.
+        """
+        return self._rng.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    async def middleware(self, query, call_next):
+        """
+        Request middleware validating responses and retrying throttled requests.
+        """
+        give_up_at = self._clock() + self.deadline
+        attempt = 0
+        while True:
+            try:
+                result = await call_next(query)
+                check_payload(result)
+            except ThrottledError as e:
+                self.throttled += 1
+                if self.limiter is not None:
+                    self.limiter.record_throttle(daily=e.daily)
+                if e.daily:
+                    self.gave_up += 1
+                    raise
+                error = e
+            except AlphaVantageError:
+                self.errors += 1
+                raise
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code not in RETRYABLE_STATUS_CODES:
+                    raise
+                error = e
+            except httpx.TransportError as e:
+                error = e
+            else:
+                if self.limiter is not None:
+                    self.limiter.record_success()
+                return result
+
+            delay = self.backoff(attempt)
+            if self._clock() + delay > give_up_at:
+                self.gave_up += 1
+                raise error
+            self.retries += 1
+            attempt += 1
+            await self._sleep(delay)
+
+    def status(self) -> dict:
+        """
+        Retry counters since startup.
+        """
+        return {
+            "retries": self.retries,
+            "throttled": self.throttled,
+            "errors": self.errors,
+            "gave_up": self.gave_up,
+        }
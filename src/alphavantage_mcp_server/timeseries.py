@@ -0,0 +1,417 @@
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from alphavantage_mcp_server.cache import payload_size
+from alphavantage_mcp_server.persistent_cache import SQLiteCache
+
+# Series kept locally. Full history is fetched once per series; afterwards a
+# `compact` request (the latest 100 bars) is enough to bring it up to date.
+INCREMENTAL_FUNCTIONS = frozenset(
+    {"TIME_SERIES_DAILY", "TIME_SERIES_DAILY_ADJUSTED", "TIME_SERIES_INTRADAY"}
+)
+
+DEFAULT_MAX_SERIES = 64
+DEFAULT_MAX_SERIES_BYTES = 64 * 1024 * 1024
+DEFAULT_MAX_PARTITIONS = 8
+DEFAULT_MAX_PARTITION_BYTES = 64 * 1024 * 1024
+STORE_TTL = 30 * 24 * 60 * 60
+# Completed months never change; keep them until the file is deleted.
+PARTITION_TTL = 100 * 365 * 24 * 60 * 60
+# The extended session ends at 20:00 US/Eastern, after midnight UTC, so a
+# month counts as complete only once a full day of the next one has passed.
+SETTLE_TIME = timedelta(days=1)
+
+
+def series_key(query) -> str:
+    """
+    The key of the series a query reads: the query key without `outputsize`.
+    """
+    params = tuple((name, value) for name, value in query.params if name != "outputsize")
+    return "series:" + replace(query, params=params).key
+
+
+def split_payload(payload: dict) -> tuple[str, dict] | None:
+    """
+    Find the bars of a time series payload.
+
+    :argument: payload (dict): A decoded time series response.
+
+    :returns: The name of the bars object and the bars, or None if there are none.
+    """
+    for name, bars in payload.items():
+        if name.startswith("Time Series") and isinstance(bars, dict):
+            return name, bars
+    return None
+
+
+def _has_corporate_action(bars: dict, after: str) -> bool:
+    """Whether a dividend or split newer than `after` changes adjusted history."""
+    for timestamp, bar in bars.items():
+        if timestamp <= after:
+            continue
+        if float(bar.get("7. dividend amount", 0)) or float(bar.get("8. split coefficient", 1)) != 1:
+            return True
+    return False
+
+
+@dataclass
+class StoredSeries:
+    payload: dict
+    bars_name: str
+    synced_at: float
+
+    @property
+    def bars(self) -> dict:
+        return self.payload[self.bars_name]
+
+    @property
+    def size(self) -> int:
+        """The approximate memory footprint: the newest bar's encoded size times the bar count."""
+        bars = self.bars
+        if not bars:
+            return 0
+        newest = next(iter(bars))
+        return (len(newest) + payload_size(bars[newest])) * len(bars)
+
+
+class TimeSeriesStore:
+    """
+    Keeps the full history of daily and intraday series and updates it
+    incrementally.
+
+    The first `outputsize=full` request for a series is sent as is and its
+    result stored. Later full requests fetch only `compact` and merge the new
+    bars into the stored history, unless the compact window no longer overlaps
+    it or (for adjusted series) a new dividend or split rewrote past prices, in
+    which case full history is fetched again. Compact responses seen for a
+    stored series are merged as well.
+
+    Memory is bounded by both the number of series and their approximate
+    size; the least recently used series are evicted first. With a persistent
+    store, evicted series are read back from it.
+    """
+
+    def __init__(
+        self,
+        max_series: int = DEFAULT_MAX_SERIES,
+        store: SQLiteCache | None = None,
+        clock: Callable[[], float] = time.time,
+        max_bytes: int = DEFAULT_MAX_SERIES_BYTES,
+    ):
+        self.max_series = max_series
+        self.max_bytes = max_bytes
+        self.store = store
+        self._clock = clock
+        self._series: OrderedDict[str, StoredSeries] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self.bytes = 0
+        self.full_fetches = 0
+        self.incremental_updates = 0
+        self.bars_merged = 0
+
+    @classmethod
+    def from_env(cls, store: SQLiteCache | None = None) -> "TimeSeriesStore":
+        """
+        Build a series store from the environment.
+
+        ALPHAVANTAGE_SERIES_MAX_SERIES bounds how many series are kept in memory;
+        0 disables incremental updates. ALPHAVANTAGE_SERIES_MAX_BYTES bounds
+        their approximate size in memory.
+
+        :argument: store (SQLiteCache): A persistent store to keep series in (default: None).
+
+        :returns: The configured TimeSeriesStore.
+        """
+        return cls(
+            int(os.getenv("ALPHAVANTAGE_SERIES_MAX_SERIES", DEFAULT_MAX_SERIES)),
+            store,
+            max_bytes=int(os.getenv("ALPHAVANTAGE_SERIES_MAX_BYTES", DEFAULT_MAX_SERIES_BYTES)),
+        )
+
+    async def _load(self, key: str) -> StoredSeries | None:
+        series = self._series.get(key)
+        if series is None and self.store is not None:
+            stored = await self.store.get(key)
+            if stored is not None and split_payload(stored.value) is not None:
+                bars_name, _ = split_payload(stored.value)
+                series = StoredSeries(stored.value, bars_name, stored.fetched_at)
+                self._remember(key, series)
+        if series is not None and key in self._series:
+            self._series.move_to_end(key)
+        return series
+
+    def _remember(self, key: str, series: StoredSeries) -> None:
+        self._forget(key)
+        size = series.size
+        if size > self.max_bytes:
+            return
+        self._series[key] = series
+        self._sizes[key] = size
+        self.bytes += size
+        while self._series and (
+            len(self._series) > self.max_series or self.bytes > self.max_bytes
+        ):
+            self._forget(next(iter(self._series)))
+
+    def _forget(self, key: str) -> None:
+        if key in self._series:
+            del self._series[key]
+            self.bytes -= self._sizes.pop(key)
+
+    async def _save(self, key: str, function: str, series: StoredSeries) -> None:
+        self._remember(key, series)
+        if self.store is not None:
+            await self.store.put(key, function, series.payload, series.synced_at, STORE_TTL)
+
+    def _merge(self, series: StoredSeries, update: dict) -> StoredSeries | None:
+        """Merge a compact response into a stored series, or None if it cannot be."""
+        found = split_payload(update)
+        if found is None or found[0] != series.bars_name:
+            return None
+        _, new_bars = found
+        if not new_bars:
+            return series
+        old_bars = series.bars
+        newest = max(old_bars) if old_bars else ""
+        if old_bars and min(new_bars) > newest:
+            return None
+        if _has_corporate_action(new_bars, newest):
+            return None
+
+        merged = dict(sorted({**old_bars, **new_bars}.items(), reverse=True))
+        self.bars_merged += sum(1 for timestamp in new_bars if timestamp > newest)
+        payload = dict(update)
+        if "Meta Data" in series.payload and "Meta Data" in update:
+            payload["Meta Data"] = {**series.payload["Meta Data"], **update["Meta Data"]}
+            for name in payload["Meta Data"]:
+                if name.endswith("Output Size"):
+                    payload["Meta Data"][name] = series.payload["Meta Data"][name]
+        payload[series.bars_name] = merged
+        return StoredSeries(payload, series.bars_name, self._clock())
+
+    def _applies(self, query) -> bool:
+        if self.max_series <= 0 or query.function not in INCREMENTAL_FUNCTIONS:
+            return False
+        return not query.is_csv and "month" not in dict(query.params)
+
+    async def middleware(self, query, call_next):
+        """
+        Request middleware serving full history from the local store.
+        """
+        if not self._applies(query):
+            return await call_next(query)
+
+        key = series_key(query)
+        full = dict(query.params).get("outputsize") == "full"
+        series = await self._load(key)
+
+        if not full:
+            result = await call_next(query)
+            if series is not None:
+                merged = self._merge(series, result)
+                if merged is not None:
+                    await self._save(key, query.function, merged)
+            return result
+
+        if series is not None:
+            params = {**dict(query.params), "outputsize": "compact"}
+            compact = replace(query, params=tuple(sorted(params.items())))
+            merged = self._merge(series, await call_next(compact))
+            if merged is not None:
+                self.incremental_updates += 1
+                await self._save(key, query.function, merged)
+                return merged.payload
+
+        result = await call_next(query)
+        found = split_payload(result)
+        if found is not None:
+            self.full_fetches += 1
+            await self._save(key, query.function, StoredSeries(result, found[0], self._clock()))
+        return result
+
+    def status(self) -> dict:
+        """
+        Series kept and how they were brought up to date.
+        """
+        return {
+            "series": len(self._series),
+            "bytes": self.bytes,
+            "full_fetches": self.full_fetches,
+            "incremental_updates": self.incremental_updates,
+            "bars_merged": self.bars_merged,
+        }
+
+
+def month_range(start: str, end: str) -> list[str]:
+    """
+    The months from `start` to `end` inclusive.
+
+    :argument: start (str): The first month, as YYYY-MM.
+    :argument: end (str): The last month, as YYYY-MM.
+
+    :returns: The months as YYYY-MM strings, oldest first.
+    """
+    year, month = map(int, start.split("-"))
+    end_year, end_month = map(int, end.split("-"))
+    months = []
+    while (year, month) <= (end_year, end_month):
+        months.append(f"{year:04d}-{month:02d}")
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def _has_data(value: Any) -> bool:
+    if isinstance(value, str):
+        return len(value.strip().splitlines()) > 1
+    found = split_payload(value) if isinstance(value, dict) else None
+    return found is not None and bool(found[1])
+
+
+class MonthPartitions:
+    """
+    Keeps intraday month slices (`TIME_SERIES_INTRADAY` with `month`) that can
+    no longer change.
+
+    Every symbol/interval/month query is its own partition. Once a month is
+    over its slice is immutable: it is stored the first time it is fetched and
+    never requested again. Slices of the current month are passed through.
+    Partitions live in the persistent cache file when there is one, with the
+    most recently used ones also kept in memory, bounded by both their number
+    and their approximate size.
+    """
+
+    def __init__(
+        self,
+        max_partitions: int = DEFAULT_MAX_PARTITIONS,
+        store: SQLiteCache | None = None,
+        clock: Callable[[], float] = time.time,
+        max_bytes: int = DEFAULT_MAX_PARTITION_BYTES,
+    ):
+        self.max_partitions = max_partitions
+        self.max_bytes = max_bytes
+        self.store = store
+        self._clock = clock
+        self._partitions: OrderedDict[str, Any] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self.bytes = 0
+        self.hits = 0
+        self.stored = 0
+
+    @classmethod
+    def from_env(cls, store: SQLiteCache | None = None) -> "MonthPartitions":
+        """
+        Build a partition store from the environment.
+
+        ALPHAVANTAGE_PARTITION_MAX_MEMORY bounds how many partitions are kept in
+        memory and ALPHAVANTAGE_PARTITION_MAX_BYTES their approximate size;
+        completed months are still kept in `store`.
+
+        :argument: store (SQLiteCache): A persistent store to keep partitions in (default: None).
+
+        :returns: The configured MonthPartitions.
+        """
+        return cls(
+            int(os.getenv("ALPHAVANTAGE_PARTITION_MAX_MEMORY", DEFAULT_MAX_PARTITIONS)),
+            store,
+            max_bytes=int(
+                os.getenv("ALPHAVANTAGE_PARTITION_MAX_BYTES", DEFAULT_MAX_PARTITION_BYTES)
+            ),
+        )
+
+    @property
+    def capacity(self) -> int | None:
+        """How many partitions can be kept, or None when the persistent store keeps them all."""
+        return None if self.store is not None else max(0, self.max_partitions)
+
+    def current_month(self) -> str:
+        """The latest month that may still change, as YYYY-MM."""
+        now = datetime.fromtimestamp(self._clock(), UTC) - SETTLE_TIME
+        return now.strftime("%Y-%m")
+
+    def is_complete(self, month: str) -> bool:
+        """Whether a month is over, so its slice can no longer change."""
+        return month < self.current_month()
+
+    def covers(self, query) -> bool:
+        """Whether a query reads a completed month slice, kept by this store."""
+        if query.function != "TIME_SERIES_INTRADAY":
+            return False
+        month = dict(query.params).get("month")
+        return month is not None and self.is_complete(month)
+
+    async def get(self, query) -> Any | None:
+        """
+        Read a stored partition.
+
+        :argument: query (Query): A month slice query.
+
+        :returns: The stored response, or None if the month was not fetched yet.
+        """
+        key = "partition:" + query.key
+        if key in self._partitions:
+            self._partitions.move_to_end(key)
+            return self._partitions[key]
+        if self.store is not None:
+            stored = await self.store.get(key)
+            if stored is not None:
+                self._remember(key, stored.value)
+                return stored.value
+        return None
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._forget(key)
+        size = payload_size(value)
+        if size > self.max_bytes:
+            return
+        self._partitions[key] = value
+        self._sizes[key] = size
+        self.bytes += size
+        while self._partitions and (
+            len(self._partitions) > self.max_partitions or self.bytes > self.max_bytes
+        ):
+            self._forget(next(iter(self._partitions)))
+
+    def _forget(self, key: str) -> None:
+        if key in self._partitions:
+            del self._partitions[key]
+            self.bytes -= self._sizes.pop(key)
+
+    async def put(self, query, value: Any) -> None:
+        key = "partition:" + query.key
+        self._remember(key, value)
+        if self.store is not None:
+            await self.store.put(key, query.function, value, self._clock(), PARTITION_TTL)
+        self.stored += 1
+
+    async def middleware(self, query, call_next):
+        """
+        Request middleware serving completed months from the partition store.
+        """
+        if not self.covers(query):
+            return await call_next(query)
+
+        value = await self.get(query)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        value = await call_next(query)
+        if _has_data(value):
+            await self.put(query, value)
+        return value
+
+    def status(self) -> dict:
+        """
+        Partitions kept and how often they were served.
+        """
+        return {
+            "in_memory": len(self._partitions),
+            "bytes": self.bytes,
+            "stored": self.stored,
+            "hits": self.hits,
+        }
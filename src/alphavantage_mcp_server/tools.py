@@ -0,0 +1,310 @@
+import inspect
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Annotated, Any
+
+from mcp import types
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    PrivateAttr,
+    StringConstraints,
+    ValidationError,
+    create_model,
+)
+
+# Marks an argument without a default: when it is left out, the handler's own
+# default applies.
+NO_DEFAULT = object()
+
+JSON_TYPES = {"integer": int, "boolean": bool, "object": dict}
+
+
+def _whole(value: float) -> float | int:
+    # 2 and 2.0 are the same upstream parameter; render both as "2".
+    return int(value) if value.is_integer() else value
+
+
+def _split(value: Any) -> Any:
+    # A comma-separated string is accepted wherever a list of strings is.
+    if isinstance(value, str):
+        return [item.strip() for item in value.split(",") if item.strip()]
+    return value
+
+
+@dataclass(frozen=True)
+class Arg:
+    """
+    One tool argument: its JSON Schema type, whether it is required, the
+    value used when it is left out and, for case-insensitive strings such as
+    tickers and intervals, the case values are normalized to ("upper" or
+    "lower").
+    """
+
+    name: str
+    type: str = "string"
+    required: bool = False
+    default: Any = NO_DEFAULT
+    items: str | None = None
+    case: str | None = None
+
+    def annotation(self, kind: str | None = None) -> Any:
+        """The Python type values are validated and normalized against."""
+        kind = kind or self.type
+        if kind == "string":
+            return Annotated[
+                str,
+                StringConstraints(
+                    strip_whitespace=True,
+                    to_upper=self.case == "upper",
+                    to_lower=self.case == "lower",
+                ),
+            ]
+        if kind == "number":
+            return Annotated[float, AfterValidator(_whole)]
+        if kind == "array":
+            if self.items is None:
+                return list
+            item = self.annotation(self.items)
+            if self.items == "string":
+                return Annotated[list[item], BeforeValidator(_split)]
+            return list[item]
+        return JSON_TYPES[kind]
+
+    def schema(self) -> dict:
+        """The argument's JSON Schema property."""
+        schema = {"type": self.type}
+        if self.items is not None:
+            schema["items"] = {"type": self.items}
+        if self.default is not NO_DEFAULT and self.default is not None:
+            schema["default"] = self.default
+        return schema
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """
+    A tool: the handler it calls, its description and its arguments.
+
+    The handler is called with the arguments as keyword arguments, so
+    argument names match the handler's parameter names.
+    """
+
+    name: str
+    handler: Callable[..., Any]
+    description: str
+    args: tuple[Arg, ...] = ()
+    required: tuple[str, ...] = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, "required", tuple(arg.name for arg in self.args if arg.required)
+        )
+
+    @cached_property
+    def model(self) -> type[BaseModel]:
+        """
+        The typed argument model, compiled on the tool's first call.
+
+        It coerces values to their declared types and normalizes them, so
+        equivalent requests, e.g. time_period "14" and 14 or symbol "ibm" and
+        "IBM", bind to identical arguments and hence identical cache keys.
+        """
+        fields = {
+            arg.name: (
+                arg.annotation() | None,
+                None if arg.default is NO_DEFAULT else arg.default,
+            )
+            for arg in self.args
+        }
+        return create_model(
+            f"{self.name}_arguments",
+            __config__=ConfigDict(
+                extra="ignore", coerce_numbers_to_str=True, validate_default=True
+            ),
+            **fields,
+        )
+
+    def input_schema(self) -> dict:
+        """The tool's arguments as a JSON Schema object."""
+        return {
+            "type": "object",
+            "properties": {arg.name: arg.schema() for arg in self.args},
+            "required": list(self.required),
+        }
+
+    def tool(self) -> types.Tool:
+        """The tool as listed to MCP clients."""
+        return types.Tool(
+            name=self.name, description=self.description, inputSchema=self.input_schema()
+        )
+
+    def bind(self, arguments: dict | None) -> dict:
+        """
+        Check the required arguments, validate and normalize the values
+        through the argument model and fill in defaults.
+
+        Arguments the tool does not declare are ignored; arguments left out
+        without a declared default are not passed, so the handler's own
+        default applies.
+
+        :argument: arguments (dict): The arguments sent by the client.
+
+        :returns: The keyword arguments for the handler.
+
+        :raises ValueError: If a required argument is missing or empty, or a value has the wrong type.
+        """
+        arguments = arguments or {}
+        missing = [name for name in self.required if arguments.get(name) in (None, "")]
+        if missing:
+            noun = "argument" if len(missing) == 1 else "arguments"
+            raise ValueError(f"Missing required {noun}: {', '.join(missing)}")
+        try:
+            values = self.model.model_validate(arguments)
+        except ValidationError as e:
+            problems = "; ".join(
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            )
+            raise ValueError(f"Invalid arguments: {problems}") from None
+        return {name: value for name, value in values.__dict__.items() if value is not None}
+
+
+class FrozenResult(types.ServerResult):
+    """
+    A server result built once and sent many times. The session dumps every
+    result before encoding it; the dumped form is computed on the first send
+    and reused.
+    """
+
+    _dumps: dict = PrivateAttr(default_factory=dict)
+
+    def model_dump(self, **kwargs) -> dict:
+        key = tuple(sorted(kwargs.items()))
+        try:
+            dumped = self._dumps.get(key)
+        except TypeError:  # unhashable include/exclude sets
+            return super().model_dump(**kwargs)
+        if dumped is None:
+            dumped = self._dumps[key] = super().model_dump(**kwargs)
+        return dict(dumped)
+
+
+class ListingCache:
+    """
+    Serves a list response, such as tools/list or prompts/list, from one
+    frozen result built on the first request.
+    """
+
+    def __init__(self, build: Callable[[], Any]):
+        self._build = build
+        self._result: FrozenResult | None = None
+        self.builds = 0
+
+    def get(self) -> FrozenResult:
+        """The cached result, built if needed."""
+        if self._result is None:
+            self._result = FrozenResult(self._build())
+            self.builds += 1
+        return self._result
+
+    def invalidate(self) -> None:
+        """Rebuild the result on the next request."""
+        self._result = None
+
+    async def handle(self, request: Any) -> types.ServerResult:
+        """Answer a list request; registered as a low-level server request handler."""
+        return self.get()
+
+    def through(
+        self, handler: Callable[[Any], Awaitable[Any]]
+    ) -> Callable[[Any], Awaitable[types.ServerResult]]:
+        """
+        Wrap the request handler a list decorator registered. It still runs on
+        every request, as the server may record state there (newer mcp versions
+        keep the tool schemas that calls are validated against), but the cached
+        result is what is sent.
+
+        :argument: handler (Callable): The handler registered by the decorator.
+
+        :returns: The request handler to register instead.
+        """
+
+        async def handle(request: Any) -> types.ServerResult:
+            await handler(request)
+            return self.get()
+
+        return handle
+
+
+class ToolRegistry:
+    """
+    The tools served, by name.
+
+    Listing, validation and dispatch are all generated from the registered
+    specs, so a call costs one dict lookup however many tools there are. The
+    tool listing is built once and rebuilt only when a tool is registered.
+    """
+
+    def __init__(self, specs: Iterable[ToolSpec] = ()):
+        self.specs: dict[str, ToolSpec] = {}
+        self.listing = ListingCache(
+            lambda: types.ListToolsResult(tools=[spec.tool() for spec in self.specs.values()])
+        )
+        for spec in specs:
+            self.register(spec)
+
+    def register(self, spec: ToolSpec) -> ToolSpec:
+        """
+        Add a tool.
+
+        :argument: spec (ToolSpec): The tool to add.
+
+        :returns: The spec.
+
+        :raises ValueError: If a tool with the same name is registered.
+        """
+        if spec.name in self.specs:
+            raise ValueError(f"Tool {spec.name!r} is already registered")
+        self.specs[spec.name] = spec
+        self.listing.invalidate()
+        return spec
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.specs
+
+    def __len__(self) -> int:
+        return len(self.specs)
+
+    def get(self, name: str) -> ToolSpec:
+        """
+        Find a tool by name.
+
+        :raises ValueError: If there is no such tool.
+        """
+        spec = self.specs.get(name)
+        if spec is None:
+            raise ValueError(f"Unknown tool: {name}")
+        return spec
+
+    def list_tools(self) -> list[types.Tool]:
+        """The registered tools, in registration order, from the cached listing."""
+        return list(self.listing.get().root.tools)
+
+    async def call(self, name: str, arguments: dict | None) -> Any:
+        """
+        Validate the arguments and run a tool.
+
+        :argument: name (str): The tool name.
+        :argument: arguments (dict): The arguments sent by the client.
+
+        :returns: The handler's result.
+        """
+        spec = self.get(name)
+        result = spec.handler(**spec.bind(arguments))
+        if inspect.isawaitable(result):
+            result = await result
+        return result
@@ -0,0 +1,304 @@
+import asyncio
+import bisect
+import os
+import time
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass
+
+from alphavantage_mcp_server.csvstream import CSVBatch
+from alphavantage_mcp_server.persistent_cache import SQLiteCache
+from alphavantage_mcp_server.throttle import AlphaVantageError
+
+DAY = 24 * 60 * 60
+DEFAULT_MAX_AGE = DAY
+# After a failed refresh, keep serving the old universe this long before trying again.
+RETRY_INTERVAL = 5 * 60
+STORE_KEY = "universe:LISTING_STATUS"
+
+# LISTING_STATUS columns, by Listing field.
+COLUMNS = {
+    "symbol": "symbol",
+    "name": "name",
+    "exchange": "exchange",
+    "asset_type": "assetType",
+    "ipo_date": "ipoDate",
+    "delisting_date": "delistingDate",
+    "status": "status",
+}
+
+Loader = Callable[[str], AsyncIterator[CSVBatch]]
+
+
+class UniverseUnavailable(AlphaVantageError):
+    """Raised while no universe could be loaded and the next attempt is not due yet."""
+
+
+@dataclass(frozen=True)
+class Listing:
+    symbol: str
+    name: str | None
+    exchange: str | None
+    asset_type: str | None
+    ipo_date: str | None
+    delisting_date: str | None
+    status: str | None
+
+    def to_dict(self) -> dict:
+        """The listing with LISTING_STATUS column names."""
+        return {column: getattr(self, field) for field, column in COLUMNS.items()}
+
+
+def _text(value) -> str | None:
+    return None if value is None else str(value)
+
+
+class SymbolUniverse:
+    """
+    Every listed and delisted US symbol, indexed for local lookups.
+
+    Symbols are looked up in O(1). Exchange, asset type and status filters use
+    precomputed symbol sets, and IPO date ranges a sorted index searched by
+    bisection. When a ticker was reused, the active listing wins the symbol
+    lookup.
+    """
+
+    def __init__(self, listings: list[Listing], fetched_at: float):
+        self.listings = listings
+        self.fetched_at = fetched_at
+        self.by_symbol: dict[str, Listing] = {}
+        self.by_exchange: dict[str, set[int]] = {}
+        self.by_asset_type: dict[str, set[int]] = {}
+        self.by_status: dict[str, set[int]] = {}
+        for position, listing in enumerate(listings):
+            symbol = listing.symbol.upper()
+            current = self.by_symbol.get(symbol)
+            if current is None or current.status != "Active":
+                self.by_symbol[symbol] = listing
+            for index, value in (
+                (self.by_exchange, listing.exchange),
+                (self.by_asset_type, listing.asset_type),
+                (self.by_status, listing.status),
+            ):
+                index.setdefault((value or "").upper(), set()).add(position)
+        dated = sorted(
+            (listing.ipo_date, position)
+            for position, listing in enumerate(listings)
+            if listing.ipo_date
+        )
+        self._ipo_dates = [date for date, _ in dated]
+        self._ipo_positions = [position for _, position in dated]
+
+    @staticmethod
+    def _listings(columns: dict[str, list]) -> list[Listing]:
+        """Listings from LISTING_STATUS columns."""
+        count = len(columns.get("symbol", []))
+        values = [columns.get(column, [None] * count) for column in COLUMNS.values()]
+        return [
+            Listing(*(_text(value) for value in row))
+            for row in zip(*values)
+            if row[0] is not None
+        ]
+
+    def to_dict(self) -> dict:
+        """The universe as columns, for storage."""
+        return {
+            "fetched_at": self.fetched_at,
+            "columns": {
+                column: [getattr(listing, field) for listing in self.listings]
+                for field, column in COLUMNS.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, value: dict) -> "SymbolUniverse":
+        """Rebuild a universe stored with `to_dict`."""
+        return cls(cls._listings(value["columns"]), value["fetched_at"])
+
+    def __len__(self) -> int:
+        return len(self.listings)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol.upper() in self.by_symbol
+
+    def lookup(self, symbol: str) -> Listing | None:
+        """
+        Find a symbol's listing.
+
+        :argument: symbol (str): The ticker, in any case.
+
+        :returns: The listing, or None if the symbol is unknown.
+        """
+        return self.by_symbol.get(symbol.upper())
+
+    def filter(
+        self,
+        exchange: str | None = None,
+        asset_type: str | None = None,
+        status: str | None = None,
+        ipo_from: str | None = None,
+        ipo_to: str | None = None,
+    ) -> list[Listing]:
+        """
+        Find listings by exchange, asset type, status and IPO date range.
+
+        :argument: exchange (str): e.g. "NASDAQ" (default: any).
+        :argument: asset_type (str): "Stock" or "ETF" (default: any).
+        :argument: status (str): "Active" or "Delisted" (default: any).
+        :argument: ipo_from (str): The earliest IPO date, as YYYY-MM-DD (default: any).
+        :argument: ipo_to (str): The latest IPO date, as YYYY-MM-DD (default: any).
+
+        :returns: The matching listings, ordered by symbol.
+        """
+        candidates = []
+        for index, value in (
+            (self.by_exchange, exchange),
+            (self.by_asset_type, asset_type),
+            (self.by_status, status),
+        ):
+            if value is not None:
+                candidates.append(index.get(value.upper(), set()))
+        if ipo_from is not None or ipo_to is not None:
+            low = bisect.bisect_left(self._ipo_dates, ipo_from) if ipo_from else 0
+            high = (
+                bisect.bisect_right(self._ipo_dates, ipo_to)
+                if ipo_to
+                else len(self._ipo_dates)
+            )
+            candidates.append(set(self._ipo_positions[low:high]))
+
+        if not candidates:
+            positions = range(len(self.listings))
+        else:
+            candidates.sort(key=len)
+            positions = candidates[0].intersection(*candidates[1:])
+        return sorted(
+            (self.listings[position] for position in positions),
+            key=lambda listing: (listing.symbol, listing.status != "Active"),
+        )
+
+
+class UniverseCache:
+    """
+    Keeps the symbol universe in memory and in the persistent store, and
+    rebuilds it from LISTING_STATUS once it is older than `max_age`.
+
+    A refresh streams the active and the delisted listings. If it fails while
+    an older universe is available, the older one keeps being served; if
+    there is none, requests fail at once until the retry interval has passed.
+    """
+
+    def __init__(
+        self,
+        loader: Loader,
+        store: SQLiteCache | None = None,
+        max_age: float = DEFAULT_MAX_AGE,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.loader = loader
+        self.store = store
+        self.max_age = max_age
+        self._clock = clock
+        self._universe: SymbolUniverse | None = None
+        self._lock: asyncio.Lock | None = None
+        self._lock_loop: asyncio.AbstractEventLoop | None = None
+        self._retry_at = 0.0
+        self._error: Exception | None = None
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    @classmethod
+    def from_env(cls, loader: Loader, store: SQLiteCache | None = None) -> "UniverseCache":
+        """
+        Build a universe cache from the environment.
+
+        ALPHAVANTAGE_UNIVERSE_MAX_AGE is the refresh interval in seconds.
+
+        :argument: loader (Loader): Streams parsed LISTING_STATUS batches for a state.
+        :argument: store (SQLiteCache): A persistent store to keep the universe in (default: None).
+
+        :returns: The configured UniverseCache.
+        """
+        return cls(
+            loader,
+            store,
+            float(os.getenv("ALPHAVANTAGE_UNIVERSE_MAX_AGE", DEFAULT_MAX_AGE)),
+        )
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+
+    def _fresh(self, universe: SymbolUniverse | None) -> bool:
+        return universe is not None and self._clock() - universe.fetched_at < self.max_age
+
+    def _check_backoff(self) -> None:
+        # Without a universe to serve, a failed load is not retried before its time.
+        if self._universe is None and self._error is not None and self._clock() < self._retry_at:
+            raise UniverseUnavailable(
+                f"Symbol universe unavailable, next attempt in "
+                f"{self._retry_at - self._clock():.0f}s: {self._error}"
+            ) from self._error
+
+    async def _fetch(self) -> SymbolUniverse:
+        fetched_at = self._clock()
+        listings = []
+        for state in ("active", "delisted"):
+            async for batch in self.loader(state):
+                listings.extend(SymbolUniverse._listings(batch.columns))
+        return SymbolUniverse(listings, fetched_at)
+
+    async def get(self) -> SymbolUniverse:
+        """
+        The current universe, loading or refreshing it when needed.
+
+        :returns: The universe.
+
+        :raises UniverseUnavailable: If the last load failed and the retry interval has not passed.
+        """
+        if self._fresh(self._universe) or (
+            self._universe is not None and self._clock() < self._retry_at
+        ):
+            return self._universe
+        self._check_backoff()
+        async with self._get_lock():
+            if self._fresh(self._universe):
+                return self._universe
+            self._check_backoff()
+            if self._universe is None and self.store is not None:
+                stored = await self.store.get(STORE_KEY)
+                if stored is not None:
+                    self._universe = SymbolUniverse.from_dict(stored.value)
+                    if self._fresh(self._universe):
+                        return self._universe
+            try:
+                universe = await self._fetch()
+            except Exception as e:
+                self.refresh_errors += 1
+                self._retry_at = self._clock() + RETRY_INTERVAL
+                self._error = e
+                if self._universe is None:
+                    raise
+                return self._universe
+            self.refreshes += 1
+            self._universe = universe
+            self._error = None
+            if self.store is not None:
+                await self.store.put(
+                    STORE_KEY, "LISTING_STATUS", universe.to_dict(), universe.fetched_at, 7 * DAY
+                )
+            return universe
+
+    def status(self) -> dict:
+        """
+        The loaded universe's size and age.
+        """
+        universe = self._universe
+        return {
+            "symbols": len(universe.by_symbol) if universe else 0,
+            "age_seconds": round(self._clock() - universe.fetched_at) if universe else None,
+            "refreshes": self.refreshes,
+            "refresh_errors": self.refresh_errors,
+        }
@@ -0,0 +1,46 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+# The unit tests answer requests from mock transports, so don't pace them the
+# way real Alpha Vantage calls are paced, and don't let one test's responses
+# be served from the cache or the series store to another. Symbol searches go
+# to the mock upstream rather than to a local index, and indicators to the
+# indicator endpoints rather than to the local engine. No test reaches Alpha
+# Vantage with the key, so the demo key stands in when none is configured.
+os.environ.setdefault("ALPHAVANTAGE_API_KEY", "demo")
+os.environ.setdefault("ALPHAVANTAGE_PLAN", "unlimited")
+os.environ.setdefault("ALPHAVANTAGE_CACHE_MAX_BYTES", "0")
+os.environ.setdefault("ALPHAVANTAGE_SERIES_MAX_SERIES", "0")
+os.environ.setdefault("ALPHAVANTAGE_PARTITION_MAX_MEMORY", "0")
+os.environ.setdefault("ALPHAVANTAGE_LOCAL_SEARCH", "false")
+os.environ.setdefault("ALPHAVANTAGE_INDICATOR_SOURCE", "remote")
+
+
+class FakeClock:
+    """A manually advanced clock whose sleep moves time forward."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.now += seconds
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """A fake clock starting at 0."""
+    return FakeClock()
+
+
+@pytest.fixture
+def wall_clock() -> FakeClock:
+    """A fake clock starting at the current time, for code that also reads the SQLite store,
+    which prunes rows by wall-clock time."""
+    return FakeClock(time.time())
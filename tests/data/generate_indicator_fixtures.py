@@ -0,0 +1,267 @@
+"""
+Regenerate the indicator parity fixtures.
+
+The bars are a synthetic random walk with a 2-for-1 split, shaped like a
+TIME_SERIES_DAILY_ADJUSTED response. The expected values are TA-Lib's output
+on the split-adjusted bars, shaped like Alpha Vantage's indicator responses.
+Needs TA-Lib, which the server itself does not use:
+
+    pip install ta-lib
+    python tests/data/generate_indicator_fixtures.py
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import talib
+
+HERE = Path(__file__).parent
+BARS = 300
+SPLIT_AT = 150
+
+# function: (TA-Lib call on the adjusted bars, parameters, output names)
+CASES = {
+    "SMA": (
+        lambda b: [talib.SMA(b["close"], 20)],
+        {"time_period": 20, "series_type": "close"},
+        ["SMA"],
+    ),
+    "EMA": (
+        lambda b: [talib.EMA(b["close"], 10)],
+        {"time_period": 10, "series_type": "close"},
+        ["EMA"],
+    ),
+    "WMA": (
+        lambda b: [talib.WMA(b["open"], 15)],
+        {"time_period": 15, "series_type": "open"},
+        ["WMA"],
+    ),
+    "DEMA": (
+        lambda b: [talib.DEMA(b["close"], 10)],
+        {"time_period": 10, "series_type": "close"},
+        ["DEMA"],
+    ),
+    "TEMA": (
+        lambda b: [talib.TEMA(b["high"], 8)],
+        {"time_period": 8, "series_type": "high"},
+        ["TEMA"],
+    ),
+    "TRIMA": (
+        lambda b: [talib.TRIMA(b["close"], 12)],
+        {"time_period": 12, "series_type": "close"},
+        ["TRIMA"],
+    ),
+    "KAMA": (
+        lambda b: [talib.KAMA(b["close"], 10)],
+        {"time_period": 10, "series_type": "close"},
+        ["KAMA"],
+    ),
+    "T3": (lambda b: [talib.T3(b["low"], 5)], {"time_period": 5, "series_type": "low"}, ["T3"]),
+    "RSI": (
+        lambda b: [talib.RSI(b["close"], 14)],
+        {"time_period": 14, "series_type": "close"},
+        ["RSI"],
+    ),
+    "STOCH": (
+        lambda b: talib.STOCH(b["high"], b["low"], b["close"], 5, 3, 0, 3, 0),
+        {},
+        ["SlowK", "SlowD"],
+    ),
+    "STOCHF": (
+        # Alpha Vantage's matype 1 is TA-Lib's 1 (EMA); 6 and 7 differ, see MATYPES.
+        lambda b: talib.STOCHF(b["high"], b["low"], b["close"], 9, 4, 1),
+        {"fastkperiod": 9, "fastdperiod": 4, "fastdmatype": 1},
+        ["FastK", "FastD"],
+    ),
+    "STOCHRSI": (
+        lambda b: talib.STOCHRSI(b["close"], 14, 5, 3, 0),
+        {"time_period": 14, "series_type": "close"},
+        ["FastK", "FastD"],
+    ),
+    "WILLR": (lambda b: [talib.WILLR(b["high"], b["low"], b["close"], 14)], {}, ["WILLR"]),
+    "CCI": (lambda b: [talib.CCI(b["high"], b["low"], b["close"], 20)], {}, ["CCI"]),
+    "CMO": (
+        lambda b: [talib.CMO(b["close"], 14)],
+        {"time_period": 14, "series_type": "close"},
+        ["CMO"],
+    ),
+    "MOM": (
+        lambda b: [talib.MOM(b["close"], 10)],
+        {"time_period": 10, "series_type": "close"},
+        ["MOM"],
+    ),
+    "ROC": (
+        lambda b: [talib.ROC(b["close"], 10)],
+        {"time_period": 10, "series_type": "close"},
+        ["ROC"],
+    ),
+    "ROCR": (
+        lambda b: [talib.ROCR(b["open"], 10)],
+        {"time_period": 10, "series_type": "open"},
+        ["ROCR"],
+    ),
+    "MFI": (lambda b: [talib.MFI(b["high"], b["low"], b["close"], b["volume"], 14)], {}, ["MFI"]),
+    "ULTOSC": (
+        lambda b: [talib.ULTOSC(b["high"], b["low"], b["close"], 7, 14, 28)],
+        {},
+        ["ULTOSC"],
+    ),
+    "ADX": (lambda b: [talib.ADX(b["high"], b["low"], b["close"], 14)], {}, ["ADX"]),
+    "ADXR": (
+        lambda b: [talib.ADXR(b["high"], b["low"], b["close"], 10)],
+        {"time_period": 10},
+        ["ADXR"],
+    ),
+    "DX": (lambda b: [talib.DX(b["high"], b["low"], b["close"], 14)], {}, ["DX"]),
+    "PLUS_DI": (lambda b: [talib.PLUS_DI(b["high"], b["low"], b["close"], 14)], {}, ["PLUS_DI"]),
+    "MINUS_DI": (lambda b: [talib.MINUS_DI(b["high"], b["low"], b["close"], 14)], {}, ["MINUS_DI"]),
+    "PLUS_DM": (lambda b: [talib.PLUS_DM(b["high"], b["low"], 14)], {}, ["PLUS_DM"]),
+    "MINUS_DM": (lambda b: [talib.MINUS_DM(b["high"], b["low"], 14)], {}, ["MINUS_DM"]),
+    "AROON": (lambda b: talib.AROON(b["high"], b["low"], 14), {}, ["Aroon Down", "Aroon Up"]),
+    "AROONOSC": (lambda b: [talib.AROONOSC(b["high"], b["low"], 14)], {}, ["AROONOSC"]),
+    "SAR": (lambda b: [talib.SAR(b["high"], b["low"], 0.02, 0.2)], {}, ["SAR"]),
+    "BBANDS": (
+        lambda b: talib.BBANDS(b["close"], 20, 2.0, 1.5, 0),
+        {"time_period": 20, "series_type": "close", "nbdevup": 2, "nbdevdn": 1.5},
+        ["Real Upper Band", "Real Middle Band", "Real Lower Band"],
+    ),
+    "TRANGE": (lambda b: [talib.TRANGE(b["high"], b["low"], b["close"])], {}, ["TRANGE"]),
+    "ATR": (lambda b: [talib.ATR(b["high"], b["low"], b["close"], 14)], {}, ["ATR"]),
+    "NATR": (
+        lambda b: [talib.NATR(b["high"], b["low"], b["close"], 10)],
+        {"time_period": 10},
+        ["NATR"],
+    ),
+    "MIDPOINT": (
+        lambda b: [talib.MIDPOINT(b["close"], 14)],
+        {"time_period": 14, "series_type": "close"},
+        ["MIDPOINT"],
+    ),
+    "MIDPRICE": (lambda b: [talib.MIDPRICE(b["high"], b["low"], 14)], {}, ["MIDPRICE"]),
+    "AD": (
+        lambda b: [talib.AD(b["high"], b["low"], b["close"], b["volume"])],
+        {},
+        ["Chaikin A/D"],
+    ),
+    "ADOSC": (
+        lambda b: [talib.ADOSC(b["high"], b["low"], b["close"], b["volume"], 3, 10)],
+        {},
+        ["ADOSC"],
+    ),
+    "OBV": (lambda b: [talib.OBV(b["close"], b["volume"])], {}, ["OBV"]),
+    "BOP": (lambda b: [talib.BOP(b["open"], b["high"], b["low"], b["close"])], {}, ["BOP"]),
+    "HT_TRENDLINE": (
+        lambda b: [talib.HT_TRENDLINE(b["close"])],
+        {"series_type": "close"},
+        ["HT_TRENDLINE"],
+    ),
+    "HT_SINE": (
+        lambda b: talib.HT_SINE(b["close"])[::-1],
+        {"series_type": "close"},
+        ["LEAD SINE", "SINE"],
+    ),
+    "HT_TRENDMODE": (
+        # TA-Lib reports 0 rather than nothing during the look-back.
+        lambda b: [
+            np.where(np.arange(len(b["close"])) < 63, np.nan, talib.HT_TRENDMODE(b["close"]))
+        ],
+        {},
+        ["TRENDMODE"],
+    ),
+    "HT_DCPERIOD": (
+        lambda b: [talib.HT_DCPERIOD(b["close"])],
+        {"series_type": "close"},
+        ["DCPERIOD"],
+    ),
+    "HT_DCPHASE": (
+        lambda b: [talib.HT_DCPHASE(b["open"])],
+        {"series_type": "open"},
+        ["HT_DCPHASE"],
+    ),
+    "HT_PHASOR": (
+        lambda b: talib.HT_PHASOR(b["close"]),
+        {"series_type": "close"},
+        ["PHASE", "QUADRATURE"],
+    ),
+    "MAMA": (
+        lambda b: talib.MAMA(b["close"], 0.5, 0.05)[::-1],
+        {"series_type": "close", "fastlimit": 0.5, "slowlimit": 0.05},
+        ["FAMA", "MAMA"],
+    ),
+}
+
+
+def daily_adjusted() -> dict:
+    rng = np.random.default_rng(21)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.015, BARS)))
+    close[:SPLIT_AT] *= 2  # traded at twice the price before the split
+    spread = np.abs(rng.normal(0, 0.01, (3, BARS))) * close
+    open_ = close + rng.normal(0, 0.5, BARS) * spread[0]
+    high = np.maximum(open_, close) + spread[1]
+    low = np.minimum(open_, close) - spread[2]
+    volume = rng.integers(1_000_000, 5_000_000, BARS)
+    adjusted = np.where(np.arange(BARS) < SPLIT_AT, close / 2, close)
+    dates = np.busday_offset("2023-01-02", np.arange(BARS), roll="forward")
+    series = {}
+    for i in reversed(range(BARS)):
+        series[str(dates[i])] = {
+            "1. open": f"{open_[i]:.4f}",
+            "2. high": f"{high[i]:.4f}",
+            "3. low": f"{low[i]:.4f}",
+            "4. close": f"{close[i]:.4f}",
+            "5. adjusted close": f"{adjusted[i]:.4f}",
+            "6. volume": str(volume[i]),
+            "7. dividend amount": "0.0000",
+            "8. split coefficient": "2.0" if i == SPLIT_AT else "1.0",
+        }
+    return {
+        "Meta Data": {
+            "1. Information": "Daily Time Series with Splits and Dividend Events",
+            "2. Symbol": "TEST",
+        },
+        "Time Series (Daily)": series,
+    }
+
+
+def adjusted_bars(payload: dict) -> tuple[list[str], dict]:
+    rows = sorted(payload["Time Series (Daily)"].items())
+    column = {
+        name: np.array([float(row[field]) for _, row in rows])
+        for name, field in [
+            ("open", "1. open"),
+            ("high", "2. high"),
+            ("low", "3. low"),
+            ("close", "4. close"),
+            ("adjusted", "5. adjusted close"),
+            ("volume", "6. volume"),
+        ]
+    }
+    factor = column["adjusted"] / column["close"]
+    bars = {name: column[name] * factor for name in ("open", "high", "low", "close")}
+    bars["volume"] = column["volume"]
+    return [date for date, _ in rows], bars
+
+
+def main():
+    payload = daily_adjusted()
+    dates, bars = adjusted_bars(payload)
+    expected = {}
+    for function, (compute, params, names) in CASES.items():
+        outputs = compute(bars)
+        valid = np.all([~np.isnan(values) for values in outputs], axis=0)
+        expected[function] = {
+            "params": params,
+            f"Technical Analysis: {function}": {
+                dates[i]: {name: f"{values[i]:.4f}" for name, values in zip(names, outputs)}
+                for i in reversed(np.flatnonzero(valid))
+            },
+        }
+    with open(HERE / "daily_adjusted.json", "w") as f:
+        json.dump(payload, f)
+    with open(HERE / "indicators.json", "w") as f:
+        json.dump(expected, f)
+
+
+if __name__ == "__main__":
+    main()
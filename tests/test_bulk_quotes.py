@@ -0,0 +1,93 @@
+import httpx
+import pytest
+
+from alphavantage_mcp_server import api
+
+
+def mock_bulk(requests: list, fail_containing: str | None = None):
+    """Answer bulk quote requests with one quote per requested symbol."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        symbols = request.url.params["symbols"].split(",")
+        requests.append(symbols)
+        if fail_containing in symbols:
+            return httpx.Response(400)
+        if request.url.params.get("datatype") == "csv":
+            rows = "".join(f"{symbol},1.0\r\n" for symbol in symbols)
+            return httpx.Response(200, text="symbol,close\r\n" + rows)
+        # Alpha Vantage does not promise to answer in request order.
+        data = [{"symbol": symbol, "close": "1.0"} for symbol in reversed(symbols)]
+        return httpx.Response(200, json={"endpoint": "Realtime Bulk Quotes", "data": data})
+
+    return api.client_session(transport=httpx.MockTransport(handler))
+
+
+SYMBOLS = [f"S{i:03d}" for i in range(250)]
+
+
+@pytest.mark.asyncio
+async def test_long_lists_are_chunked_and_merged_in_order():
+    """Test that 250 symbols become three requests merged in input order."""
+    requests = []
+    async with mock_bulk(requests):
+        result = await api.fetch_realtime_bulk_quotes(SYMBOLS)
+
+    assert sorted(len(chunk) for chunk in requests) == [50, 100, 100]
+    assert [quote["symbol"] for quote in result["data"]] == SYMBOLS
+    assert "errors" not in result
+
+
+@pytest.mark.asyncio
+async def test_failed_chunks_are_reported():
+    """Test that a failing chunk is reported while the others are returned."""
+    requests = []
+    async with mock_bulk(requests, fail_containing="S150"):
+        result = await api.fetch_realtime_bulk_quotes(SYMBOLS)
+
+    assert len(result["data"]) == 150
+    assert [error["chunk"] for error in result["errors"]] == [1]
+    assert result["errors"][0]["symbols"] == SYMBOLS[100:200]
+
+
+@pytest.mark.asyncio
+async def test_csv_chunks_share_one_header():
+    """Test that CSV chunks are joined under a single header."""
+    requests = []
+    async with mock_bulk(requests):
+        result = await api.fetch_realtime_bulk_quotes(SYMBOLS, "csv")
+
+    lines = result.splitlines()
+    assert lines[0] == "symbol,close"
+    assert [line.split(",")[0] for line in lines[1:]] == SYMBOLS
+
+
+@pytest.mark.asyncio
+async def test_all_chunks_failing_raises():
+    """Test that the call fails when no chunk succeeds."""
+    async with mock_bulk([], fail_containing="S000"):
+        with pytest.raises(httpx.HTTPStatusError):
+            await api.fetch_realtime_bulk_quotes(SYMBOLS[:10])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("symbols", [[], [","], ",", [" ", ""]])
+async def test_empty_symbol_lists_are_refused(symbols):
+    """Test that a call without any symbol fails before reaching the API."""
+    requests = []
+    async with mock_bulk(requests):
+        with pytest.raises(ValueError, match="symbols must not be empty"):
+            await api.fetch_realtime_bulk_quotes(symbols)
+    assert requests == []
+
+
+@pytest.mark.asyncio
+async def test_repeated_symbols_are_returned_once():
+    """Test that symbols repeated in any case are merged like a single chunk would be."""
+    symbols = SYMBOLS[:150] + ["s000", "S001"]
+    async with mock_bulk([]):
+        chunked = await api.fetch_realtime_bulk_quotes(symbols)
+    async with mock_bulk([]):
+        single = await api.fetch_realtime_bulk_quotes(["IBM", "ibm"])
+
+    assert [quote["symbol"] for quote in chunked["data"]] == SYMBOLS[:150]
+    assert [quote["symbol"] for quote in single["data"]] == ["IBM"]
@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+
+from alphavantage_mcp_server.api import Query
+from alphavantage_mcp_server.cache import (
+    DAY,
+    HOUR,
+    MINUTE,
+    ResponseCache,
+    response_freshness,
+    ttl_for,
+)
+from alphavantage_mcp_server.throttle import AlphaVantageError
+
+
+def test_ttl_policies():
+    """Test that TTLs follow the function, then the interval."""
+    assert ttl_for(Query.build("GLOBAL_QUOTE", {"symbol": "IBM"})) == 15
+    assert ttl_for(Query.build("OVERVIEW", {"symbol": "IBM"})) == DAY
+    assert ttl_for(Query.build("REAL_GDP", {"interval": "annual"})) == 12 * HOUR
+    assert ttl_for(Query.build("RSI", {"symbol": "IBM", "interval": "5min"})) == MINUTE
+    assert ttl_for(Query.build("RSI", {"symbol": "IBM", "interval": "daily"})) == 4 * HOUR
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_until_expiry(clock):
+    """Test that a response is served from cache until its TTL passes."""
+    cache = ResponseCache(clock=clock, stale_grace=0)
+    query = Query.build("GLOBAL_QUOTE", {"symbol": "IBM"})
+    sent = []
+
+    async def call_next(query):
+        sent.append(query)
+        return {"Global Quote": {"05. price": str(len(sent))}}
+
+    first = await cache.middleware(query, call_next)
+    assert await cache.middleware(query, call_next) is first
+    clock.now += 16
+    second = await cache.middleware(query, call_next)
+
+    assert second == {"Global Quote": {"05. price": "2"}}
+    status = cache.status()
+    assert (status["hits"], status["misses"], status["expirations"]) == (1, 2, 1)
+
+
+def test_lru_eviction_respects_byte_cap(clock):
+    """Test that least recently used entries are evicted to stay under the cap."""
+    cache = ResponseCache(max_bytes=30, clock=clock)
+    cache.put("a", "x" * 10, 60)
+    cache.put("b", "y" * 10, 60)
+    cache.get("a")
+    cache.put("c", "z" * 10, 60)
+    cache.put("d", "w" * 10, 60)
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.bytes <= 30
+    assert cache.status()["evictions"] == 1
+
+    cache.put("huge", "h" * 100, 60)
+    assert cache.get("huge") is None
+
+
+@pytest.mark.asyncio
+async def test_errors_are_not_cached(clock):
+    """Test that failed requests are not stored."""
+    cache = ResponseCache(clock=clock)
+    query = Query.build("OVERVIEW", {"symbol": "IBM"})
+
+    async def failing(query):
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        await cache.middleware(query, failing)
+    assert cache.status()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate(clock):
+    """Test that a stale entry is served at once and refreshed only once."""
+    cache = ResponseCache(clock=clock, stale_grace=HOUR)
+    query = Query.build("OVERVIEW", {"symbol": "IBM"})
+    sent = []
+    release = asyncio.Event()
+
+    async def call_next(query):
+        sent.append(query)
+        if len(sent) > 1:
+            await release.wait()
+        return {"version": len(sent)}
+
+    assert await cache.middleware(query, call_next) == {"version": 1}
+    assert response_freshness.get().source == "upstream"
+
+    clock.now += DAY + 60
+    stale = [await cache.middleware(query, call_next) for _ in range(3)]
+    assert stale == [{"version": 1}] * 3
+    freshness = response_freshness.get()
+    assert freshness.stale
+    assert freshness.age == pytest.approx(DAY + 60)
+
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.sleep(0.01)
+
+    assert len(sent) == 2
+    assert await cache.middleware(query, call_next) == {"version": 2}
+    assert not response_freshness.get().stale
+    assert cache.status()["refreshes"] == 1
+
+    clock.now += DAY + HOUR + 1
+    assert cache.get(query.key) is None
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_serving_stale_entry(clock):
+    """Test that an upstream error during revalidation is counted and the stale entry kept."""
+    cache = ResponseCache(clock=clock, stale_grace=HOUR)
+    query = Query.build("OVERVIEW", {"symbol": "IBM"})
+    responses = [{"version": 1}, AlphaVantageError("Invalid API call")]
+
+    async def call_next(query):
+        response = responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    await cache.middleware(query, call_next)
+    clock.now += DAY + 60
+    assert await cache.middleware(query, call_next) == {"version": 1}
+    await asyncio.sleep(0.01)
+
+    assert cache.status()["refresh_errors"] == 1
+    assert cache.status()["refreshes"] == 0
@@ -0,0 +1,76 @@
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+from alphavantage_mcp_server import api
+
+
+async def open_client():
+    return api.get_client()
+
+
+@pytest.mark.asyncio
+async def test_fetchers_share_pooled_client():
+    """Test that every fetcher reuses the client opened by client_session."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.params["function"])
+        return httpx.Response(200, json={"Global Quote": {"01. symbol": "IBM"}})
+
+    async with api.client_session(transport=httpx.MockTransport(handler)) as client:
+        await api.fetch_quote("IBM")
+        await api.fetch_time_series_daily("IBM")
+        assert api.get_client() is client
+
+    assert client.is_closed
+    assert seen == ["GLOBAL_QUOTE", "TIME_SERIES_DAILY"]
+
+
+@pytest.mark.asyncio
+async def test_client_uses_configured_pool_limits():
+    """Test that the lazily created client applies the pool settings."""
+    client = api.get_client()
+    try:
+        pool = client._transport._pool
+        assert pool._max_connections == api.MAX_CONNECTIONS
+        assert pool._max_keepalive_connections == api.MAX_KEEPALIVE_CONNECTIONS
+        assert pool._keepalive_expiry == api.KEEPALIVE_EXPIRY
+        assert client.timeout.connect == api.CONNECT_TIMEOUT
+    finally:
+        await api.close_client()
+
+
+@pytest.mark.asyncio
+async def test_client_of_a_finished_loop_is_closed_when_replaced():
+    """Test that a client left behind by a closed event loop is closed, not leaked."""
+    old = await asyncio.to_thread(asyncio.run, open_client())
+    try:
+        assert api.get_client() is not old
+        await asyncio.sleep(0)
+        assert old.is_closed
+    finally:
+        await api.close_client()
+
+
+@pytest.mark.asyncio
+async def test_client_of_a_running_loop_is_closed_on_that_loop():
+    """Test that a client replaced while its loop still runs is closed on that loop."""
+    other = asyncio.new_event_loop()
+    thread = threading.Thread(target=other.run_forever)
+    thread.start()
+    try:
+        old = asyncio.run_coroutine_threadsafe(open_client(), other).result()
+        assert api.get_client() is not old
+        for _ in range(100):
+            if old.is_closed:
+                break
+            await asyncio.sleep(0.01)
+        assert old.is_closed
+    finally:
+        other.call_soon_threadsafe(other.stop)
+        thread.join()
+        other.close()
+        await api.close_client()
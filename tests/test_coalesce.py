@@ -0,0 +1,76 @@
+import asyncio
+
+import httpx
+import pytest
+
+from alphavantage_mcp_server import api
+from alphavantage_mcp_server.coalesce import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_queries_share_one_request():
+    """Test that concurrent identical fetches send a single upstream request."""
+    sent = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request.url.params["symbol"])
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"Global Quote": {"01. symbol": request.url.params["symbol"]}})
+
+    before = api.single_flight.status()
+    async with api.client_session(transport=httpx.MockTransport(handler)):
+        results = await asyncio.gather(
+            *(api.fetch_quote("AAPL") for _ in range(5)), api.fetch_quote("MSFT")
+        )
+
+    assert sorted(sent) == ["AAPL", "MSFT"]
+    assert results[:5] == [{"Global Quote": {"01. symbol": "AAPL"}}] * 5
+    assert results[5] == {"Global Quote": {"01. symbol": "MSFT"}}
+    after = api.single_flight.status()
+    assert after["coalesced"] - before["coalesced"] == 4
+    assert after["upstream_requests"] - before["upstream_requests"] == 2
+    assert after["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_and_not_remembered():
+    """Test that followers receive the leader's error and later calls retry."""
+    flight = SingleFlight()
+    query = api.Query.build("GLOBAL_QUOTE", {"symbol": "IBM"})
+    attempts = []
+
+    async def failing(query):
+        attempts.append(query)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(
+        *(flight.middleware(query, failing) for _ in range(3)), return_exceptions=True
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(attempts) == 1
+
+    async def succeeding(query):
+        return {"ok": True}
+
+    assert await flight.middleware(query, succeeding) == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_followers():
+    """Test that cancelling the first caller leaves the shared request running."""
+    flight = SingleFlight()
+    query = api.Query.build("GLOBAL_QUOTE", {"symbol": "IBM"})
+
+    async def slow(query):
+        await asyncio.sleep(0.05)
+        return {"ok": True}
+
+    leader = asyncio.ensure_future(flight.middleware(query, slow))
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(flight.middleware(query, slow))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == {"ok": True}
+    assert flight.status() == {"upstream_requests": 1, "coalesced": 1, "in_flight": 0}
@@ -0,0 +1,70 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from alphavantage_mcp_server.cache import payload_size
+from alphavantage_mcp_server.columnar import OHLCVSeries, to_columnar
+
+DAILY = {
+    "Meta Data": {"2. Symbol": "IBM"},
+    "Time Series (Daily)": {
+        "2024-01-03": {
+            "1. open": "161.0000",
+            "2. high": "161.7300",
+            "3. low": "160.0800",
+            "4. close": "160.1000",
+            "5. volume": "4086131",
+        },
+        "2024-01-02": {
+            "1. open": "162.8300",
+            "2. high": "163.2900",
+            "3. low": "160.3800",
+            "4. close": "160.4000",
+            "5. volume": "3545451",
+        },
+    },
+}
+
+
+def test_parse_daily_series():
+    """Test that bars become sorted typed columns."""
+    series = OHLCVSeries.from_payload(DAILY)
+
+    assert len(series) == 2
+    assert series.index.dtype == np.dtype("datetime64[s]")
+    assert series.index[0] == np.datetime64("2024-01-02")
+    assert series["close"].tolist() == [160.40, 160.10]
+    assert series["volume"].dtype == np.int64
+    assert series.nbytes == payload_size(series)
+
+
+def test_payload_round_trip():
+    """Test that a parsed series renders back to the payload it came from."""
+    assert OHLCVSeries.from_payload(DAILY).to_payload() == DAILY
+
+
+def test_intraday_timestamps_and_fractional_volume():
+    """Test intraday timestamps and that fractional volumes stay floats."""
+    payload = {
+        "Time Series Crypto (5min)": {
+            "2024-01-02 09:35:00": {"4. close": "1.0000", "5. volume": "0.5000"},
+            "2024-01-02 09:30:00": {"4. close": "2.0000", "5. volume": "1.2500"},
+        }
+    }
+    series = OHLCVSeries.from_payload(payload)
+
+    assert series["volume"].dtype == np.float64
+    assert series.timestamps() == ["2024-01-02 09:30:00", "2024-01-02 09:35:00"]
+    assert series.tail(1)["close"].tolist() == [1.0]
+
+
+def test_to_columnar_reuses_parse_of_same_payload():
+    """Test that a cached payload object is parsed only once."""
+    assert to_columnar(DAILY) is to_columnar(DAILY)
+    assert to_columnar(dict(DAILY)) is not to_columnar(DAILY)
+
+
+def test_payload_without_series_is_rejected():
+    """Test that non time series payloads raise ValueError."""
+    with pytest.raises(ValueError):
+        OHLCVSeries.from_payload({"Global Quote": {}})
@@ -0,0 +1,90 @@
+import httpx
+import pytest
+
+from alphavantage_mcp_server import api
+from alphavantage_mcp_server.csvstream import CSVTable, infer_type, iter_batches
+from alphavantage_mcp_server.throttle import AlphaVantageError
+
+LISTING = (
+    "symbol,name,exchange,assetType,ipoDate,delistingDate,status\r\n"
+    "A,Agilent Technologies Inc,NYSE,Stock,1999-11-18,null,Active\r\n"
+    "AA,Alcoa Corp,NYSE,Stock,2016-10-18,null,Active\r\n"
+    'AAA,"Listed Funds Trust, AAF",NYSE ARCA,ETF,2020-09-09,null,Active\r\n'
+)
+
+
+async def lines_of(text: str):
+    for line in text.splitlines():
+        yield line
+
+
+def test_infer_type():
+    """Test column type inference, keeping zero-padded codes as text."""
+    assert infer_type(["1", "-2", "null"]) is int
+    assert infer_type(["1.5", "2"]) is float
+    assert infer_type(["00123", "1"]) is str
+    assert infer_type(["null", ""]) is str
+
+
+@pytest.mark.asyncio
+async def test_batches_hold_typed_columns():
+    """Test that rows arrive in batches of typed columns."""
+    text = "timestamp,close,volume\n" + "".join(
+        f"2024-01-{day:02d},{day}.5,{day * 100}\n" for day in range(1, 6)
+    )
+    batches = [batch async for batch in iter_batches(lines_of(text), batch_size=2)]
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [batch.start for batch in batches] == [0, 2, 4]
+    assert batches[0].columns == {
+        "timestamp": ["2024-01-01", "2024-01-02"],
+        "close": [1.5, 2.5],
+        "volume": [100, 200],
+    }
+
+
+@pytest.mark.asyncio
+async def test_quoted_nulls_and_short_rows():
+    """Test quoted commas, null values and rows missing trailing fields."""
+    table = await CSVTable.collect(iter_batches(lines_of(LISTING + "AAB,Short Row\n")))
+
+    assert len(table) == 4
+    assert table.rows()[2]["name"] == "Listed Funds Trust, AAF"
+    assert table.columns["delistingDate"] == [None] * 4
+    assert table.rows()[3]["status"] is None
+
+
+def mock_csv(body: str, requests: list | None = None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if requests is not None:
+            requests.append(request)
+        return httpx.Response(200, text=body)
+
+    return api.client_session(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_stream_csv_parses_response_incrementally():
+    """Test that stream_csv sends a CSV query and yields parsed batches."""
+    requests = []
+    async with mock_csv(LISTING, requests):
+        batches = [
+            batch async for batch in api.stream_csv("LISTING_STATUS", batch_size=2)
+        ]
+        daily = [
+            batch async for batch in api.stream_csv("TIME_SERIES_DAILY", {"symbol": "IBM"})
+        ]
+
+    assert [len(batch) for batch in batches] == [2, 1]
+    assert "datatype" not in requests[0].url.params
+    assert requests[1].url.params["datatype"] == "csv"
+    assert daily[0].columns["symbol"] == ["A", "AA", "AAA"]
+
+
+@pytest.mark.asyncio
+async def test_stream_csv_raises_on_error_payload():
+    """Test that a JSON error message instead of CSV raises."""
+    async with mock_csv('{\n    "Error Message": "Invalid API call."\n}'):
+        with pytest.raises(AlphaVantageError, match="Invalid API call"):
+            async for _ in api.stream_csv("TIME_SERIES_DAILY", {"symbol": "NOPE"}):
+                pass
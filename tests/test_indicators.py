@@ -0,0 +1,388 @@
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from alphavantage_mcp_server import api, server
+from alphavantage_mcp_server.columnar import to_columnar
+from alphavantage_mcp_server.indicators import LocalIndicators, cycles, directional
+from alphavantage_mcp_server.indicators.primitives import (
+    rolling_max,
+    rolling_min,
+    rolling_variance,
+    sliding,
+)
+from alphavantage_mcp_server.throttle import AlphaVantageError
+
+DATA = Path(__file__).parent / "data"
+# Daily bars with a split, and TA-Lib's output on them in Alpha Vantage's shape;
+# see data/generate_indicator_fixtures.py.
+DAILY = json.loads((DATA / "daily_adjusted.json").read_text())
+EXPECTED = json.loads((DATA / "indicators.json").read_text())
+
+
+def make_engine(series=DAILY, source="auto"):
+    calls = {"loader": [], "remote": []}
+
+    async def loader(symbol, interval, month):
+        calls["loader"].append((symbol, interval, month))
+        if isinstance(series, Exception):
+            raise series
+        return to_columnar(series)
+
+    async def remote(function, params, datatype):
+        calls["remote"].append(function)
+        return {f"Technical Analysis: {function}": {}}
+
+    return LocalIndicators(loader, remote, source), calls
+
+
+def assert_matches(payload: dict, expected: dict, function: str):
+    key = f"Technical Analysis: {function}"
+    got, want = payload[key], expected[key]
+    assert list(got) == list(want)
+    for timestamp, values in want.items():
+        for name, value in values.items():
+            assert float(got[timestamp][name]) == pytest.approx(float(value), abs=1.1e-4)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("function", sorted(EXPECTED))
+async def test_indicators_match_reference(function):
+    """Test that locally computed indicators match the reference values row for row."""
+    engine, calls = make_engine()
+    expected = EXPECTED[function]
+    params = {"symbol": "TEST", "interval": "daily", **expected["params"]}
+
+    payload = await engine.run(function, params)
+
+    assert_matches(payload, expected, function)
+    assert payload["Meta Data"]["1: Symbol"] == "TEST"
+    assert payload["Meta Data"]["3: Last Refreshed"] == next(
+        iter(payload[f"Technical Analysis: {function}"])
+    )
+    assert calls["remote"] == []
+
+
+@pytest.mark.asyncio
+async def test_indicators_share_one_series():
+    """Test that indicators on one symbol and interval load the series, never the indicator endpoint."""
+    engine, calls = make_engine()
+
+    for function in ("SMA", "EMA", "KAMA"):
+        await engine.run(
+            function, {"symbol": "TEST", "interval": "daily", **EXPECTED[function]["params"]}
+        )
+
+    assert calls["loader"] == [("TEST", "daily", None)] * 3
+    assert calls["remote"] == []
+    assert engine.status()["local"] == 3
+
+
+@pytest.mark.asyncio
+async def test_directional_family_shares_intermediates(monkeypatch):
+    """Test that ADX, +DI and -DI on the same series smooth the movements and true range once."""
+    sums = []
+    wilder_sum = directional.wilder_sum
+    monkeypatch.setattr(
+        directional,
+        "wilder_sum",
+        lambda values, period: sums.append(period) or wilder_sum(values, period),
+    )
+    # A payload of its own, so no earlier test has memoized its bars.
+    engine, calls = make_engine(dict(DAILY))
+
+    results = [
+        await engine.run(function, {"symbol": "TEST", "interval": "daily"})
+        for function in ("ADX", "PLUS_DI", "MINUS_DI")
+    ]
+
+    assert sums == [14, 14, 14]
+    assert calls["remote"] == []
+    assert_matches(results[1], EXPECTED["PLUS_DI"], "PLUS_DI")
+
+
+@pytest.mark.asyncio
+async def test_remote_source_calls_endpoint():
+    """Test that the remote source never computes locally."""
+    engine, calls = make_engine(source="remote")
+
+    await engine.run(
+        "SMA", {"symbol": "TEST", "interval": "daily", "time_period": 5, "series_type": "close"}
+    )
+
+    assert calls == {"loader": [], "remote": ["SMA"]}
+
+
+@pytest.mark.asyncio
+async def test_auto_falls_back_and_remembers_unavailable_series():
+    """Test that a refused series falls back to the endpoint and is not requested again."""
+    engine, calls = make_engine(AlphaVantageError("premium endpoint"))
+    params = {"symbol": "TEST", "interval": "daily", "time_period": 5, "series_type": "close"}
+
+    await engine.run("SMA", params)
+    await engine.run("SMA", params)
+
+    assert len(calls["loader"]) == 1
+    assert calls["remote"] == ["SMA", "SMA"]
+    assert engine.status()["fallbacks"] == 1
+    assert engine.status()["unavailable"] == ["daily"]
+
+
+@pytest.mark.asyncio
+async def test_invalid_symbol_falls_back_without_disabling_interval():
+    """Test that an error about one symbol does not stop local computation for its interval."""
+    engine, calls = make_engine(
+        AlphaVantageError("Invalid API call. Please retry or visit the documentation")
+    )
+    params = {"symbol": "NOPE", "interval": "daily", "time_period": 5, "series_type": "close"}
+
+    await engine.run("SMA", params)
+    await engine.run("SMA", params)
+
+    assert len(calls["loader"]) == 2
+    assert calls["remote"] == ["SMA", "SMA"]
+    assert engine.status()["unavailable"] == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "series",
+    [
+        {"Meta Data": {}, "Time Series (Daily)": {}},
+        {"Meta Data": {}, "Time Series (Daily)": {"2024-01-02": {"5. volume": "10"}}},
+    ],
+)
+async def test_empty_series_falls_back_to_endpoint(series):
+    """Test that a series without bars or prices sends the request to the endpoint."""
+    engine, calls = make_engine(series)
+
+    await engine.run("SMA", {"symbol": "TEST", "interval": "daily", "time_period": 5})
+
+    assert calls["remote"] == ["SMA"]
+    assert engine.status()["fallbacks"] == 1
+
+
+@pytest.mark.asyncio
+async def test_explicit_local_raises_instead_of_falling_back():
+    """Test that source="local" reports why it cannot compute."""
+    engine, calls = make_engine(AlphaVantageError("premium endpoint"))
+    params = {"symbol": "TEST", "interval": "daily", "time_period": 5, "series_type": "close"}
+
+    with pytest.raises(AlphaVantageError):
+        await engine.run("SMA", params, source="local")
+    with pytest.raises(ValueError, match="not computed locally"):
+        await make_engine()[0].run("MACD", params, source="local")
+    assert calls["remote"] == []
+
+
+@pytest.mark.asyncio
+async def test_auto_sends_unsupported_to_endpoint():
+    """Test that indicators without a local implementation are fetched without loading bars."""
+    engine, calls = make_engine()
+
+    await engine.run("MACD", {"symbol": "TEST", "interval": "daily", "series_type": "close"})
+
+    assert calls == {"loader": [], "remote": ["MACD"]}
+
+
+@pytest.mark.asyncio
+async def test_unknown_matype_falls_back_to_endpoint():
+    """Test that a matype without a local implementation is fetched from the endpoint."""
+    engine, calls = make_engine()
+
+    await engine.run("STOCH", {"symbol": "TEST", "interval": "daily", "slowdmatype": 8})
+    await engine.run("STOCH", {"symbol": "TEST", "interval": "daily", "slowdmatype": 9})
+
+    assert calls["remote"] == ["STOCH"]
+    assert engine.status()["local"] == 1
+    assert engine.status()["fallbacks"] == 1
+    assert engine.status()["unavailable"] == []
+
+
+@pytest.mark.asyncio
+async def test_cycle_family_runs_hilbert_pipeline_once_per_start(monkeypatch):
+    """Test that the six HT indicators and MAMA on one series share two pipeline runs."""
+    starts = []
+    hilbert = cycles.hilbert
+    monkeypatch.setattr(
+        cycles,
+        "hilbert",
+        lambda values, start: starts.append(start) or hilbert(values, start),
+    )
+    # A payload of its own, so no earlier test has memoized its bars.
+    engine, calls = make_engine(dict(DAILY))
+    params = {"symbol": "TEST", "interval": "daily", "series_type": "close"}
+
+    results = {
+        function: await engine.run(function, params)
+        for function in (
+            "HT_DCPERIOD",
+            "HT_PHASOR",
+            "MAMA",
+            "HT_TRENDLINE",
+            "HT_SINE",
+            "HT_TRENDMODE",
+            "HT_DCPHASE",
+        )
+    }
+
+    # TA-Lib warms the period and phase indicators up differently, so one run each.
+    assert sorted(starts) == [cycles.PERIOD_START, cycles.PHASE_START]
+    assert calls["remote"] == []
+    assert_matches(results["HT_SINE"], EXPECTED["HT_SINE"], "HT_SINE")
+    assert_matches(results["HT_DCPERIOD"], EXPECTED["HT_DCPERIOD"], "HT_DCPERIOD")
+
+
+@pytest.mark.asyncio
+async def test_csv_and_intraday_timestamps():
+    """Test CSV output and that intraday rows are keyed to the minute."""
+    intraday = {
+        "Time Series (5min)": {
+            f"2024-01-02 09:{minute:02d}:00": {
+                "1. open": "1.0",
+                "2. high": "2.0",
+                "3. low": "0.5",
+                "4. close": f"{minute}.0",
+                "5. volume": "10",
+            }
+            for minute in (30, 35, 40)
+        }
+    }
+    engine, _ = make_engine(intraday)
+    params = {"symbol": "TEST", "interval": "5min", "time_period": 2, "series_type": "close"}
+
+    text = await engine.run("SMA", params, "csv")
+    payload = await engine.run("SMA", params)
+
+    assert text == "time,SMA\r\n2024-01-02 09:40,37.5000\r\n2024-01-02 09:35,32.5000\r\n"
+    assert list(payload["Technical Analysis: SMA"]) == ["2024-01-02 09:40", "2024-01-02 09:35"]
+
+
+@pytest.mark.parametrize("period", [1, 2, 3, 7, 30, 64])
+def test_rolling_windows_match_direct_computation(period):
+    """Test that the O(n) rolling extremes and variance agree with per-window ones."""
+    rng = np.random.default_rng(period)
+    values = 1000 + np.cumsum(rng.normal(size=64))
+    values[10:20] = values[10]
+    windows = sliding(values, period)
+
+    assert rolling_max(values, period)[period - 1 :] == pytest.approx(windows.max(axis=1))
+    assert rolling_min(values, period)[period - 1 :] == pytest.approx(windows.min(axis=1))
+    assert rolling_variance(values, period)[period - 1 :] == pytest.approx(
+        windows.var(axis=1), abs=1e-9
+    )
+    assert np.isnan(rolling_variance(values, period)[: period - 1]).all()
+    # Windows inside the flat stretch have exactly no variance.
+    if period <= 10:
+        assert (rolling_variance(values, period)[10 + period - 1 : 20] == 0).all()
+
+
+@pytest.mark.asyncio
+async def test_cci_is_zero_on_flat_stretch():
+    """Test that CCI is 0 on windows of identical bars, as in TA-Lib, despite averaging noise."""
+    days = np.arange("2024-01-01", "2024-03-01", dtype="datetime64[D]")
+    closes = [100.0 + (day % 5) for day in range(20)] + [100.82] * (len(days) - 20)
+    daily = {
+        "Time Series (Daily)": {
+            str(day): {
+                "1. open": str(close),
+                "2. high": str(close + 0.3),
+                "3. low": str(close - 0.1),
+                "4. close": str(close),
+                "5. volume": "10",
+            }
+            for day, close in zip(days, closes)
+        }
+    }
+    engine, calls = make_engine(daily)
+
+    payload = await engine.run("CCI", {"symbol": "TEST", "interval": "daily"})
+
+    rows = payload["Technical Analysis: CCI"]
+    # Windows from the 40th bar on hold only the flat bars.
+    assert [rows[str(day)]["CCI"] for day in days[39:]] == ["0.0000"] * (len(days) - 39)
+    assert calls["remote"] == []
+
+
+@pytest.mark.asyncio
+async def test_vwap_starts_over_each_session():
+    """Test that intraday VWAP accumulates within a day and resets at the next day's first bar."""
+    bars = [
+        ("2024-01-02 15:55:00", 10.0, 100),
+        ("2024-01-02 16:00:00", 13.0, 300),
+        ("2024-01-03 04:00:00", 20.0, 0),
+        ("2024-01-03 04:05:00", 22.0, 50),
+        ("2024-01-03 04:10:00", 25.0, 150),
+    ]
+    intraday = {
+        "Time Series (5min)": {
+            timestamp: {
+                "1. open": str(price),
+                "2. high": str(price),
+                "3. low": str(price),
+                "4. close": str(price),
+                "5. volume": str(volume),
+            }
+            for timestamp, price, volume in bars
+        }
+    }
+    engine, calls = make_engine(intraday)
+
+    payload = await engine.run("VWAP", {"symbol": "TEST", "interval": "5min"})
+
+    assert payload["Technical Analysis: VWAP"] == {
+        "2024-01-03 04:10": {"VWAP": "24.2500"},
+        "2024-01-03 04:05": {"VWAP": "22.0000"},
+        "2024-01-03 04:00": {"VWAP": "20.0000"},
+        "2024-01-02 16:00": {"VWAP": "12.2500"},
+        "2024-01-02 15:55": {"VWAP": "10.0000"},
+    }
+    assert calls["remote"] == []
+
+
+@pytest.mark.asyncio
+async def test_daily_vwap_goes_to_endpoint():
+    """Test that VWAP, which Alpha Vantage only offers intraday, is not computed on daily bars."""
+    engine, calls = make_engine()
+
+    await engine.run("VWAP", {"symbol": "TEST", "interval": "daily"})
+
+    assert calls["remote"] == ["VWAP"]
+    assert engine.status()["unavailable"] == []
+
+
+@pytest.mark.asyncio
+async def test_tool_computes_from_adjusted_daily_series():
+    """Test that the sma tool with source "local" requests only the daily adjusted series."""
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(dict(request.url.params))
+        return httpx.Response(200, json=DAILY)
+
+    async with api.client_session(transport=httpx.MockTransport(handler)):
+        result = await server.run_tool(
+            "sma",
+            {
+                "symbol": "test",
+                "interval": "daily",
+                "time_period": 20,
+                "series_type": "close",
+                "source": "LOCAL",
+            },
+        )
+
+    assert [(params["function"], params["outputsize"]) for params in sent] == [
+        ("TIME_SERIES_DAILY_ADJUSTED", "full")
+    ]
+    assert_matches(result, EXPECTED["SMA"], "SMA")
+
+
+def test_unknown_source_is_rejected():
+    """Test that a misspelled source fails instead of silently going remote."""
+    with pytest.raises(ValueError, match="Unknown indicator source"):
+        LocalIndicators(None, None, "loacl")
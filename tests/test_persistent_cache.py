@@ -0,0 +1,64 @@
+import sqlite3
+
+import pytest
+
+from alphavantage_mcp_server.api import Query
+from alphavantage_mcp_server.cache import DAY, ResponseCache
+from alphavantage_mcp_server.persistent_cache import SQLiteCache
+
+
+@pytest.mark.asyncio
+async def test_responses_survive_a_restart(tmp_path, clock):
+    """Test that a second process sharing the file is served without upstream calls."""
+    path = str(tmp_path / "cache.sqlite3")
+    query = Query.build("OVERVIEW", {"symbol": "IBM"})
+    sent = []
+
+    async def call_next(query):
+        sent.append(query)
+        return {"Symbol": "IBM", "Name": "International Business Machines"}
+
+    first = ResponseCache(clock=clock, store=SQLiteCache(path))
+    second = ResponseCache(clock=clock, store=SQLiteCache(path))
+
+    result = await first.middleware(query, call_next)
+    assert await second.middleware(query, call_next) == result
+    assert len(sent) == 1
+    assert second.status()["store_hits"] == 1
+
+    clock.now += DAY + 1
+    third = ResponseCache(clock=clock, store=SQLiteCache(path))
+    await third.middleware(query, call_next)
+    assert len(sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_bodies_are_compressed(tmp_path):
+    """Test that CSV and JSON bodies round-trip and are stored compressed."""
+    path = str(tmp_path / "cache.sqlite3")
+    store = SQLiteCache(path)
+    csv = "symbol,name,exchange\n" + "IBM,International Business Machines,NYSE\n" * 500
+
+    await store.put("csv", "LISTING_STATUS", csv, 1.0, 10**12)
+    await store.put("json", "OVERVIEW", {"Symbol": "IBM"}, 2.0, 10**12)
+
+    assert (await store.get("csv")).value == csv
+    stored = await store.get("json")
+    assert stored.value == {"Symbol": "IBM"}
+    assert stored.fetched_at == 2.0
+    assert await store.get("missing") is None
+
+    (size,) = sqlite3.connect(path).execute(
+        "SELECT length(body) FROM responses WHERE key = 'csv'"
+    ).fetchone()
+    assert size < len(csv) / 10
+
+
+def test_expired_rows_are_pruned(tmp_path):
+    """Test that rows past their expiry are deleted."""
+    store = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+    store._put("old", "GLOBAL_QUOTE", {"a": 1}, 0.0, 15.0)
+    store._put("new", "OVERVIEW", {"b": 2}, 0.0, 10**12)
+
+    assert store.prune(now=100.0) == 1
+    assert store.status()["entries"] == 1
@@ -0,0 +1,87 @@
+import httpx
+import pytest
+
+from alphavantage_mcp_server import api
+
+
+def mock_upstream(requests: list):
+    """Route the shared client to a mock transport recording every request."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.params["function"] == "LISTING_STATUS":
+            return httpx.Response(200, text="symbol,name\nIBM,International Business Machines\n")
+        return httpx.Response(200, json={"function": request.url.params["function"]})
+
+    return api.client_session(transport=httpx.MockTransport(handler))
+
+
+def test_query_canonical_params():
+    """Test that None params are dropped and params are canonically ordered."""
+    first = api.Query.build("SMA", {"symbol": "IBM", "month": None, "time_period": 10})
+    second = api.Query.build("SMA", {"time_period": "10", "symbol": "IBM"})
+
+    assert first == second
+    assert first.key == "function=SMA&symbol=IBM&time_period=10"
+    assert "apikey" not in first.key
+    assert first.to_params()["apikey"] == api.API_KEY
+
+
+@pytest.mark.asyncio
+async def test_fetcher_drops_none_params():
+    """Test that fetchers no longer send empty month/contract parameters."""
+    upstream = []
+    async with mock_upstream(upstream):
+        await api.fetch_intraday("IBM", "5min")
+        await api.fetch_realtime_options("IBM")
+
+    intraday, options = (dict(request.url.params) for request in upstream)
+    assert "month" not in intraday
+    assert intraday["adjusted"] == "true"
+    assert intraday["datatype"] == "json"
+    assert "contract" not in options
+
+
+@pytest.mark.asyncio
+async def test_csv_only_function_returns_text():
+    """Test that CSV-only functions are decoded as text."""
+    async with mock_upstream([]):
+        result = await api.fetch_listing_status()
+
+    assert isinstance(result, str)
+    assert result.startswith("symbol,name")
+
+
+@pytest.mark.asyncio
+async def test_middleware_chain_order():
+    """Test that middleware runs outermost first and can short-circuit."""
+    calls = []
+    upstream = []
+
+    async def outer(query, call_next):
+        calls.append(("outer", query.function))
+        return await call_next(query)
+
+    async def inner(query, call_next):
+        calls.append(("inner", query.function))
+        if query.function == "MARKET_STATUS":
+            return {"short": "circuit"}
+        return await call_next(query)
+
+    api.add_middleware(inner)
+    api.add_middleware(outer, index=0)
+    try:
+        async with mock_upstream(upstream):
+            assert await api.fetch_quote("IBM") == {"function": "GLOBAL_QUOTE"}
+            assert await api.fetch_market_status() == {"short": "circuit"}
+    finally:
+        api.remove_middleware(outer)
+        api.remove_middleware(inner)
+
+    assert calls == [
+        ("outer", "GLOBAL_QUOTE"),
+        ("inner", "GLOBAL_QUOTE"),
+        ("outer", "MARKET_STATUS"),
+        ("inner", "MARKET_STATUS"),
+    ]
+    assert len(upstream) == 1
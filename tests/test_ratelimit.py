@@ -0,0 +1,87 @@
+import asyncio
+
+import pytest
+
+from alphavantage_mcp_server.ratelimit import (
+    PLANS,
+    RateLimiter,
+    RateLimitExceeded,
+    TokenBucket,
+)
+
+
+def test_token_bucket_refills_over_period(clock):
+    """Test that a bucket refills at capacity tokens per period."""
+    bucket = TokenBucket(5, 60, clock)
+    for _ in range(5):
+        bucket.take()
+
+    assert bucket.wait_time() == pytest.approx(12)
+    clock.now = 30
+    assert bucket.available() == pytest.approx(2.5)
+    assert bucket.wait_time() == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_queues_callers_in_order(clock):
+    """Test that callers beyond the burst are delayed and served in order."""
+    limiter = RateLimiter(*PLANS["free"], clock=clock, sleep=clock.sleep)
+    served = []
+
+    async def call(i):
+        await limiter.acquire()
+        served.append((i, clock.now))
+
+    await asyncio.gather(*(call(i) for i in range(7)))
+
+    assert [i for i, _ in served] == list(range(7))
+    assert [t for _, t in served[:5]] == [0] * 5
+    assert served[5][1] == pytest.approx(12)
+    assert served[6][1] == pytest.approx(24)
+    assert limiter.status()["acquired"] == 7
+    assert limiter.status()["waiting"] == 0
+
+
+@pytest.mark.asyncio
+async def test_limiter_rejects_when_daily_budget_spent(clock):
+    """Test that a spent daily budget fails fast instead of queueing for hours."""
+    limiter = RateLimiter(None, 2, clock=clock, sleep=clock.sleep, max_wait=60)
+    await limiter.acquire()
+    await limiter.acquire()
+
+    with pytest.raises(RateLimitExceeded):
+        await limiter.acquire()
+    status = limiter.status()
+    assert status["rejected"] == 1
+    assert status["per_day"]["limit"] == 2
+    assert status["per_minute"] is None
+
+
+def test_limiter_from_env(monkeypatch):
+    """Test that the plan tier and overrides are read from the environment."""
+    monkeypatch.setenv("ALPHAVANTAGE_PLAN", "premium-75")
+    monkeypatch.setenv("ALPHAVANTAGE_REQUESTS_PER_DAY", "1000")
+    limiter = RateLimiter.from_env()
+
+    assert limiter.minute.capacity == 75
+    assert limiter.day.capacity == 1000
+
+    monkeypatch.setenv("ALPHAVANTAGE_PLAN", "gold")
+    with pytest.raises(ValueError):
+        RateLimiter.from_env()
+
+
+def test_limiter_is_opt_in(monkeypatch):
+    """Test that requests are not paced unless a plan or limit is configured."""
+    monkeypatch.delenv("ALPHAVANTAGE_PLAN", raising=False)
+    monkeypatch.delenv("ALPHAVANTAGE_REQUESTS_PER_MINUTE", raising=False)
+    monkeypatch.delenv("ALPHAVANTAGE_REQUESTS_PER_DAY", raising=False)
+    limiter = RateLimiter.from_env()
+
+    assert limiter.minute is None and limiter.day is None
+    assert "not paced" in limiter.describe()
+
+    monkeypatch.setenv("ALPHAVANTAGE_PLAN", "free")
+    assert RateLimiter.from_env().describe() == (
+        "Pacing requests for plan free: 5 requests per minute, 25 requests per day"
+    )
@@ -0,0 +1,126 @@
+import time
+
+import httpx
+import pytest
+
+from alphavantage_mcp_server import api
+from alphavantage_mcp_server.search import LocalSearch, SymbolSearchIndex, normalize
+from alphavantage_mcp_server.universe import Listing, SymbolUniverse
+
+
+def listing(symbol: str, name: str, asset_type: str = "Stock", status: str = "Active") -> Listing:
+    return Listing(symbol, name, "NASDAQ", asset_type, "2000-01-01", None, status)
+
+
+LISTINGS = [
+    listing("MSFT", "Microsoft Corporation"),
+    listing("MSTR", "MicroStrategy Inc - Class A"),
+    listing("MU", "Micron Technology Inc"),
+    listing("TSLA", "Tesla Inc"),
+    listing("TSL", "Tesla Old Listing", status="Delisted"),
+    listing("BA", "Boeing Company"),
+    listing("BABA", "Alibaba Group Holding Ltd"),
+    listing("QQQ", "Invesco QQQ Trust Series 1", "ETF"),
+]
+
+
+def test_normalize_drops_punctuation_and_stopwords():
+    """Test that names are reduced to their distinctive words."""
+    assert normalize("MicroStrategy Inc. - Class A") == "microstrategy a"
+
+
+def test_ticker_matches_rank_exact_then_prefix():
+    """Test that an exact ticker scores 1 and prefixes score their matched share."""
+    results = SymbolSearchIndex(LISTINGS).search("ba")
+
+    assert [(round(score, 2), match.symbol) for score, match in results[:2]] == [
+        (1.0, "BA"),
+        (0.5, "BABA"),
+    ]
+
+
+def test_name_matches_are_fuzzy_and_skip_delisted():
+    """Test trigram name matching, including typos, over active listings only."""
+    index = SymbolSearchIndex(LISTINGS)
+
+    assert index.search("microsoft")[0][1].symbol == "MSFT"
+    assert index.search("tesla")[0][1].symbol == "TSLA"
+    assert index.search("micron tech")[0][1].symbol == "MU"
+    assert index.search("mircosoft")[0][1].symbol == "MSFT"
+    assert all(match.status == "Active" for _, match in index.search("TSL"))
+
+
+def test_only_us_listings_are_answered_locally():
+    """Test that listings outside the US exchanges, whose market fields differ, are not indexed."""
+    foreign = Listing("SHOP.TRT", "Shopify Inc", "TSX", "Stock", "2015-05-21", None, "Active")
+    index = SymbolSearchIndex([*LISTINGS, foreign])
+
+    assert index.search("shopify") == []
+    assert all(match.symbol != "SHOP.TRT" for _, match in index.search("SHOP.TRT"))
+
+
+def test_best_matches_uses_symbol_search_shape():
+    """Test that local results look like SYMBOL_SEARCH responses."""
+    match = SymbolSearchIndex(LISTINGS).best_matches("QQQ")["bestMatches"][0]
+
+    assert match["1. symbol"] == "QQQ"
+    assert match["3. type"] == "ETF"
+    assert match["9. matchScore"] == "1.0000"
+    assert match["7. timezone"].startswith("UTC-0")
+
+
+def test_local_search_is_fast():
+    """Test that a search over a universe-sized index takes well under a millisecond."""
+    listings = [listing(f"S{i:05d}", f"Company Number {i} Holdings") for i in range(12000)]
+    index = SymbolSearchIndex(listings + LISTINGS)
+    start = time.perf_counter()
+    for _ in range(100):
+        index.search("microsoft")
+    assert (time.perf_counter() - start) / 100 < 0.005
+
+
+@pytest.mark.asyncio
+async def test_search_endpoint_falls_back_to_remote(monkeypatch):
+    """Test that confident local matches skip the API and weak ones use it."""
+    universe = SymbolUniverse(LISTINGS, time.time())
+
+    class Universe:
+        async def get(self):
+            return universe
+
+    search = LocalSearch(min_score=0.8)
+    monkeypatch.setattr(api, "symbol_universe", Universe())
+    monkeypatch.setattr(api, "local_search", search)
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"bestMatches": []})
+
+    async with api.client_session(transport=httpx.MockTransport(handler)):
+        local = await api.search_endpoint("Microsoft")
+        remote = await api.search_endpoint("tesco")
+
+    assert local["bestMatches"][0]["1. symbol"] == "MSFT"
+    assert remote == {"bestMatches": []}
+    assert [request.url.params["keywords"] for request in requests] == ["tesco"]
+    assert search.status() == {"local": 1, "remote": 1}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [ValueError("bad csv"), KeyError("symbol")])
+async def test_search_endpoint_falls_back_when_universe_is_malformed(monkeypatch, error):
+    """Test that a listing download that cannot be parsed sends the search to the API."""
+
+    class Universe:
+        async def get(self):
+            raise error
+
+    monkeypatch.setattr(api, "symbol_universe", Universe())
+    monkeypatch.setattr(api, "local_search", LocalSearch())
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"bestMatches": []})
+
+    async with api.client_session(transport=httpx.MockTransport(handler)):
+        assert await api.search_endpoint("Microsoft") == {"bestMatches": []}
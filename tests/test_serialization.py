@@ -0,0 +1,56 @@
+import pytest
+
+from alphavantage_mcp_server import serialization
+from alphavantage_mcp_server.serialization import BACKENDS, JSONCodec, make_codec
+
+PAYLOAD = {"Global Quote": {"01. symbol": "IBM", "05. price": "187.1500"}}
+
+
+@pytest.mark.parametrize("backend", sorted(BACKENDS))
+def test_codecs_round_trip_compact_by_default(backend):
+    """Test that every codec round-trips and is compact unless pretty is asked for."""
+    codec = make_codec(backend)
+    compact = codec.dumps(PAYLOAD)
+
+    assert compact == '{"Global Quote":{"01. symbol":"IBM","05. price":"187.1500"}}'
+    assert codec.loads(compact.encode()) == PAYLOAD
+    assert codec.loads(codec.dumps(PAYLOAD, pretty=True)) == PAYLOAD
+    assert "\n  " in codec.dumps(PAYLOAD, pretty=True)
+
+
+def test_auto_prefers_orjson_when_installed():
+    """Test that auto picks the fastest installed backend."""
+    expected = "orjson" if "orjson" in BACKENDS else "stdlib"
+    assert make_codec("auto").name == expected
+    with pytest.raises(ValueError):
+        make_codec("simdjson")
+
+
+def test_set_codec_plugs_in_a_custom_codec():
+    """Test that a custom codec replaces the one in use."""
+
+    class Upper(JSONCodec):
+        def dumps(self, value, pretty=False):
+            return super().dumps(value, pretty).upper()
+
+    previous = serialization.get_codec()
+    serialization.set_codec(Upper())
+    try:
+        assert serialization.dumps({"a": "b"}) == '{"A":"B"}'
+    finally:
+        serialization.set_codec(previous)
+
+
+@pytest.mark.parametrize("backend", sorted(BACKENDS))
+def test_codecs_encode_columnar_series(backend):
+    """Test that columnar series encode as their Alpha Vantage payload."""
+    from alphavantage_mcp_server.columnar import OHLCVSeries
+
+    pytest.importorskip("numpy")
+    payload = {"Time Series (Daily)": {"2024-01-02": {"4. close": "1.0000"}}}
+    series = OHLCVSeries.from_payload(payload)
+
+    assert make_codec(backend).loads(make_codec(backend).dumps(series)) == {
+        "Meta Data": {},
+        **payload,
+    }
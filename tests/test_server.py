@@ -0,0 +1,118 @@
+import asyncio
+import dataclasses
+import json
+
+import mcp.types as types
+import pytest
+from mcp.server.lowlevel.server import request_ctx
+from mcp.shared.context import RequestContext
+
+from alphavantage_mcp_server import server
+from alphavantage_mcp_server.cache import Freshness, response_freshness
+
+
+def patch_tool(monkeypatch, name, handler):
+    """Replace a registered tool's handler for one test."""
+    spec = dataclasses.replace(server.TOOLS.get(name), handler=handler)
+    monkeypatch.setitem(server.TOOLS.specs, name, spec)
+
+
+@pytest.mark.asyncio
+async def test_call_tool_reports_stale_results(monkeypatch):
+    """Test that a result served stale from the cache carries its age."""
+
+    async def stale_quote(symbol, datatype):
+        response_freshness.set(Freshness("memory", 1_700_000_000.0, 42.4, True))
+        return {"Global Quote": {"01. symbol": symbol}}
+
+    patch_tool(monkeypatch, "stock_quote", stale_quote)
+    content = await server.handle_call_tool("stock_quote", {"symbol": "IBM"})
+
+    assert json.loads(content[0].text) == {"Global Quote": {"01. symbol": "IBM"}}
+    assert json.loads(content[1].text) == {
+        "stale": True,
+        "age_seconds": 42,
+        "fetched_at": "2023-11-14T22:13:20+00:00",
+    }
+
+
+@pytest.mark.asyncio
+async def test_call_tool_fresh_results_have_no_note(monkeypatch):
+    """Test that fresh results are returned as a single content item."""
+
+    async def fresh_quote(symbol, datatype):
+        return {"Global Quote": {"01. symbol": symbol}}
+
+    patch_tool(monkeypatch, "stock_quote", fresh_quote)
+    content = await server.handle_call_tool("stock_quote", {"symbol": "IBM"})
+
+    assert len(content) == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_runs_items_concurrently_in_input_order(monkeypatch):
+    """Test that batch items run with bounded concurrency and keep input order."""
+    running = 0
+    peak = 0
+
+    async def quote(symbol, datatype):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01 if symbol == "A" else 0)
+        running -= 1
+        if symbol == "BAD":
+            raise ValueError("Invalid API call")
+        return {"Global Quote": {"01. symbol": symbol}}
+
+    patch_tool(monkeypatch, "stock_quote", quote)
+    symbols = ["A", "B", "BAD", "C", "D"]
+    content = await server.handle_call_tool(
+        "batch",
+        {
+            "tool": "stock_quote",
+            "arguments": [{"symbol": symbol} for symbol in symbols],
+            "concurrency": 2,
+        },
+    )
+    result = json.loads(content[0].text)
+
+    assert peak == 2
+    assert [item["arguments"]["symbol"] for item in result["results"]] == symbols
+    assert result["failed"] == 1
+    assert "Invalid API call" in result["results"][2]["error"]
+    assert result["results"][0]["result"] == {"Global Quote": {"01. symbol": "A"}}
+
+
+@pytest.mark.asyncio
+async def test_batch_streams_progress(monkeypatch):
+    """Test that each completed item is sent as a progress message."""
+    sent = []
+
+    class Session:
+        async def send_progress_notification(self, token, progress, total, message=None):
+            sent.append((token, progress, total, json.loads(message)))
+
+    async def quote(symbol, datatype):
+        return {"Global Quote": {"01. symbol": symbol}}
+
+    patch_tool(monkeypatch, "stock_quote", quote)
+    context = RequestContext(1, types.RequestParams.Meta(progressToken="t"), Session(), None)
+    reset = request_ctx.set(context)
+    try:
+        await server.run_batch("stock_quote", [{"symbol": "A"}, {"symbol": "B"}])
+    finally:
+        request_ctx.reset(reset)
+
+    assert [(token, progress, total) for token, progress, total, _ in sent] == [
+        ("t", 1, 2),
+        ("t", 2, 2),
+    ]
+    assert {item["arguments"]["symbol"] for *_, item in sent} == {"A", "B"}
+
+
+@pytest.mark.asyncio
+async def test_batch_cannot_be_nested():
+    """Test that a batch of batches is rejected."""
+    with pytest.raises(ValueError, match="nested"):
+        await server.handle_call_tool("batch", {"tool": "batch", "arguments": []})
@@ -0,0 +1,124 @@
+import random
+
+import httpx
+import pytest
+
+from alphavantage_mcp_server.ratelimit import RateLimiter
+from alphavantage_mcp_server.throttle import (
+    AlphaVantageError,
+    RetryPolicy,
+    ThrottledError,
+    check_payload,
+)
+
+MINUTE_NOTE = {
+    "Note": "Thank you for using Alpha Vantage! Our standard API call frequency is "
+    "5 calls per minute and 500 calls per day."
+}
+DAILY_INFORMATION = {
+    "Information": "We have detected your API key as demo and our standard API rate "
+    "limit is 25 requests per day."
+}
+PREMIUM_INFORMATION = {
+    "Information": "Thank you for using Alpha Vantage! This is a premium endpoint."
+}
+
+
+def scripted(responses):
+    """A call_next returning (or raising) the given responses in order."""
+    calls = []
+
+    async def call_next(query):
+        calls.append(query)
+        response = responses[min(len(calls), len(responses)) - 1]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    return call_next, calls
+
+
+def test_check_payload_classifies_messages():
+    """Test that throttle and error payloads are told apart from data."""
+    check_payload({"Global Quote": {"01. symbol": "IBM"}})
+    check_payload("timestamp,open\n2024-01-02,187.15\n")
+
+    with pytest.raises(ThrottledError) as minute:
+        check_payload(MINUTE_NOTE)
+    assert not minute.value.daily
+
+    with pytest.raises(ThrottledError) as daily:
+        check_payload(DAILY_INFORMATION)
+    assert daily.value.daily
+
+    with pytest.raises(ThrottledError):
+        check_payload('{"Note": "API call frequency exceeded"}')
+
+    with pytest.raises(AlphaVantageError) as error:
+        check_payload(PREMIUM_INFORMATION)
+    assert not isinstance(error.value, ThrottledError)
+
+
+@pytest.mark.asyncio
+async def test_retry_recovers_from_throttle_and_slows_limiter(clock):
+    """Test that a throttled request is retried and the limiter backs off."""
+    limiter = RateLimiter(75, clock=clock, sleep=clock.sleep)
+    policy = RetryPolicy(limiter, clock=clock, sleep=clock.sleep, rng=random.Random(1))
+    call_next, calls = scripted([MINUTE_NOTE, MINUTE_NOTE, {"Global Quote": {}}])
+
+    assert await policy.middleware("query", call_next) == {"Global Quote": {}}
+    assert len(calls) == 3
+    assert policy.status()["retries"] == 2
+    assert limiter.throttled == 2
+    assert limiter.minute.scale == pytest.approx(0.25 + 0.05)
+
+
+@pytest.mark.asyncio
+async def test_retry_gives_up_at_deadline(clock):
+    """Test that retries stop once the deadline would be exceeded."""
+    policy = RetryPolicy(deadline=10, clock=clock, sleep=clock.sleep, rng=random.Random(1))
+    call_next, calls = scripted([MINUTE_NOTE])
+
+    with pytest.raises(ThrottledError):
+        await policy.middleware("query", call_next)
+    assert clock.now <= 10
+    assert policy.status()["gave_up"] == 1
+    assert len(calls) > 1
+
+
+@pytest.mark.asyncio
+async def test_errors_and_daily_throttles_are_not_retried(clock):
+    """Test that error payloads and a spent daily budget fail immediately."""
+    limiter = RateLimiter(5, 25, clock=clock, sleep=clock.sleep)
+    policy = RetryPolicy(limiter, clock=clock, sleep=clock.sleep)
+
+    call_next, calls = scripted([PREMIUM_INFORMATION])
+    with pytest.raises(AlphaVantageError):
+        await policy.middleware("query", call_next)
+    assert len(calls) == 1
+
+    call_next, calls = scripted([DAILY_INFORMATION])
+    with pytest.raises(ThrottledError):
+        await policy.middleware("query", call_next)
+    assert len(calls) == 1
+    assert limiter.day.available() < 1
+
+
+@pytest.mark.asyncio
+async def test_retry_on_transient_http_errors(clock):
+    """Test that 5xx responses are retried and 4xx responses are not."""
+    policy = RetryPolicy(clock=clock, sleep=clock.sleep, rng=random.Random(1))
+    request = httpx.Request("GET", "https://www.alphavantage.co/query")
+
+    def status_error(code):
+        response = httpx.Response(code, request=request)
+        return httpx.HTTPStatusError(str(code), request=request, response=response)
+
+    call_next, calls = scripted([status_error(503), {"ok": True}])
+    assert await policy.middleware("query", call_next) == {"ok": True}
+    assert len(calls) == 2
+
+    call_next, calls = scripted([status_error(404)])
+    with pytest.raises(httpx.HTTPStatusError):
+        await policy.middleware("query", call_next)
+    assert len(calls) == 1
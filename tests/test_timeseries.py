@@ -0,0 +1,333 @@
+import httpx
+import pytest
+
+from alphavantage_mcp_server import api
+from alphavantage_mcp_server.api import Query
+from alphavantage_mcp_server.cache import ResponseCache, payload_size
+from alphavantage_mcp_server.persistent_cache import SQLiteCache
+from alphavantage_mcp_server.timeseries import (
+    MonthPartitions,
+    StoredSeries,
+    TimeSeriesStore,
+    month_range,
+    series_key,
+)
+
+
+def daily(*days: str, adjusted: bool = False, **actions) -> dict:
+    bars = {}
+    for day in sorted(days, reverse=True):
+        bar = {"4. close": day[-2:]}
+        if adjusted:
+            bar["7. dividend amount"] = actions.get(day, "0.0000")
+            bar["8. split coefficient"] = "1.0"
+        bars[day] = bar
+    return {
+        "Meta Data": {"3. Last Refreshed": max(days), "4. Output Size": "Compact"},
+        "Time Series (Daily)": bars,
+    }
+
+
+class Upstream:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent = []
+
+    async def __call__(self, query):
+        self.sent.append(dict(query.params).get("outputsize"))
+        return self.responses.pop(0)
+
+
+def full_query(function: str = "TIME_SERIES_DAILY") -> Query:
+    return Query.build(function, {"symbol": "IBM", "outputsize": "full"})
+
+
+def test_series_key_ignores_outputsize():
+    """Test that compact and full queries read the same series."""
+    compact = Query.build("TIME_SERIES_DAILY", {"symbol": "IBM", "outputsize": "compact"})
+    assert series_key(compact) == series_key(full_query())
+
+
+@pytest.mark.asyncio
+async def test_full_history_is_fetched_once_then_merged():
+    """Test that later full requests fetch compact and merge the new bars."""
+    history = daily("2024-01-01", "2024-01-02", "2024-01-03")
+    history["Meta Data"]["4. Output Size"] = "Full size"
+    upstream = Upstream(history, daily("2024-01-03", "2024-01-04"))
+    store = TimeSeriesStore()
+
+    assert await store.middleware(full_query(), upstream) is history
+    merged = await store.middleware(full_query(), upstream)
+
+    assert upstream.sent == ["full", "compact"]
+    assert list(merged["Time Series (Daily)"]) == [
+        "2024-01-04",
+        "2024-01-03",
+        "2024-01-02",
+        "2024-01-01",
+    ]
+    assert merged["Meta Data"] == {"3. Last Refreshed": "2024-01-04", "4. Output Size": "Full size"}
+    status = store.status()
+    assert status.pop("bytes") > 0
+    assert status == {
+        "series": 1,
+        "full_fetches": 1,
+        "incremental_updates": 1,
+        "bars_merged": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_series_memory_is_bounded_by_size():
+    """Test that the least recently used series are evicted once their size exceeds the bound."""
+    days = [f"2024-01-{day:02d}" for day in range(1, 29)]
+    small, large = daily(*days[:2]), daily(*days)
+    store = TimeSeriesStore(max_bytes=StoredSeries(small, "Time Series (Daily)", 0).size * 2)
+
+    await store.middleware(full_query(), Upstream(small))
+    await store.middleware(full_query("TIME_SERIES_INTRADAY"), Upstream(small))
+    assert store.status()["series"] == 2
+
+    await store.middleware(full_query("TIME_SERIES_DAILY_ADJUSTED"), Upstream(small))
+    assert store.status()["series"] == 2
+    # A series larger than the whole bound is served but not kept in memory.
+    assert await store.middleware(full_query(), Upstream(large)) is large
+    assert store.status()["series"] == 2
+    assert store.bytes == store.max_bytes
+
+
+@pytest.mark.asyncio
+async def test_gap_refetches_full_history():
+    """Test that a compact window not reaching the stored history forces a full fetch."""
+    upstream = Upstream(
+        daily("2024-01-01", "2024-01-02"),
+        daily("2024-03-01", "2024-03-02"),
+        daily("2024-01-01", "2024-03-02"),
+    )
+    store = TimeSeriesStore()
+
+    await store.middleware(full_query(), upstream)
+    result = await store.middleware(full_query(), upstream)
+
+    assert upstream.sent == ["full", "compact", "full"]
+    assert list(result["Time Series (Daily)"]) == ["2024-03-02", "2024-01-01"]
+    assert store.status()["full_fetches"] == 2
+
+
+@pytest.mark.asyncio
+async def test_corporate_action_refetches_adjusted_history():
+    """Test that a new dividend invalidates stored adjusted prices."""
+    function = "TIME_SERIES_DAILY_ADJUSTED"
+    upstream = Upstream(
+        daily("2024-01-01", "2024-01-02", adjusted=True),
+        daily("2024-01-02", "2024-01-03", adjusted=True, **{"2024-01-03": "1.6600"}),
+        daily("2024-01-01", "2024-01-02", "2024-01-03", adjusted=True),
+    )
+    store = TimeSeriesStore()
+
+    await store.middleware(full_query(function), upstream)
+    await store.middleware(full_query(function), upstream)
+
+    assert upstream.sent == ["full", "compact", "full"]
+
+
+@pytest.mark.asyncio
+async def test_compact_responses_update_stored_series():
+    """Test that compact requests for a stored series are passed through and merged."""
+    compact = Query.build("TIME_SERIES_DAILY", {"symbol": "IBM", "outputsize": "compact"})
+    upstream = Upstream(
+        daily("2024-01-01", "2024-01-02"),
+        daily("2024-01-02", "2024-01-03"),
+        daily("2024-01-03", "2024-01-04"),
+    )
+    store = TimeSeriesStore()
+
+    await store.middleware(full_query(), upstream)
+    assert await store.middleware(compact, upstream) == daily("2024-01-02", "2024-01-03")
+    result = await store.middleware(full_query(), upstream)
+
+    assert upstream.sent == ["full", "compact", "compact"]
+    assert len(result["Time Series (Daily)"]) == 4
+
+
+@pytest.mark.asyncio
+async def test_month_and_csv_queries_pass_through():
+    """Test that month slices and CSV responses bypass the store."""
+    upstream = Upstream("timestamp,close\n", {"Time Series (5min)": {}})
+    store = TimeSeriesStore()
+
+    await store.middleware(
+        Query.build("TIME_SERIES_DAILY", {"symbol": "IBM", "outputsize": "full"}, "csv"),
+        upstream,
+    )
+    await store.middleware(
+        Query.build(
+            "TIME_SERIES_INTRADAY",
+            {"symbol": "IBM", "interval": "5min", "month": "2024-01", "outputsize": "full"},
+        ),
+        upstream,
+    )
+
+    assert store.status()["series"] == 0
+
+
+@pytest.mark.asyncio
+async def test_series_survive_restart_in_persistent_store(tmp_path):
+    """Test that stored history is reloaded from the SQLite store."""
+    path = str(tmp_path / "cache.db")
+    first = TimeSeriesStore(store=SQLiteCache(path))
+    await first.middleware(full_query(), Upstream(daily("2024-01-01", "2024-01-02")))
+
+    upstream = Upstream(daily("2024-01-02", "2024-01-03"))
+    second = TimeSeriesStore(store=SQLiteCache(path))
+    result = await second.middleware(full_query(), upstream)
+
+    assert upstream.sent == ["compact"]
+    assert len(result["Time Series (Daily)"]) == 3
+
+
+def intraday_month(month: str) -> Query:
+    return Query.build(
+        "TIME_SERIES_INTRADAY",
+        {"symbol": "IBM", "interval": "1min", "month": month, "outputsize": "full"},
+    )
+
+
+def month_slice(month: str) -> dict:
+    return {"Time Series (1min)": {f"{month}-02 09:30:00": {"4. close": "1"}}}
+
+
+# 2024-03-10 12:00 UTC
+MARCH_10 = 1_710_072_000.0
+
+
+def test_month_range_and_completion():
+    """Test month enumeration and that only finished months are complete."""
+    partitions = MonthPartitions(clock=lambda: MARCH_10)
+
+    assert month_range("2023-11", "2024-02") == ["2023-11", "2023-12", "2024-01", "2024-02"]
+    assert partitions.is_complete("2024-02")
+    assert not partitions.is_complete("2024-03")
+
+    # On the first of the month, the previous month's late session may still be open.
+    partitions = MonthPartitions(clock=lambda: 1_709_251_200.0)  # 2024-03-01 00:00 UTC
+    assert not partitions.is_complete("2024-02")
+
+
+@pytest.mark.asyncio
+async def test_completed_months_are_never_refetched(tmp_path):
+    """Test that a completed month is fetched once, even after a restart."""
+    path = str(tmp_path / "cache.db")
+    sent = []
+
+    async def upstream(query):
+        sent.append(query)
+        return month_slice(dict(query.params)["month"])
+
+    partitions = MonthPartitions(store=SQLiteCache(path), clock=lambda: MARCH_10)
+    await partitions.middleware(intraday_month("2024-01"), upstream)
+    await partitions.middleware(intraday_month("2024-01"), upstream)
+    await partitions.middleware(intraday_month("2024-03"), upstream)
+    await partitions.middleware(intraday_month("2024-03"), upstream)
+
+    restarted = MonthPartitions(store=SQLiteCache(path), clock=lambda: MARCH_10)
+    result = await restarted.middleware(intraday_month("2024-01"), upstream)
+
+    assert result == month_slice("2024-01")
+    assert [dict(query.params)["month"] for query in sent] == ["2024-01", "2024-03", "2024-03"]
+    assert partitions.status() == {
+        "in_memory": 1,
+        "bytes": partitions.bytes,
+        "stored": 1,
+        "hits": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_partitions_in_memory_are_bounded_by_size():
+    """Test that the least recently used month slices are dropped past the byte budget."""
+    size = payload_size(month_slice("2024-01"))
+    partitions = MonthPartitions(max_bytes=2 * size, clock=lambda: MARCH_10)
+    for month in ["2023-11", "2023-12", "2024-01"]:
+        await partitions.put(intraday_month(month), month_slice(month))
+
+    assert partitions.status()["in_memory"] == 2
+    assert partitions.bytes == 2 * size
+    assert await partitions.get(intraday_month("2023-11")) is None
+    assert await partitions.get(intraday_month("2024-01")) == month_slice("2024-01")
+
+
+@pytest.mark.asyncio
+async def test_completed_months_skip_the_response_cache(monkeypatch):
+    """Test that completed months are held by the partition store only, not cached twice."""
+    partitions = MonthPartitions(clock=lambda: MARCH_10)
+    cache = ResponseCache(1024 * 1024, ttl=api._response_ttl, clock=lambda: MARCH_10)
+    monkeypatch.setattr(api, "month_partitions", partitions)
+    monkeypatch.setattr(api, "MIDDLEWARE", [partitions.middleware, cache.middleware])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=month_slice(request.url.params["month"]))
+
+    async with api.client_session(transport=httpx.MockTransport(handler)):
+        for month in ["2024-02", "2024-03"]:
+            await api.fetch_intraday("IBM", "1min", month=month)
+
+    assert partitions.status()["in_memory"] == 1
+    # Only the current month, which may still change, is in the response cache.
+    assert cache.status()["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_backfill_fetches_missing_months(monkeypatch):
+    """Test that backfill skips stored months and reports failures per month."""
+    partitions = MonthPartitions(clock=lambda: MARCH_10)
+    monkeypatch.setattr(api, "month_partitions", partitions)
+    monkeypatch.setattr(api, "MIDDLEWARE", [partitions.middleware])
+    await partitions.put(
+        api.Query.build(
+            "TIME_SERIES_INTRADAY",
+            api._intraday_params("IBM", "1min", True, True, "full", "2023-12"),
+            "json",
+        ),
+        month_slice("2023-12"),
+    )
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        month = request.url.params["month"]
+        requested.append(month)
+        if month == "2024-01":
+            return httpx.Response(503)
+        return httpx.Response(200, json=month_slice(month))
+
+    async with api.client_session(transport=httpx.MockTransport(handler)):
+        report = await api.backfill_intraday("IBM", "2023-11", interval="1min")
+
+    assert sorted(requested) == ["2023-11", "2024-01", "2024-02"]
+    assert report["fetched"] == ["2023-11", "2024-02"]
+    assert report["stored"] == ["2023-12"]
+    assert list(report["failed"]) == ["2024-01"]
+    assert report["skipped"] == []
+    assert report["kept"] == 3
+
+
+@pytest.mark.asyncio
+async def test_backfill_without_cache_file_fetches_only_what_memory_keeps(monkeypatch):
+    """Test that, with no persistent store, backfill skips the months memory could not keep."""
+    partitions = MonthPartitions(max_partitions=2, clock=lambda: MARCH_10)
+    monkeypatch.setattr(api, "month_partitions", partitions)
+    monkeypatch.setattr(api, "MIDDLEWARE", [partitions.middleware])
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.params["month"])
+        return httpx.Response(200, json=month_slice(request.url.params["month"]))
+
+    async with api.client_session(transport=httpx.MockTransport(handler)):
+        report = await api.backfill_intraday("IBM", "2023-11", interval="1min")
+
+    assert sorted(requested) == ["2024-01", "2024-02"]
+    assert report["fetched"] == ["2024-01", "2024-02"]
+    assert report["skipped"] == ["2023-11", "2023-12"]
+    assert report["kept"] == 2
+    assert "ALPHAVANTAGE_CACHE_PATH" in report["note"]
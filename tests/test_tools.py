@@ -0,0 +1,302 @@
+import inspect
+
+import httpx
+import pytest
+from mcp import types
+
+from alphavantage_mcp_server import api, server
+from alphavantage_mcp_server.tools import Arg, ToolRegistry, ToolSpec
+
+
+async def echo(symbol, datatype="csv", month=None):
+    return {"symbol": symbol, "datatype": datatype, "month": month}
+
+
+def make_registry():
+    return ToolRegistry(
+        [
+            ToolSpec(
+                "echo",
+                echo,
+                "Echo the arguments",
+                (Arg("symbol", required=True), Arg("datatype", default="json"), Arg("month")),
+            ),
+            ToolSpec("status", lambda: {"ok": True}, "A synchronous tool"),
+        ]
+    )
+
+
+def test_schema_is_generated_from_args():
+    """Test that the listed input schema follows the argument spec."""
+    (echo_tool, status_tool) = make_registry().list_tools()
+
+    assert echo_tool.name == "echo"
+    assert echo_tool.inputSchema == {
+        "type": "object",
+        "properties": {
+            "symbol": {"type": "string"},
+            "datatype": {"type": "string", "default": "json"},
+            "month": {"type": "string"},
+        },
+        "required": ["symbol"],
+    }
+    assert status_tool.inputSchema == {"type": "object", "properties": {}, "required": []}
+
+
+@pytest.mark.asyncio
+async def test_call_fills_defaults_and_ignores_unknown_arguments():
+    """Test that declared defaults apply, others fall back to the handler's, and extras are dropped."""
+    result = await make_registry().call("echo", {"symbol": "IBM", "extra": 1})
+
+    assert result == {"symbol": "IBM", "datatype": "json", "month": None}
+
+
+@pytest.mark.asyncio
+async def test_call_runs_synchronous_handlers():
+    """Test that handlers returning plain values are supported."""
+    assert await make_registry().call("status", None) == {"ok": True}
+
+
+@pytest.mark.asyncio
+async def test_call_rejects_missing_and_unknown():
+    """Test that missing required arguments and unknown tools are reported."""
+    registry = make_registry()
+
+    with pytest.raises(ValueError, match="Missing required argument: symbol"):
+        await registry.call("echo", {"symbol": ""})
+    with pytest.raises(ValueError, match="Unknown tool: nope"):
+        await registry.call("nope", {})
+
+
+def test_duplicate_names_are_rejected():
+    """Test that two tools cannot share a name."""
+    registry = make_registry()
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.register(ToolSpec("echo", echo, "Again"))
+
+
+def test_every_server_tool_is_registered_once():
+    """Test that the server registry covers every tool name with handler parameters matching its arguments."""
+    assert set(server.TOOLS.specs) == {tool.value for tool in server.AlphavantageTools}
+    for spec in server.TOOLS.specs.values():
+        parameters = inspect.signature(spec.handler).parameters
+        assert {arg.name for arg in spec.args} <= set(parameters), spec.name
+        assert set(spec.model.model_fields) == {arg.name for arg in spec.args}
+
+
+# A valid value for each required argument of the server's tools.
+REQUIRED_VALUES = {
+    "arguments": [{"symbol": "IBM"}],
+    "calculations": ["MEAN"],
+    "fastlimit": 0.5,
+    "slowlimit": 0.05,
+    "from_currency": "USD",
+    "to_currency": "EUR",
+    "from_symbol": "EUR",
+    "to_symbol": "USD",
+    "interval": "daily",
+    "keywords": "ibm",
+    "market": "USD",
+    "quarter": "2024Q1",
+    "series_range": "full",
+    "series_type": "close",
+    "start_month": "2024-01",
+    "symbol": "IBM",
+    "symbols": ["IBM"],
+    "time_period": 10,
+    "tool": "stock_quote",
+    "window_size": 10,
+}
+
+
+@pytest.mark.asyncio
+async def test_every_server_tool_runs_with_only_required_arguments():
+    """Test that no handler needs an argument its tool lets clients leave out."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["function"] == "LISTING_STATUS":
+            return httpx.Response(
+                200, text="symbol,name,exchange,assetType,ipoDate,delistingDate,status\r\n"
+            )
+        return httpx.Response(200, json={"data": []})
+
+    async with api.client_session(transport=httpx.MockTransport(handler)):
+        for spec in server.TOOLS.specs.values():
+            arguments = {name: REQUIRED_VALUES[name] for name in spec.required}
+            await server.run_tool(spec.name, arguments)
+
+
+@pytest.mark.asyncio
+async def test_intraday_arguments_are_passed_by_name(monkeypatch):
+    """Test that intraday flags reach the fetcher under their own names."""
+    calls = []
+
+    async def intraday(**kwargs):
+        calls.append(kwargs)
+        return {}
+
+    spec = server.TOOLS.get("time_series_intraday")
+    monkeypatch.setitem(
+        server.TOOLS.specs,
+        spec.name,
+        ToolSpec(spec.name, intraday, spec.description, spec.args),
+    )
+    await server.run_tool(
+        "time_series_intraday",
+        {"symbol": "IBM", "interval": "5min", "adjusted": False, "month": "2024-01"},
+    )
+
+    assert calls == [
+        {
+            "symbol": "IBM",
+            "interval": "5min",
+            "datatype": "json",
+            "adjusted": False,
+            "extended_hours": True,
+            "outputsize": "compact",
+            "month": "2024-01",
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_listing_is_built_once_and_rebuilt_on_register():
+    """Test that tools/list reuses one frozen result until a tool is added."""
+    registry = make_registry()
+
+    first = await registry.listing.handle(None)
+    second = await registry.listing.handle(None)
+    assert first is second
+    assert registry.listing.builds == 1
+
+    registry.register(ToolSpec("extra", echo, "Another tool", (Arg("symbol"),)))
+    third = await registry.listing.handle(None)
+    assert third is not first
+    assert [tool.name for tool in third.root.tools] == ["echo", "status", "extra"]
+
+
+def test_frozen_result_reuses_its_dump():
+    """Test that the dumped form is computed once and callers get their own copy."""
+    result = make_registry().listing.get()
+    options = {"by_alias": True, "mode": "json", "exclude_none": True}
+
+    first = result.model_dump(**options)
+    first["extra"] = True
+    second = result.model_dump(**options)
+
+    assert "extra" not in second
+    assert second["tools"] is first["tools"]
+    assert second == types.ServerResult(result.root).model_dump(**options)
+
+
+@pytest.mark.asyncio
+async def test_server_prompts_are_cached():
+    """Test that prompts/list is answered from the cached result."""
+    first = await server.PROMPTS.handle(None)
+
+    assert await server.PROMPTS.handle(None) is first
+    assert {prompt.name for prompt in first.root.prompts} >= {"stock_quote"}
+
+
+@pytest.mark.asyncio
+async def test_listing_runs_the_wrapped_handler_and_sends_the_cached_result():
+    """Test that a decorator's handler still runs while the frozen result is sent."""
+    registry = make_registry()
+    requests = []
+
+    async def handler(request):
+        requests.append(request)
+        return types.ServerResult(types.ListToolsResult(tools=[]))
+
+    list_tools = registry.listing.through(handler)
+    first = await list_tools("first")
+
+    assert await list_tools("second") is first is registry.listing.get()
+    assert requests == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_server_tools_are_listed_from_the_cached_result():
+    """Test that the registered tools/list handler answers with the frozen result."""
+    list_tools = server.server.request_handlers[types.ListToolsRequest]
+    result = await list_tools(types.ListToolsRequest(method="tools/list"))
+
+    assert result is server.TOOLS.listing.get()
+    # mcp>=1.10 records the listed tools to validate calls against.
+    tool_cache = getattr(server.server, "_tool_cache", None)
+    if tool_cache is not None:
+        assert set(tool_cache) == {tool.name for tool in result.root.tools}
+
+
+def test_arguments_are_coerced_and_normalized():
+    """Test that values are coerced to their declared types and case-normalized."""
+    spec = ToolSpec(
+        "typed",
+        echo,
+        "Typed arguments",
+        (
+            Arg("symbol", case="upper"),
+            Arg("period", "integer"),
+            Arg("deviation", "number"),
+            Arg("flag", "boolean"),
+            Arg("symbols", "array", items="string", case="upper"),
+        ),
+    )
+
+    bound = spec.bind(
+        {
+            "symbol": " ibm ",
+            "period": "14",
+            "deviation": 2.0,
+            "flag": "false",
+            "symbols": "ibm, aapl",
+        }
+    )
+
+    assert bound == {
+        "symbol": "IBM",
+        "period": 14,
+        "deviation": 2,
+        "flag": False,
+        "symbols": ["IBM", "AAPL"],
+    }
+    assert spec.bind({"deviation": "0.5"}) == {"deviation": 0.5}
+
+
+def test_invalid_values_are_reported():
+    """Test that values of the wrong type fail validation with the argument's name."""
+    spec = ToolSpec("typed", echo, "Typed arguments", (Arg("period", "integer"),))
+
+    with pytest.raises(ValueError, match="Invalid arguments: period"):
+        spec.bind({"period": "fourteen"})
+
+
+@pytest.mark.asyncio
+async def test_equivalent_requests_send_identical_queries():
+    """Test that differently spelled but equivalent calls reach Alpha Vantage identically."""
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(sorted(request.url.params.multi_items()))
+        return httpx.Response(200, json={"Technical Analysis: SMA": {}})
+
+    async with api.client_session(transport=httpx.MockTransport(handler)):
+        await server.run_tool(
+            "sma",
+            {"symbol": "ibm", "interval": "Daily", "time_period": "20", "series_type": "Close"},
+        )
+        await server.run_tool(
+            "sma",
+            {
+                "symbol": "IBM",
+                "interval": "daily",
+                "time_period": 20.0,
+                "series_type": "close",
+                "datatype": "JSON",
+            },
+        )
+
+    assert len(sent) == 2
+    assert sent[0] == sent[1]
+    assert ("symbol", "IBM") in sent[0] and ("time_period", "20") in sent[0]
@@ -0,0 +1,123 @@
+import httpx
+import pytest
+
+from alphavantage_mcp_server import api
+from alphavantage_mcp_server.csvstream import CSVBatch
+from alphavantage_mcp_server.persistent_cache import SQLiteCache
+from alphavantage_mcp_server.universe import (
+    RETRY_INTERVAL,
+    UniverseCache,
+    UniverseUnavailable,
+)
+
+HEADER = "symbol,name,exchange,assetType,ipoDate,delistingDate,status\r\n"
+ACTIVE = HEADER + (
+    "A,Agilent Technologies Inc,NYSE,Stock,1999-11-18,null,Active\r\n"
+    "AAPL,Apple Inc,NASDAQ,Stock,1980-12-12,null,Active\r\n"
+    "QQQ,Invesco QQQ Trust,NASDAQ,ETF,1999-03-10,null,Active\r\n"
+)
+DELISTED = HEADER + (
+    "AAPL,Old Apple Listing,NYSE,Stock,1970-01-01,1980-01-01,Delisted\r\n"
+    "TWTR,Twitter Inc,NYSE,Stock,2013-11-07,2022-10-27,Delisted\r\n"
+)
+
+
+def loader(calls: list, fail: bool = False):
+    async def load(state: str):
+        calls.append(state)
+        if fail:
+            raise httpx.ConnectError("down")
+        symbols = {"active": ["A", "AAPL"], "delisted": ["TWTR"]}[state]
+        yield CSVBatch(
+            {
+                "symbol": symbols,
+                "exchange": ["NYSE"] * len(symbols),
+                "status": [state.title()] * len(symbols),
+            },
+            0,
+        )
+
+    return load
+
+
+@pytest.mark.asyncio
+async def test_universe_is_refreshed_daily_and_persisted(tmp_path, wall_clock):
+    """Test that the universe is loaded once a day and reloaded from disk."""
+    calls = []
+    path = str(tmp_path / "cache.db")
+    cache = UniverseCache(loader(calls), SQLiteCache(path), clock=wall_clock)
+
+    universe = await cache.get()
+    assert await cache.get() is universe
+    assert calls == ["active", "delisted"]
+    assert "twtr" in universe and len(universe) == 3
+
+    restarted = UniverseCache(loader(calls, fail=True), SQLiteCache(path), clock=wall_clock)
+    assert len(await restarted.get()) == 3
+    assert calls == ["active", "delisted"]
+
+    wall_clock.now += 24 * 60 * 60
+    assert await cache.get() is not universe
+    assert calls == ["active", "delisted", "active", "delisted"]
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_serving_old_universe(clock):
+    """Test that a failed refresh serves the old universe and backs off."""
+    calls = []
+    cache = UniverseCache(loader(calls), clock=clock)
+    universe = await cache.get()
+
+    cache.loader = loader(calls, fail=True)
+    clock.now += 24 * 60 * 60
+    assert await cache.get() is universe
+    assert await cache.get() is universe
+
+    assert calls == ["active", "delisted", "active"]
+    assert cache.status()["refresh_errors"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_first_load_is_not_retried_before_its_time(clock):
+    """Test that without a universe, a failed load fails later calls at once until the retry is due."""
+    calls = []
+    cache = UniverseCache(loader(calls, fail=True), clock=clock)
+
+    with pytest.raises(httpx.ConnectError):
+        await cache.get()
+    for _ in range(2):
+        with pytest.raises(UniverseUnavailable):
+            await cache.get()
+    assert calls == ["active"]
+
+    clock.now += RETRY_INTERVAL
+    cache.loader = loader(calls)
+    assert len(await cache.get()) == 3
+    assert calls == ["active", "active", "delisted"]
+
+
+@pytest.mark.asyncio
+async def test_lookup_listings_from_listing_status(monkeypatch, clock):
+    """Test symbol validation and indexed filters over streamed LISTING_STATUS."""
+    monkeypatch.setattr(api, "symbol_universe", UniverseCache(api._stream_listings, clock=clock))
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200, text=DELISTED if request.url.params["state"] == "delisted" else ACTIVE
+        )
+
+    async with api.client_session(transport=httpx.MockTransport(handler)):
+        found = await api.lookup_listings(["aapl", "TWTR", "NOPE"])
+        nasdaq_etfs = await api.lookup_listings(exchange="nasdaq", asset_type="ETF")
+        nineties = await api.lookup_listings(ipo_from="1990-01-01", ipo_to="1999-12-31")
+        nyse = await api.lookup_listings(exchange="NYSE", limit=1)
+
+    assert len(requests) == 2
+    assert [listing["name"] for listing in found["listings"]] == ["Apple Inc", "Twitter Inc"]
+    assert found["unknown"] == ["NOPE"]
+    assert [listing["symbol"] for listing in nasdaq_etfs["listings"]] == ["QQQ"]
+    assert [listing["symbol"] for listing in nineties["listings"]] == ["A", "QQQ"]
+    assert nyse["count"] == 3 and len(nyse["listings"]) == 1
+    assert found["listings"][1]["delistingDate"] == "2022-10-27"